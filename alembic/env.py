@@ -25,12 +25,13 @@ if config.config_file_name is not None:
 
 from media_manager.auth.db import User, OAuthAccount  # noqa: E402
 from media_manager.indexer.models import IndexerQueryResult  # noqa: E402
-from media_manager.torrent.models import Torrent  # noqa: E402
+from media_manager.torrent.models import Torrent, ImportJob  # noqa: E402
 from media_manager.tv.models import Show, Season, Episode, SeasonFile, SeasonRequest  # noqa: E402
 from media_manager.movies.models import Movie, MovieFile, MovieRequest  # noqa: E402
 from media_manager.notification.models import Notification  # noqa: E402
+from media_manager.scheduler.models import JobRun  # noqa: E402
 from media_manager.database import Base  # noqa: E402
-from media_manager.config import AllEncompassingConfig  # noqa: E402
+from media_manager.config import get_config  # noqa: E402
 
 target_metadata = Base.metadata
 
@@ -41,6 +42,7 @@ target_metadata = Base.metadata
     OAuthAccount,
     IndexerQueryResult,
     Torrent,
+    ImportJob,
     Show,
     Season,
     Episode,
@@ -50,6 +52,7 @@ target_metadata = Base.metadata
     MovieFile,
     MovieRequest,
     Notification,
+    JobRun,
 )
 
 
@@ -59,7 +62,7 @@ target_metadata = Base.metadata
 # ... etc.
 
 
-db_config = AllEncompassingConfig().database
+db_config = get_config().database
 db_url = (
     "postgresql+psycopg"
     + "://"
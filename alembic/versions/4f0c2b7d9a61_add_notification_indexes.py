@@ -0,0 +1,35 @@
+"""add notification indexes
+
+Revision ID: 4f0c2b7d9a61
+Revises: 9d4b61c2e7f0
+Create Date: 2025-11-12 18:22:47.514208
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f0c2b7d9a61"
+down_revision: Union[str, None] = "9d4b61c2e7f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_notification_read_timestamp",
+        "notification",
+        ["read", sa.text("timestamp DESC")],
+    )
+    op.create_index("ix_notification_timestamp", "notification", ["timestamp"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notification_timestamp", table_name="notification")
+    op.drop_index("ix_notification_read_timestamp", table_name="notification")
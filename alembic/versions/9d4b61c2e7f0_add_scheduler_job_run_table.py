@@ -0,0 +1,64 @@
+"""add scheduler_job_run table
+
+Revision ID: 9d4b61c2e7f0
+Revises: 2c7e9f41a3d8
+Create Date: 2025-11-05 20:41:09.127455
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4b61c2e7f0"
+down_revision: Union[str, None] = "2c7e9f41a3d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "scheduler_job_run",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column(
+            "trigger", sa.Enum("scheduled", "manual", name="jobtrigger"), nullable=False
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("running", "succeeded", "failed", "skipped", name="jobrunstatus"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+        sa.Column("items_processed", sa.Integer(), nullable=False),
+        sa.Column("failures", sa.Integer(), nullable=False),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_scheduler_job_run_started_at",
+        "scheduler_job_run",
+        ["started_at"],
+    )
+    op.create_index(
+        "ix_scheduler_job_run_job_id_started_at",
+        "scheduler_job_run",
+        ["job_id", "started_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_scheduler_job_run_job_id_started_at", table_name="scheduler_job_run"
+    )
+    op.drop_index("ix_scheduler_job_run_started_at", table_name="scheduler_job_run")
+    op.drop_table("scheduler_job_run")
+    sa.Enum(name="jobrunstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="jobtrigger").drop(op.get_bind(), checkfirst=True)
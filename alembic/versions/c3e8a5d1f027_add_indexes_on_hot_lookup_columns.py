@@ -0,0 +1,70 @@
+"""add indexes on hot lookup columns
+
+Revision ID: c3e8a5d1f027
+Revises: 4f0c2b7d9a61
+Create Date: 2026-10-19 10:14:32.118402
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8a5d1f027"
+down_revision: Union[str, None] = "4f0c2b7d9a61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY doesn't block writes to large tables, but can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_season_file_torrent_id",
+            "season_file",
+            ["torrent_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_movie_file_torrent_id",
+            "movie_file",
+            ["torrent_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_show_not_ended",
+            "show",
+            ["ended"],
+            postgresql_where=sa.text("NOT ended"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_show_not_ended",
+            table_name="show",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_movie_file_torrent_id",
+            table_name="movie_file",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_season_file_torrent_id",
+            table_name="season_file",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
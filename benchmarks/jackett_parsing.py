@@ -0,0 +1,160 @@
+"""
+Compares the peak memory and duration of parsing a large Jackett Torznab response with the streaming
+parser of the Jackett indexer against loading the whole response with ET.fromstring.
+
+A synthetic feed is served from a local HTTP server, like the response of the "all" indexer.
+Both variants keep all results in a list, like Jackett.search does.
+
+Usage: python benchmarks/jackett_parsing.py [number of items]
+"""
+
+import sys
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from media_manager.indexer.indexers.jackett import Jackett
+from media_manager.indexer.schemas import IndexerQueryResult
+
+ITEM = """<item>
+<title>Some.Show.S01E{episode:02d}.1080p.WEB-DL.DDP5.1.H.264-GROUP{i}</title>
+<guid>https://tracker.example/details/{i}</guid>
+<jackettindexer id="tracker">Tracker</jackettindexer>
+<type>public</type>
+<comments>https://tracker.example/details/{i}</comments>
+<pubDate>Sun, 19 Oct 2025 08:00:00 +0000</pubDate>
+<size>{size}</size>
+<description>{description}</description>
+<link>http://localhost:9117/dl/tracker/?jackett_apikey=key&amp;path={i}</link>
+<category>5000</category>
+<category>5040</category>
+<enclosure url="http://localhost:9117/dl/tracker/?jackett_apikey=key&amp;path={i}" length="{size}" type="application/x-bittorrent" />
+<torznab:attr name="category" value="5000" />
+<torznab:attr name="seeders" value="{seeders}" />
+<torznab:attr name="peers" value="{peers}" />
+<torznab:attr name="downloadvolumefactor" value="{dvf}" />
+<torznab:attr name="uploadvolumefactor" value="1" />
+</item>
+"""
+
+
+def make_feed(count: int) -> bytes:
+    items = "".join(
+        ITEM.format(
+            i=i,
+            episode=i % 24 + 1,
+            size=1_000_000_000 + i,
+            seeders=i % 500,
+            peers=i % 700,
+            dvf="0" if i % 3 == 0 else "1",
+            description="A description of the release. " * 10,
+        )
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:torznab="http://torznab.com/schemas/2015/feed">'
+        f"<channel><title>all</title>{items}</channel></rss>"
+    ).encode()
+
+
+def serve(feed: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(feed)))
+            self.end_headers()
+            try:
+                self.wfile.write(feed)
+            except ConnectionError:
+                # the client stopped reading early
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def parse_whole_response(url: str) -> int:
+    """
+    The previous implementation: the whole response is downloaded and parsed into one tree.
+    """
+    xmlns = {"torznab": "http://torznab.com/schemas/2015/feed"}
+    response = requests.get(url)
+    tree = ET.fromstring(response.content)
+    results = []
+    for item in tree.findall("channel/item"):
+        seeders = 0
+        for attribute in item.findall("torznab:attr", xmlns):
+            if attribute.attrib["name"] == "seeders":
+                seeders = int(attribute.attrib["value"])
+        results.append(
+            IndexerQueryResult(
+                title=item.find("title").text,
+                download_url=str(item.find("enclosure").attrib["url"]),
+                seeders=seeders,
+                flags=[],
+                size=int(item.find("size").text),
+                usenet=False,
+                age=0,
+                indexer=item.find("jackettindexer").text,
+            )
+        )
+    return len(results)
+
+
+def measure(name: str, function) -> None:
+    start = time.perf_counter()
+    count = function()
+    seconds = time.perf_counter() - start
+    # tracing slows everything down, so the memory is measured in a second run
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:10s} {count} items in {seconds:.2f} s, peak memory {peak / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    feed = make_feed(count)
+    server = serve(feed)
+    print(f"feed size: {len(feed) / 2**20:.1f} MiB")
+
+    jackett = Jackett.__new__(Jackett)
+    jackett.url = f"http://127.0.0.1:{server.server_address[1]}"
+    jackett.api_key = "key"
+    jackett.indexers = ["all"]
+    jackett.timeout_seconds = 60
+
+    measure(
+        "whole",
+        lambda: parse_whole_response(
+            jackett.url + "/api/v2.0/indexers/all/results/torznab/api"
+        ),
+    )
+    measure(
+        "streaming",
+        lambda: len(list(jackett.search_iter(query="some show", is_tv=True))),
+    )
+    start = time.perf_counter()
+    results = jackett.search_iter(query="some show", is_tv=True)
+    next(results)
+    print(f"streaming  first result after {time.perf_counter() - start:.3f} s")
+    results.close()
+    print(f"streaming  stopped after {time.perf_counter() - start:.3f} s")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmarks the release parser with the titles of the test corpus in tests/data/release_titles.json,
+tests/test_release_parser.py checks the parsed fields.
+
+Usage: python benchmarks/release_parser.py [number of titles to benchmark]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from media_manager.indexer.release_parser import parse_many, parse_release
+
+CORPUS = Path(__file__).parent.parent / "tests" / "data" / "release_titles.json"
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    corpus = json.loads(CORPUS.read_text())
+
+    # make every title unique, so the cache of parse_release doesn't skew the numbers
+    titles = [f"{corpus[i % len(corpus)]['title']}.{i}" for i in range(count)]
+    parse_release.cache_clear()
+    start = time.perf_counter()
+    parse_many(titles)
+    seconds = time.perf_counter() - start
+    print(f"titles:     {count}")
+    print(
+        f"parse_many: {seconds * 1000:.1f} ms ({seconds / count * 1e6:.1f} us per title)"
+    )
+
+    start = time.perf_counter()
+    parse_many(titles[-parse_release.cache_info().maxsize :])
+    seconds = time.perf_counter() - start
+    print(
+        f"cached:     {seconds * 1000:.1f} ms for {parse_release.cache_info().maxsize} titles"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmarks scoring indexer results with the compiled scoring engine against the previous
+implementation, which looped over every rule and keyword for every result.
+
+Usage: python benchmarks/scoring.py [number of titles]
+"""
+
+import logging
+import random
+import sys
+import time
+
+from media_manager.indexer.config import (
+    IndexerConfig,
+    IndexerFlagScoringRule,
+    ScoringRuleSet,
+    TitleScoringRule,
+)
+from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.indexer.scoring import ScoringEngine
+
+log = logging.getLogger(__name__)
+
+CONFIG = IndexerConfig(
+    title_scoring_rules=[
+        TitleScoringRule(
+            name="prefer_h265",
+            keywords=["h265", "hevc", "x265", "h.265", "x.265"],
+            score_modifier=100,
+        ),
+        TitleScoringRule(
+            name="avoid_cam", keywords=["cam", "ts"], score_modifier=-10000
+        ),
+        TitleScoringRule(
+            name="prefer_hdr",
+            keywords=["hdr", "hdr10", "dolby vision", "dv"],
+            score_modifier=50,
+        ),
+        TitleScoringRule(
+            name="prefer_remux",
+            keywords=["remux", "bluray", "blu-ray"],
+            score_modifier=30,
+        ),
+        TitleScoringRule(
+            name="require_english",
+            keywords=["german", "french", "ita"],
+            score_modifier=-500,
+        ),
+        TitleScoringRule(
+            name="require_group",
+            keywords=["ntb", "flux", "cakes", "ggez"],
+            score_modifier=-20,
+            negate=True,
+        ),
+    ],
+    indexer_flag_scoring_rules=[
+        IndexerFlagScoringRule(
+            name="reject_non_freeleech",
+            flags=["freeleech", "freeleech75"],
+            score_modifier=-10000,
+            negate=True,
+        ),
+        IndexerFlagScoringRule(
+            name="reject_nuked", flags=["nuked"], score_modifier=-10000
+        ),
+    ],
+    scoring_rule_sets=[
+        ScoringRuleSet(
+            name="default",
+            libraries=["ALL_TV", "ALL_MOVIES"],
+            rule_names=["prefer_h265", "avoid_cam", "reject_nuked", "prefer_hdr"],
+        ),
+        ScoringRuleSet(
+            name="strict",
+            libraries=["ALL_TV"],
+            rule_names=[
+                "prefer_remux",
+                "require_english",
+                "require_group",
+                "reject_non_freeleech",
+            ],
+        ),
+    ],
+)
+
+WORDS = {
+    "name": ["The.Office", "Breaking.Bad", "Severance", "Andor", "Dark", "The.Expanse"],
+    "episode": ["S01", "S02E03", "S03E10", "S01-S04", "Complete"],
+    "quality": ["2160p", "1080p", "720p", "480p", "4K"],
+    "source": ["WEB-DL", "WEBRip", "BluRay", "REMUX", "HDTV", "CAM", "TS"],
+    "codec": ["x264", "x265", "H.265", "HEVC", "AVC", "h264"],
+    "extra": ["HDR", "HDR10", "DV", "German", "ITA", "DDP5.1", "Atmos", ""],
+    "group": ["NTB", "FLUX", "CAKES", "GGEZ", "RARBG", "YTS"],
+}
+FLAGS = [[], ["freeleech"], ["freeleech75"], ["nuked"], ["freeleech", "internal"]]
+
+
+def make_results(count: int) -> list[IndexerQueryResult]:
+    rng = random.Random(42)
+    results = []
+    for _ in range(count):
+        parts = [rng.choice(WORDS[key]) for key in WORDS if key != "group"]
+        title = (
+            ".".join(part for part in parts if part) + "-" + rng.choice(WORDS["group"])
+        )
+        results.append(
+            IndexerQueryResult(
+                title=title,
+                download_url="magnet:?xt=urn:btih:0",
+                seeders=rng.randint(0, 500),
+                flags=rng.choice(FLAGS),
+                size=rng.randint(10**8, 10**11),
+                usenet=False,
+                age=0,
+                indexer="benchmark",
+            )
+        )
+    return results
+
+
+def score_naive(results: list[IndexerQueryResult], is_tv: bool) -> None:
+    """
+    The previous implementation, including its debug log calls, whose messages were formatted even with debug
+    logging disabled.
+    """
+    for ruleset in CONFIG.scoring_rule_sets:
+        if not (
+            ("ALL_TV" in ruleset.libraries and is_tv)
+            or ("ALL_MOVIES" in ruleset.libraries and not is_tv)
+        ):
+            continue
+        for result in results:
+            for rule_name in ruleset.rule_names:
+                for rule in CONFIG.title_scoring_rules:
+                    if rule.name == rule_name:
+                        matched = any(
+                            keyword.lower() in result.title.lower()
+                            for keyword in rule.keywords
+                        )
+                        log.debug(
+                            f"Rule {rule.name} with keywords {rule.keywords} matched for {result.title}: {matched}"
+                        )
+                        if matched != rule.negate:
+                            result.score += rule.score_modifier
+                for rule in CONFIG.indexer_flag_scoring_rules:
+                    if rule.name == rule_name:
+                        matched = any(flag in result.flags for flag in rule.flags)
+                        log.debug(
+                            f"Rule {rule.name} with flags {rule.flags} matched for {result.title} with flags {result.flags}: {matched}"
+                        )
+                        if matched != rule.negate:
+                            result.score += rule.score_modifier
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    naive_results = make_results(count)
+    compiled_results = make_results(count)
+
+    start = time.perf_counter()
+    score_naive(naive_results, is_tv=True)
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = ScoringEngine(config=CONFIG)
+    compile_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.score(query_results=compiled_results, library="", is_tv=True)
+    compiled_seconds = time.perf_counter() - start
+
+    mismatches = sum(
+        naive.score != compiled.score
+        for naive, compiled in zip(naive_results, compiled_results)
+    )
+    print(f"titles:    {count}")
+    print(f"naive:     {naive_seconds * 1000:.1f} ms")
+    print(
+        f"compiled:  {compiled_seconds * 1000:.1f} ms (+ {compile_seconds * 1000:.2f} ms to compile)"
+    )
+    print(f"speedup:   {naive_seconds / compiled_seconds:.1f}x")
+    print(f"mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
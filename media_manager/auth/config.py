@@ -1,9 +1,11 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 import secrets
 
 
 class OpenIdConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     client_id: str = ""
     client_secret: str = ""
     configuration_endpoint: str = ""
@@ -12,6 +14,8 @@ class OpenIdConfig(BaseSettings):
 
 
 class AuthConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     # to get a signing key run:
     # openssl rand -hex 32
     token_secret: str = Field(default_factory=secrets.token_hex)
@@ -8,11 +8,12 @@ from fastapi_users.db import (
     SQLAlchemyBaseOAuthAccountTableUUID,
 )
 from sqlalchemy import String
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 
-from media_manager.database import Base, build_db_url
-from media_manager.config import AllEncompassingConfig
+import media_manager.database
+from media_manager.database import Base, init_async_engine
+from media_manager.config import get_config
 
 
 class OAuthAccount(SQLAlchemyBaseOAuthAccountTableUUID, Base):
@@ -29,14 +30,12 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     )
 
 
-engine = create_async_engine(
-    build_db_url(**AllEncompassingConfig().database.model_dump()), echo=False
-)
-async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+init_async_engine(get_config().database)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
+    # fastapi-users commits on its own
+    async with media_manager.database.AsyncSessionLocal() as session:
         yield session
 
 
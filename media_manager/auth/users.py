@@ -20,11 +20,11 @@ from sqlalchemy import select, func
 import media_manager.notification.utils
 from media_manager.auth.db import User, get_user_db, get_async_session
 from media_manager.auth.schemas import UserUpdate, UserCreate
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 
 log = logging.getLogger(__name__)
 
-config = AllEncompassingConfig().auth
+config = get_config().auth
 SECRET = config.token_secret
 LIFETIME = config.session_lifetime
 
@@ -66,7 +66,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     async def on_after_forgot_password(
         self, user: User, token: str, request: Optional[Request] = None
     ):
-        link = f"{AllEncompassingConfig().misc.frontend_url}web/login/reset-password?token={token}"
+        link = f"{get_config().misc.frontend_url}web/login/reset-password?token={token}"
         log.info(f"User {user.id} has forgot their password. Reset Link: {link}")
 
         if not config.email_password_resets:
@@ -88,10 +88,11 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
           </body>
         </html>
         """
-        media_manager.notification.utils.send_email(
-            subject=subject, html=html, addressee=user.email
+        # sending the email doesn't delay the response, failures are logged
+        media_manager.notification.utils.smtp_sender.send_in_background(
+            subject=subject, html=html, addressees=[user.email]
         )
-        log.info(f"Sent password reset email to {user.email}")
+        log.info(f"Queued password reset email to {user.email}")
 
     async def on_after_reset_password(
         self, user: User, request: Optional[Request] = None
@@ -128,7 +129,7 @@ async def create_default_admin_user():
                     stmt = select(func.count(User.id))
                     result = await session.execute(stmt)
                     user_count = result.scalar()
-                    config = AllEncompassingConfig()
+                    config = get_config()
                     if user_count == 0:
                         log.info(
                             "No users found in database. Creating default admin user..."
@@ -184,7 +185,7 @@ def get_jwt_strategy() -> JWTStrategy[models.UP, models.ID]:
 class RedirectingCookieTransport(CookieTransport):
     async def get_login_response(self, token: str) -> Response:
         response = RedirectResponse(
-            str(AllEncompassingConfig().misc.frontend_url) + "web/dashboard",
+            str(get_config().misc.frontend_url) + "web/dashboard",
             status_code=status.HTTP_302_FOUND,
         )
         return self._set_login_cookie(response, token)
@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Type, Tuple
 
@@ -16,6 +18,7 @@ from media_manager.database.config import DbConfig
 from media_manager.indexer.config import IndexerConfig
 from media_manager.metadataProvider.config import MetadataProviderConfig
 from media_manager.notification.config import NotificationConfig
+from media_manager.scheduler.config import SchedulerConfig
 from media_manager.torrent.config import TorrentConfig
 
 log = logging.getLogger(__name__)
@@ -31,11 +34,15 @@ log.info(f"Using config file {config_path}")
 
 
 class LibraryItem(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     name: str
     path: str
 
 
 class BasicConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     image_directory: Path = Path(__file__).parent.parent / "data" / "images"
     tv_directory: Path = Path(__file__).parent.parent / "data" / "tv"
     movie_directory: Path = Path(__file__).parent.parent / "data" / "movies"
@@ -55,6 +62,7 @@ class AllEncompassingConfig(BaseSettings):
         case_sensitive=False,
         env_nested_delimiter="__",
         env_prefix="MEDIAMANAGER_",
+        frozen=True,
     )
     """
     This class is used to load all configurations from the environment variables.
@@ -67,6 +75,7 @@ class AllEncompassingConfig(BaseSettings):
     indexers: IndexerConfig = IndexerConfig()
     database: DbConfig = DbConfig()
     auth: AuthConfig = AuthConfig()
+    scheduler: SchedulerConfig = SchedulerConfig()
 
     @classmethod
     def settings_customise_sources(
@@ -84,3 +93,67 @@ class AllEncompassingConfig(BaseSettings):
             TomlConfigSettingsSource(settings_cls),
             file_secret_settings,
         )
+
+
+# how often get_config() checks whether the config file changed
+CONFIG_FILE_CHECK_INTERVAL_SECONDS = 5
+
+_config: AllEncompassingConfig | None = None
+_config_file_mtime: float | None = None
+_config_file_checked_at = 0.0
+_config_lock = threading.Lock()
+
+
+def _get_config_file_mtime() -> float | None:
+    try:
+        return config_path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def reload_config() -> AllEncompassingConfig:
+    """
+    Loads the config file and the environment variables into a new config snapshot and makes it the current one.
+    The new config is validated completely before it replaces the current one, if it is invalid,
+    the current snapshot stays in place.
+
+    :return: The current config snapshot.
+    :raises ValidationError: If the config is invalid and there is no current snapshot to fall back to.
+    """
+    global _config, _config_file_mtime, _config_file_checked_at
+    with _config_lock:
+        mtime = _get_config_file_mtime()
+        try:
+            new_config = AllEncompassingConfig()
+        except Exception as e:
+            if _config is None:
+                raise
+            log.error(f"Invalid config, keeping the previous config: {e}")
+            # don't try to load the same broken file again until it changes
+            _config_file_mtime = mtime
+            return _config
+        if _config is not None:
+            log.info("Reloaded config")
+        _config = new_config
+        _config_file_mtime = mtime
+        _config_file_checked_at = time.monotonic()
+        return _config
+
+
+def get_config() -> AllEncompassingConfig:
+    """
+    Returns the current config snapshot.
+    The snapshot is immutable and shared by the whole process, it is replaced when the config file changes,
+    or on SIGHUP, see reload_config().
+    """
+    global _config_file_checked_at
+    config = _config
+    if config is None:
+        return reload_config()
+
+    now = time.monotonic()
+    if now - _config_file_checked_at >= CONFIG_FILE_CHECK_INTERVAL_SECONDS:
+        _config_file_checked_at = now
+        if _get_config_file_mtime() != _config_file_mtime:
+            return reload_config()
+    return config
@@ -1,13 +1,27 @@
 import logging
 import os
+import time
+from contextlib import contextmanager, nullcontext
 from contextvars import ContextVar
-from typing import Annotated, Any, Generator, Optional
+from typing import Annotated, Any, AsyncGenerator, Generator, Iterator, Optional
 
+import psycopg
 from fastapi import Depends
-from sqlalchemy import create_engine
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+from media_manager.database.config import DbConfig
+from media_manager.database.query_stats import install_query_hooks
 
 log = logging.getLogger(__name__)
 
@@ -15,6 +29,48 @@ Base = declarative_base()
 
 engine: Optional[Engine] = None
 SessionLocal: Optional[sessionmaker] = None
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+# connects to PostgreSQL directly, bypassing PgBouncer, for connections which hold session level advisory locks
+session_engine: Optional[Engine] = None
+pipeline_mode = True
+
+db_pool_checkout_wait_seconds = Histogram(
+    "mediamanager_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the database pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30),
+)
+db_pool_connections = Gauge(
+    "mediamanager_db_pool_connections",
+    "Connections of the database pool by state",
+    ["engine", "state"],
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool which measures how long callers wait for a connection.
+    """
+
+    engine_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait_seconds.labels(self.engine_label).observe(
+                time.perf_counter() - start
+            )
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """
+    The pool of the async engine, waiting callers are measured the same way.
+    """
+
+    engine_label = "async"
 
 
 def build_db_url(
@@ -35,51 +91,184 @@ def build_db_url(
     return db_url
 
 
+def _get_url(db_config: Any | None, url: str | None) -> str:
+    if url is not None:
+        return url
+    if db_config is None:
+        url = os.getenv("DATABASE_URL")
+        if not url:
+            raise RuntimeError("DB config or `DATABASE_URL` must be provided")
+        return url
+    return build_db_url(
+        db_config.user,
+        db_config.password,
+        db_config.host,
+        db_config.port,
+        db_config.dbname,
+    )
+
+
+def _split_pool_budget(budget: int, share: float, async_engine: bool) -> int:
+    async_part = round(budget * share)
+    return async_part if async_engine else budget - async_part
+
+
+def get_engine_options(
+    db_config: DbConfig, async_engine: bool = False
+) -> dict[str, Any]:
+    """
+    The options of create_engine and create_async_engine. pool_size and max_overflow are the budget of the
+    process, the sync and the async engine each get their share of it, so together they never open more
+    connections than configured.
+
+    :param async_engine: Whether the options are for the async engine.
+    """
+    connect_args: dict[str, Any] = {"application_name": db_config.application_name}
+    if db_config.pgbouncer:
+        # PgBouncer in transaction mode hands every transaction to any server connection,
+        # so server side prepared statements of psycopg would not exist on the next one
+        connect_args["prepare_threshold"] = None
+    elif db_config.statement_timeout_seconds > 0:
+        connect_args["options"] = (
+            f"-c statement_timeout={int(db_config.statement_timeout_seconds * 1000)}"
+        )
+    return {
+        "echo": False,
+        "pool_size": max(
+            _split_pool_budget(
+                db_config.pool_size, db_config.async_pool_share, async_engine
+            ),
+            1,
+        ),
+        "max_overflow": _split_pool_budget(
+            db_config.max_overflow, db_config.async_pool_share, async_engine
+        ),
+        "pool_timeout": db_config.pool_timeout_seconds,
+        "pool_recycle": db_config.pool_recycle_seconds,
+        "pool_pre_ping": db_config.pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
+def install_statement_timeout(engine: Engine, db_config: DbConfig) -> None:
+    """
+    PgBouncer does not pass the options startup parameter on to PostgreSQL, and settings of the session would leak
+    to other clients, so the statement timeout is set at the start of every transaction instead.
+    """
+    if not db_config.pgbouncer or db_config.statement_timeout_seconds <= 0:
+        return
+    statement = f"SET LOCAL statement_timeout = {int(db_config.statement_timeout_seconds * 1000)}"
+
+    @event.listens_for(engine, "begin")
+    def set_statement_timeout(conn):
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            conn.exec_driver_sql(statement)
+
+
+def _install_pool_metrics(pool: Pool, engine_label: str) -> None:
+    db_pool_connections.labels(engine_label, "size").set_function(pool.size)
+    db_pool_connections.labels(engine_label, "checked_out").set_function(
+        pool.checkedout
+    )
+    db_pool_connections.labels(engine_label, "checked_in").set_function(pool.checkedin)
+    db_pool_connections.labels(engine_label, "overflow").set_function(
+        lambda: max(pool.overflow(), 0)
+    )
+
+
 def init_engine(
-    db_config: Any | None = None,
+    db_config: DbConfig | None = None,
     url: str | None = None,
 ) -> Engine:
     """
     Initialize the global SQLAlchemy engine and session factory.
-    Pass either a DbConfig-like object or a full URL. Only initializes once.
+    Pass either a DbConfig or a full URL, the pool settings of the default DbConfig are used with a URL.
+    Only initializes once.
     """
-    global engine, SessionLocal
+    global engine, SessionLocal, session_engine, pipeline_mode
     if engine is not None:
         return engine
 
-    if url is None:
-        if db_config is None:
-            url = os.getenv("DATABASE_URL")
-            if not url:
-                raise RuntimeError("DB config or `DATABASE_URL` must be provided")
-        else:
-            url = build_db_url(
-                db_config.user,
-                db_config.password,
-                db_config.host,
-                db_config.port,
-                db_config.dbname,
-            )
-
+    url = _get_url(db_config=db_config, url=url)
+    db_config = db_config or DbConfig()
     engine = create_engine(
-        url,
-        echo=False,
-        pool_size=10,
-        max_overflow=10,
-        pool_timeout=30,
-        pool_recycle=1800,
+        url, poolclass=InstrumentedQueuePool, **get_engine_options(db_config)
     )
+    install_query_hooks(engine)
+    install_statement_timeout(engine, db_config)
+    _install_pool_metrics(engine.pool, "sync")
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    pipeline_mode = db_config.pipeline_mode
+
+    session_engine = engine
+    if db_config.pgbouncer:
+        if db_config.direct_host:
+            session_engine = create_engine(
+                build_db_url(
+                    db_config.user,
+                    db_config.password,
+                    db_config.direct_host,
+                    db_config.direct_port or db_config.port,
+                    db_config.dbname,
+                ),
+                poolclass=NullPool,
+                connect_args={"application_name": db_config.application_name},
+            )
+        else:
+            log.warning(
+                "Connecting through PgBouncer without direct_host, leader election and job locks only work "
+                "if PgBouncer runs in session pooling mode"
+            )
     log.debug("SQLAlchemy engine initialized")
     return engine
 
 
+def init_async_engine(
+    db_config: DbConfig | None = None,
+    url: str | None = None,
+) -> AsyncEngine:
+    """
+    Initialize the global async SQLAlchemy engine and session factory, used by async routes and fastapi-users.
+    Pass either a DbConfig or a full URL. Only initializes once.
+    """
+    global async_engine, AsyncSessionLocal
+    if async_engine is not None:
+        return async_engine
+
+    url = _get_url(db_config=db_config, url=url)
+    db_config = db_config or DbConfig()
+    async_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **get_engine_options(db_config, async_engine=True),
+    )
+    install_query_hooks(async_engine.sync_engine)
+    install_statement_timeout(async_engine.sync_engine, db_config)
+    _install_pool_metrics(async_engine.pool, "async")
+    # objects must not expire on commit, reloading their attributes would need I/O outside of an await
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    log.debug("SQLAlchemy async engine initialized")
+    return async_engine
+
+
 def get_engine() -> Engine:
     if engine is None:
         raise RuntimeError("Engine not initialized. Call init_engine(...) first.")
     return engine
 
 
+def get_session_engine() -> Engine:
+    """
+    Returns the engine for connections that hold session level state like advisory locks,
+    it bypasses PgBouncer if a direct_host is configured.
+    """
+    if session_engine is None:
+        raise RuntimeError("Engine not initialized. Call init_engine(...) first.")
+    return session_engine
+
+
 def get_session() -> Generator[Session, Any, None]:
     if SessionLocal is None:
         raise RuntimeError(
@@ -97,5 +286,71 @@ def get_session() -> Generator[Session, Any, None]:
         db.close()
 
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    if AsyncSessionLocal is None:
+        raise RuntimeError(
+            "Async session factory not initialized. Call init_async_engine(...) first."
+        )
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            log.critical(f"error occurred: {e}")
+            raise
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    Runs the block as one transaction, which is committed if the block succeeds and rolled back if it raises.
+    Repositories only flush their changes, so jobs run every operation that has to be atomic in a unit of work,
+    requests are committed as a whole by get_session.
+
+    Inside another unit of work the block becomes a savepoint instead, so if it raises only its own changes
+    are undone and the outer unit of work can carry on.
+
+    :param db: The session of the repositories used in the block.
+    """
+    depth = db.info.get("unit_of_work_depth", 0)
+    db.info["unit_of_work_depth"] = depth + 1
+    try:
+        if depth:
+            with db.begin_nested():
+                yield db
+            return
+        try:
+            yield db
+            db.commit()
+        except BaseException:
+            db.rollback()
+            raise
+    finally:
+        db.info["unit_of_work_depth"] = depth
+
+
+@contextmanager
+def pipeline(db: Session) -> Iterator[None]:
+    """
+    Sends the statements of the block in psycopg pipeline mode, so a series of writes doesn't wait for
+    a round trip per statement. Only meant for writes, the ORM can't load objects inside the block.
+    Does nothing if pipeline_mode is disabled, or if the session runs on the async engine through
+    AsyncSession.run_sync, whose connection only has an async pipeline.
+
+    :param db: The session to run the statements on.
+    """
+    if not pipeline_mode:
+        yield
+        return
+    driver_connection = db.connection().connection.driver_connection
+    if isinstance(driver_connection, psycopg.AsyncConnection):
+        yield
+        return
+    with getattr(driver_connection, "pipeline", nullcontext)():
+        yield
+
+
 db_session: ContextVar[Session] = ContextVar("db_session")
 DbSessionDependency = Annotated[Session, Depends(get_session)]
+AsyncDbSessionDependency = Annotated[AsyncSession, Depends(get_async_session)]
@@ -0,0 +1,46 @@
+from typing import Any, Callable, Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+Repository = TypeVar("Repository")
+
+
+class AsyncRepository(Generic[Repository]):
+    """
+    Makes the methods of a sync repository awaitable on an AsyncSession, e.g.
+    `await AsyncTvRepository(db).get_show_by_id(show_id=show_id)`.
+
+    The methods of the sync repository run through AsyncSession.run_sync, so they use the async engine and its
+    driver without blocking the event loop, and the queries don't have to be written twice.
+    Subclasses set repository_class.
+    """
+
+    repository_class: Callable[[Session], Repository]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def run(self, call: Callable[[Repository], Any]) -> Any:
+        """
+        Runs a function with the sync repository, e.g. to run several of its methods in one go.
+
+        :param call: Receives the sync repository.
+        """
+        return await self.db.run_sync(
+            lambda session: call(self.repository_class(session))
+        )
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self.repository_class, name)
+        if not callable(method) or name.startswith("_"):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            return await self.run(
+                lambda repository: getattr(repository, name)(*args, **kwargs)
+            )
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
@@ -1,9 +1,50 @@
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class DbReplicaConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    host: str
+    port: int = 5432
 
 
 class DbConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     host: str = "localhost"
     port: int = 5432
     user: str = "MediaManager"
     password: str = "MediaManager"
     dbname: str = "MediaManager"
+    # shown in pg_stat_activity
+    application_name: str = "MediaManager"
+
+    # the connections of a process, split between the pools of the sync and the async engine
+    pool_size: int = 20
+    max_overflow: int = 20
+    # the share of pool_size and max_overflow that goes to the async engine
+    async_pool_share: float = Field(default=0.25, gt=0, lt=1)
+    pool_timeout_seconds: float = 30
+    pool_recycle_seconds: int = 1800
+    # test connections before using them, e.g. if a firewall drops idle connections
+    pool_pre_ping: bool = False
+    # 0 disables the timeout
+    statement_timeout_seconds: float = 0
+    # send bulk writes in psycopg pipeline mode
+    pipeline_mode: bool = True
+
+    # host and port are a PgBouncer in transaction pooling mode
+    pgbouncer: bool = False
+    # PostgreSQL itself, for the connections holding advisory locks when connecting through PgBouncer
+    direct_host: str | None = None
+    direct_port: int | None = None
+
+    # read-only routes and the read phases of jobs use these hot standbys
+    replicas: list[DbReplicaConfig] = []
+    # replicas lagging further behind are skipped, and reads stay on the primary this long after a write
+    replica_max_lag_seconds: float = 5
+    replica_check_interval_seconds: float = 5
+
+    # development mode only, warn if a statement runs more often than this during one request or job
+    repeated_statement_threshold: int = 10
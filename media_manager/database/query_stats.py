@@ -0,0 +1,113 @@
+"""
+Counts the SQL statements and the time spent in the database per request or job, to make N+1 query patterns visible.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration_seconds = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_seconds: float) -> None:
+        self.count += 1
+        self.duration_seconds += duration_seconds
+        self.statements[statement] += 1
+
+    def log_repeated_statements(self, context: str, threshold: int) -> None:
+        """
+        Logs a warning for every statement that ran more than `threshold` times.
+
+        :param context: Where the statements ran, e.g. the request path.
+        :param threshold: How often a statement may run before it is reported.
+        """
+        for statement, count in self.statements.most_common():
+            if count <= threshold:
+                break
+            log.warning(
+                f"{context}: statement ran {count} times, possible N+1 query: {' '.join(statement.split())[:500]}"
+            )
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Counts all statements executed in the current context, including threads started from it
+    through run_in_threadpool, which is how FastAPI runs sync endpoints and dependencies.
+    """
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def install_query_hooks(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if _query_stats.get() is not None:
+            conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _query_stats.get()
+        start_times = conn.info.get("query_start_times")
+        if stats is None or not start_times:
+            return
+        stats.record(
+            statement=statement,
+            duration_seconds=time.perf_counter() - start_times.pop(),
+        )
+
+
+class QueryStatsMiddleware:
+    """
+    Adds the number of SQL statements and the time spent in the database to every response,
+    as X-DB-Queries and X-DB-Time (milliseconds) headers, and warns about statements that ran suspiciously often.
+    Only meant for development, as it exposes internals.
+    """
+
+    def __init__(self, app: ASGIApp, repeated_statement_threshold: int):
+        self.app = app
+        self.repeated_statement_threshold = repeated_statement_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Queries"] = str(stats.count)
+                    headers["X-DB-Time"] = f"{stats.duration_seconds * 1000:.1f}"
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        stats.log_repeated_statements(
+            context=f"{scope['method']} {scope['path']}",
+            threshold=self.repeated_statement_threshold,
+        )
@@ -0,0 +1,282 @@
+import itertools
+import logging
+import math
+import threading
+from typing import Annotated, Any, AsyncGenerator, Generator
+
+from fastapi import Depends, Request
+from prometheus_client import Gauge
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import media_manager.database
+from media_manager.database import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    build_db_url,
+    get_engine_options,
+    install_statement_timeout,
+)
+from media_manager.database.query_stats import install_query_hooks
+from media_manager.database.config import DbConfig, DbReplicaConfig
+
+log = logging.getLogger(__name__)
+
+db_replica_lag_seconds = Gauge(
+    "mediamanager_db_replica_lag_seconds",
+    "Replication lag of a read replica, +Inf if it is unreachable",
+    ["replica"],
+)
+
+# set on the responses of successful writes, the requests of a client that carry it read from the primary
+RECENT_WRITE_COOKIE = "mm_recent_write"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class Replica:
+    def __init__(self, config: DbReplicaConfig, db_config: DbConfig):
+        self.name = f"{config.host}:{config.port}"
+        url = build_db_url(
+            db_config.user,
+            db_config.password,
+            config.host,
+            config.port,
+            db_config.dbname,
+        )
+        self.engine: Engine = create_engine(
+            url, poolclass=InstrumentedQueuePool, **get_engine_options(db_config)
+        )
+        self.async_engine: AsyncEngine = create_async_engine(
+            url,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **get_engine_options(db_config, async_engine=True),
+        )
+        for engine in (self.engine, self.async_engine.sync_engine):
+            install_query_hooks(engine)
+            install_statement_timeout(engine, db_config)
+        self.session_factory = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self.engine.execution_options(postgresql_readonly=True),
+        )
+        self.async_session_factory = async_sessionmaker(
+            self.async_engine.execution_options(postgresql_readonly=True),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        # unknown until the first check, so the primary is used until then
+        self.lag_seconds: float | None = None
+
+    def check_lag(self) -> None:
+        try:
+            with self.engine.connect() as connection:
+                lag = connection.execute(REPLICA_LAG_QUERY).scalar_one()
+            self.lag_seconds = float(lag) if lag is not None else None
+        except Exception as e:
+            if self.lag_seconds is not None:
+                log.warning(f"Read replica {self.name} is unreachable: {e}")
+            self.lag_seconds = None
+        db_replica_lag_seconds.labels(self.name).set(
+            self.lag_seconds if self.lag_seconds is not None else float("inf")
+        )
+
+
+class ReplicaSet:
+    """
+    Routes read-only sessions to read replicas.
+
+    A background thread checks the replication lag of every replica, replicas that lag too far behind or are
+    unreachable are skipped. As a replica may not have replayed a recent write yet, a client's reads stay on the
+    primary for replica_max_lag_seconds after it wrote, see ReadYourWritesMiddleware. Writes of other clients and
+    of scheduled jobs show up on the replicas with at most this lag.
+    """
+
+    def __init__(self):
+        self.replicas: list[Replica] = []
+        self.max_lag_seconds: float = 0
+        self.check_interval_seconds: float = 0
+        self._round_robin = itertools.count()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def init(self, db_config: DbConfig) -> None:
+        if self.replicas or not db_config.replicas:
+            return
+        self.max_lag_seconds = db_config.replica_max_lag_seconds
+        self.check_interval_seconds = db_config.replica_check_interval_seconds
+        self.replicas = [
+            Replica(config=replica, db_config=db_config)
+            for replica in db_config.replicas
+        ]
+        log.info(f"Routing reads to {len(self.replicas)} read replicas")
+
+    def start(self) -> None:
+        if not self.replicas or self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="replica-lag-check", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            for replica in self.replicas:
+                replica.check_lag()
+            self._stop_event.wait(self.check_interval_seconds)
+
+    def get_replica(self) -> Replica | None:
+        """
+        :return: A replica that is within the lag limit, or None if reads have to go to the primary.
+        """
+        replicas = [
+            replica
+            for replica in self.replicas
+            if replica.lag_seconds is not None
+            and replica.lag_seconds <= self.max_lag_seconds
+        ]
+        if not replicas:
+            return None
+        return replicas[next(self._round_robin) % len(replicas)]
+
+
+replica_set = ReplicaSet()
+
+
+class ReadYourWritesMiddleware:
+    """
+    Sets a cookie on the response of every successful write request that expires after replica_max_lag_seconds,
+    the read sessions of the requests that carry it use the primary. So a client reads its own writes, without
+    sending the reads of every other client to the primary too.
+    Clients that don't keep cookies read from the replicas right after their writes.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                max_age = math.ceil(replica_set.max_lag_seconds)
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{RECENT_WRITE_COOKIE}=1; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+_read_only_session_factory: sessionmaker | None = None
+_async_read_only_session_factory: async_sessionmaker | None = None
+
+
+def _get_primary_session_factory() -> sessionmaker:
+    global _read_only_session_factory
+    if _read_only_session_factory is None:
+        _read_only_session_factory = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=media_manager.database.get_engine().execution_options(
+                postgresql_readonly=True
+            ),
+        )
+    return _read_only_session_factory
+
+
+def _get_async_primary_session_factory() -> async_sessionmaker:
+    global _async_read_only_session_factory
+    if _async_read_only_session_factory is None:
+        if media_manager.database.async_engine is None:
+            raise RuntimeError(
+                "Async engine not initialized. Call init_async_engine(...) first."
+            )
+        _async_read_only_session_factory = async_sessionmaker(
+            media_manager.database.async_engine.execution_options(
+                postgresql_readonly=True
+            ),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_read_only_session_factory
+
+
+def get_read_session(primary: bool = False) -> Generator[Session, Any, None]:
+    """
+    A read-only session on a read replica, or on the primary if no replica is usable.
+    Writes fail in both cases, so a route that starts writing is noticed even without replicas.
+
+    :param primary: Read from the primary, e.g. because the data was just written.
+    """
+    replica = None if primary else replica_set.get_replica()
+    factory = (
+        replica.session_factory
+        if replica is not None
+        else _get_primary_session_factory()
+    )
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+def get_request_read_session(request: Request) -> Generator[Session, Any, None]:
+    """
+    The read session of a request, on the primary if the client wrote recently.
+    """
+    yield from get_read_session(primary=RECENT_WRITE_COOKIE in request.cookies)
+
+
+async def get_async_read_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    The async variant of get_request_read_session.
+    """
+    replica = (
+        None if RECENT_WRITE_COOKIE in request.cookies else replica_set.get_replica()
+    )
+    factory = (
+        replica.async_session_factory
+        if replica is not None
+        else _get_async_primary_session_factory()
+    )
+    async with factory() as db:
+        try:
+            yield db
+        finally:
+            await db.rollback()
+
+
+ReadDbSessionDependency = Annotated[Session, Depends(get_request_read_session)]
+AsyncReadDbSessionDependency = Annotated[AsyncSession, Depends(get_async_read_session)]
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from media_manager.events import log
+from media_manager.events.schemas import Event, EventType
+
+
+class Subscription:
+    """
+    The events of a single subscriber, usually an open event stream of a browser tab.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queued_events: int):
+        self.loop = loop
+        self._queue: asyncio.Queue[Event | None] = asyncio.Queue(
+            maxsize=max_queued_events
+        )
+        self.overflowed = False
+
+    def _push(self, event: Event) -> None:
+        # runs on the event loop of the subscriber
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # the subscriber can't keep up, end its stream so it reconnects and fetches the current state
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def get(self, timeout: float) -> Event | None:
+        """
+        :param timeout: How long to wait for an event, in seconds.
+        :return: The next event.
+        :raises TimeoutError: If there was no event within the timeout.
+        :raises OverflowError: If events were dropped because the subscriber didn't keep up.
+        """
+        event = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        if event is None:
+            raise OverflowError("The subscriber did not keep up with the events")
+        return event
+
+
+class EventBus:
+    """
+    Delivers events of this process to the subscribers of this process, e.g. the event streams of the frontend.
+    Events are published from any thread and are delivered on the event loop of each subscriber.
+    Events are not persisted, a subscriber only receives the events that are published while it is subscribed.
+    """
+
+    def __init__(self, max_queued_events: int = 1000):
+        self.max_queued_events = max_queued_events
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> Subscription:
+        """
+        Subscribes to all events, must be called from within the event loop of the subscriber.
+        """
+        subscription = Subscription(
+            loop=asyncio.get_running_loop(), max_queued_events=self.max_queued_events
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event_type: EventType, data: BaseModel | dict) -> None:
+        """
+        Publishes an event to all subscribers, it returns immediately.
+
+        :param event_type: The type of the event.
+        :param data: The payload of the event.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        if not subscriptions:
+            return
+        if isinstance(data, BaseModel):
+            data = data.model_dump(mode="json")
+        event = Event(type=event_type, data=data)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._push, event)
+            except RuntimeError:
+                # the event loop of the subscriber is closed
+                log.debug("Dropping subscription of a closed event loop")
+                self.unsubscribe(subscription)
+
+    def publish_after_commit(
+        self, db: Session, event_type: EventType, data: BaseModel | dict
+    ) -> None:
+        """
+        Publishes an event once the transaction of the session is committed, so subscribers which fetch the
+        current state on an event see the change. The event is dropped if the transaction is rolled back.
+        Events published inside a savepoint are published with the outer transaction, even if the savepoint
+        is rolled back.
+
+        :param db: The session the change that caused the event is written with.
+        :param event_type: The type of the event.
+        :param data: The payload of the event.
+        """
+        if not db.in_transaction():
+            self.publish(event_type, data)
+            return
+        if isinstance(data, BaseModel):
+            # the payload as it is now, the object may still change before the commit
+            data = data.model_dump(mode="json")
+        db.info.setdefault("pending_events", []).append((self, event_type, data))
+
+
+event_bus = EventBus()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(db: Session) -> None:
+    for bus, event_type, data in db.info.pop("pending_events", []):
+        bus.publish(event_type, data)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_pending_events(db: Session, transaction: SessionTransaction) -> None:
+    # after_commit runs first, so only the events of a rolled back transaction are left
+    if transaction.parent is None:
+        db.info.pop("pending_events", None)
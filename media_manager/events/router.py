@@ -0,0 +1,45 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends
+
+from media_manager.auth.users import current_active_user
+from media_manager.events import log
+from media_manager.events.bus import event_bus
+from media_manager.sse import EventStreamResponse, format_event
+
+router = APIRouter()
+
+# proxies tend to close connections that were idle for a minute
+KEEPALIVE_SECONDS = 15
+
+
+async def stream_events() -> AsyncIterator[str]:
+    subscription = event_bus.subscribe()
+    try:
+        while True:
+            try:
+                event = await subscription.get(timeout=KEEPALIVE_SECONDS)
+            except TimeoutError:
+                # a comment, ignored by clients
+                yield ": keepalive\n\n"
+                continue
+            except OverflowError:
+                log.warning("Closing an event stream that did not keep up")
+                return
+            yield format_event(event=event.type.value, data=event.model_dump_json())
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+@router.get(
+    "",
+    dependencies=[Depends(current_active_user)],
+    response_class=EventStreamResponse,
+)
+async def get_events():
+    """
+    Streams server-sent events: "notification" for new notifications, "torrent_status" when the status of
+    a torrent changes and "import_progress" when an import job starts, finishes or fails.
+    Each event's data is a JSON object with its type, data and timestamp.
+    """
+    return EventStreamResponse(stream_events())
@@ -0,0 +1,17 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class EventType(Enum):
+    notification = "notification"  # a new notification
+    torrent_status = "torrent_status"  # the status of a torrent changed
+    import_progress = "import_progress"  # an import job started, finished or failed
+
+
+class Event(BaseModel):
+    type: EventType
+    data: dict[str, Any]
+    timestamp: datetime = Field(default_factory=datetime.now)
@@ -24,6 +24,18 @@ class NotFoundError(Exception):
     pass
 
 
+class ConflictError(Exception):
+    """Raised when an entity is not in a state that allows the requested change."""
+
+    def __init__(
+        self, message: str = "The entity is in a conflict with the requested change."
+    ):
+        super().__init__(message)
+        self.message = message
+
+    pass
+
+
 class InvalidConfigError(Exception):
     """Custom exception for when an entity is not found."""
 
@@ -34,6 +46,16 @@ class InvalidConfigError(Exception):
     pass
 
 
+class IndexerUnavailableError(Exception):
+    """Raised when an indexer is skipped, because its circuit breaker is open."""
+
+    def __init__(self, message: str = "The indexer is unavailable."):
+        super().__init__(message)
+        self.message = message
+
+    pass
+
+
 async def media_already_exists_exception_handler(
     request: Request, exc: MediaAlreadyExists | Exception
 ) -> JSONResponse:
@@ -1,7 +1,9 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class ProwlarrConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = False
     api_key: str = ""
     url: str = "http://localhost:9696"
@@ -10,6 +12,8 @@ class ProwlarrConfig(BaseSettings):
 
 
 class JackettConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = False
     api_key: str = ""
     url: str = "http://localhost:9696"
@@ -17,7 +21,44 @@ class JackettConfig(BaseSettings):
     timeout_seconds: int = 60
 
 
+class TorznabConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    name: str
+    url: str
+    api_key: str = ""
+    enabled: bool = True
+    tv_categories: list[int] = [5000]
+    movie_categories: list[int] = [2000]
+    timeout_seconds: int = 60
+    capabilities_cache_seconds: int = 86400
+
+
+class RssConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    enabled: bool = False
+    interval_minutes: int = 15  # how often the feeds of the indexers are read
+    index_rebuild_minutes: int = (
+        60  # how often the wanted requests are reloaded from the database
+    )
+
+
+class CircuitBreakerConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    failure_threshold: int = 3  # consecutive failures after which an indexer is skipped
+    cooldown_seconds: int = (
+        300  # how long an indexer is skipped before it is tried again
+    )
+    max_cooldown_seconds: int = (
+        3600  # the cool-down doubles every time the indexer fails again, up to this
+    )
+
+
 class ScoringRule(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     name: str
     score_modifier: int = 0
     negate: bool = False
@@ -32,14 +73,21 @@ class IndexerFlagScoringRule(ScoringRule):
 
 
 class ScoringRuleSet(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     name: str
     libraries: list[str] = []
     rule_names: list[str] = []
 
 
 class IndexerConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     prowlarr: ProwlarrConfig = ProwlarrConfig()
     jackett: JackettConfig = JackettConfig()
+    torznab: list[TorznabConfig] = []
+    rss: RssConfig = RssConfig()
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
     title_scoring_rules: list[TitleScoringRule] = []
     indexer_flag_scoring_rules: list[IndexerFlagScoringRule] = []
     scoring_rule_sets: list[ScoringRuleSet] = []
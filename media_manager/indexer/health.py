@@ -0,0 +1,177 @@
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+
+from prometheus_client import Gauge
+from pydantic import BaseModel
+
+from media_manager.config import get_config
+
+log = logging.getLogger(__name__)
+
+indexer_circuit_state = Gauge(
+    "mediamanager_indexer_circuit_state",
+    "State of the circuit breaker of an indexer (0 = closed, 1 = half open, 2 = open)",
+    ["indexer"],
+)
+
+
+class CircuitState(Enum):
+    closed = "closed"  # the indexer is healthy
+    open = "open"  # the indexer failed repeatedly and is skipped until the cool-down is over
+    half_open = "half_open"  # the cool-down is over, a single probe request decides the new state
+
+
+# errors of requests tend to contain their URL, which contains the API key
+API_KEY_PATTERN = re.compile(r"(api_?key=)[^&\s'\"]+", re.IGNORECASE)
+
+CIRCUIT_STATE_VALUES = {
+    CircuitState.closed: 0,
+    CircuitState.half_open: 1,
+    CircuitState.open: 2,
+}
+
+
+class IndexerHealth(BaseModel):
+    indexer: str
+    state: CircuitState
+    consecutive_failures: int
+    last_error: str | None = None
+    last_failure_at: datetime | None = None
+    last_success_at: datetime | None = None
+    open_until: datetime | None = None
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of a single indexer.
+
+    After failure_threshold consecutive failures the circuit opens and requests to the indexer are skipped
+    instead of waiting for its timeout. Once the cool-down is over, a single request is let through as a probe:
+    if it succeeds the circuit closes again, if it fails the circuit opens again with a doubled cool-down.
+    """
+
+    def __init__(self, indexer: str):
+        self.indexer = indexer
+        self._lock = threading.Lock()
+        self.state = CircuitState.closed
+        self.consecutive_failures = 0
+        self.cooldown_seconds: float = 0
+        self._open_until: float = 0
+        self._probe_in_flight = False
+        self.last_error: str | None = None
+        self.last_failure_at: datetime | None = None
+        self.last_success_at: datetime | None = None
+        indexer_circuit_state.labels(indexer).set(0)
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state != self.state:
+            log.info(
+                f"Circuit breaker of indexer {self.indexer} changed from {self.state.value} to {state.value}"
+            )
+        self.state = state
+        indexer_circuit_state.labels(self.indexer).set(CIRCUIT_STATE_VALUES[state])
+
+    def is_open(self) -> bool:
+        """
+        Whether requests to the indexer are skipped, without claiming the probe request once the cool-down is over.
+        """
+        return self.state == CircuitState.open and time.monotonic() < self._open_until
+
+    def allow_request(self) -> bool:
+        """
+        Whether a request to the indexer may be sent, the caller has to record its outcome afterwards.
+        """
+        with self._lock:
+            if self.state == CircuitState.closed:
+                return True
+            if self.state == CircuitState.open:
+                if time.monotonic() < self._open_until:
+                    return False
+                self._set_state(CircuitState.half_open)
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> CircuitState | None:
+        """
+        :return: The new state, if the state changed.
+        """
+        with self._lock:
+            self.consecutive_failures = 0
+            self.cooldown_seconds = 0
+            self._probe_in_flight = False
+            self.last_success_at = datetime.now()
+            if self.state == CircuitState.closed:
+                return None
+            self._set_state(CircuitState.closed)
+            return self.state
+
+    def record_failure(self, error: str) -> CircuitState | None:
+        """
+        :param error: The error of the failed request.
+        :return: The new state, if the state changed.
+        """
+        config = get_config().indexers.circuit_breaker
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = API_KEY_PATTERN.sub(r"\1***", error)
+            self.last_failure_at = datetime.now()
+            if self.state == CircuitState.half_open:
+                self._probe_in_flight = False
+                self.cooldown_seconds = min(
+                    self.cooldown_seconds * 2, config.max_cooldown_seconds
+                )
+            elif (
+                self.state == CircuitState.closed
+                and self.consecutive_failures >= config.failure_threshold
+            ):
+                self.cooldown_seconds = config.cooldown_seconds
+            else:
+                return None
+            self._open_until = time.monotonic() + self.cooldown_seconds
+            previous_state = self.state
+            self._set_state(CircuitState.open)
+            # a failed probe keeps the indexer down, only the first opening is a change worth reporting
+            return self.state if previous_state == CircuitState.closed else None
+
+    def get_health(self) -> IndexerHealth:
+        with self._lock:
+            open_until = None
+            if self.state == CircuitState.open:
+                open_until = datetime.fromtimestamp(
+                    time.time() + max(self._open_until - time.monotonic(), 0)
+                )
+            return IndexerHealth(
+                indexer=self.indexer,
+                state=self.state,
+                consecutive_failures=self.consecutive_failures,
+                last_error=self.last_error,
+                last_failure_at=self.last_failure_at,
+                last_success_at=self.last_success_at,
+                open_until=open_until,
+            )
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(indexer: str) -> CircuitBreaker:
+    """
+    Returns the circuit breaker of an indexer, it is shared by all searches of the process.
+
+    :param indexer: The name of the indexer.
+    """
+    circuit_breaker = _circuit_breakers.get(indexer)
+    if circuit_breaker is None:
+        with _circuit_breakers_lock:
+            circuit_breaker = _circuit_breakers.get(indexer)
+            if circuit_breaker is None:
+                circuit_breaker = CircuitBreaker(indexer=indexer)
+                _circuit_breakers[indexer] = circuit_breaker
+    return circuit_breaker
@@ -1,4 +1,6 @@
-from media_manager.indexer.schemas import IndexerQueryResult
+from typing import Iterator
+
+from media_manager.indexer.schemas import IndexerQueryResult, IndexerSearchParameters
 
 
 class GenericIndexer(object):
@@ -19,3 +21,42 @@ class GenericIndexer(object):
         :return: A list of IndexerQueryResult objects representing the search results.
         """
         raise NotImplementedError()
+
+    def search_iter(self, query: str, is_tv: bool) -> Iterator[IndexerQueryResult]:
+        """
+        Like search, but yields the results as they arrive. Indexers that can stream their responses override this.
+
+        :param is_tv: Whether to search for TV shows or movies.
+        :param query: The search query to send to the Indexer.
+        :return: An iterator of IndexerQueryResult objects representing the search results.
+        """
+        yield from self.search(query, is_tv=is_tv)
+
+    def fetch_recent(self, is_tv: bool) -> list[IndexerQueryResult]:
+        """
+        Fetches the most recent releases of the Indexer, i.e. its RSS feed.
+        By default this is a search with an empty query, which returns the most recent releases for most indexers.
+
+        :param is_tv: Whether to fetch TV shows or movies.
+        :return: A list of IndexerQueryResult objects representing the recent releases.
+        """
+        return self.search("", is_tv=is_tv)
+
+    def supports_id_search(self, parameters: IndexerSearchParameters) -> bool:
+        """
+        Whether the Indexer can search for the show or movie by its ID, instead of by a free-text query.
+
+        :param parameters: What the search is looking for.
+        """
+        return False
+
+    def search_by_id(
+        self, parameters: IndexerSearchParameters
+    ) -> list[IndexerQueryResult]:
+        """
+        Searches the Indexer by the ID of a show or movie, only called if supports_id_search returned True.
+
+        :param parameters: What the search is looking for.
+        :return: A list of IndexerQueryResult objects representing the search results.
+        """
+        raise NotImplementedError()
@@ -1,17 +1,21 @@
-import concurrent
 import logging
+import queue
+import threading
 import xml.etree.ElementTree as ET
 from concurrent.futures.thread import ThreadPoolExecutor
-from xml.etree.ElementTree import Element
+from typing import Iterator
 
 import requests
 
 from media_manager.indexer.indexers.generic import GenericIndexer
+from media_manager.indexer.indexers.torznab import parse_torznab_item
 from media_manager.indexer.schemas import IndexerQueryResult
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 
 log = logging.getLogger(__name__)
 
+RESULT_BATCH_SIZE = 100
+
 
 class Jackett(GenericIndexer):
     def __init__(self, **kwargs):
@@ -20,103 +24,102 @@ class Jackett(GenericIndexer):
 
         """
         super().__init__(name="jackett")
-        config = AllEncompassingConfig().indexers.jackett
+        config = get_config().indexers.jackett
         self.api_key = config.api_key
         self.url = config.url
         self.indexers = config.indexers
         self.timeout_seconds = config.timeout_seconds
 
     def search(self, query: str, is_tv: bool) -> list[IndexerQueryResult]:
+        return list(self.search_iter(query=query, is_tv=is_tv))
+
+    def search_iter(self, query: str, is_tv: bool) -> Iterator[IndexerQueryResult]:
+        """
+        Searches all configured Jackett indexers concurrently and yields results as soon as they are parsed.
+
+        :param query: The search query.
+        :param is_tv: Whether to search for TV shows or movies.
+        """
         log.debug("Searching for " + query)
 
-        futures = []
-        with ThreadPoolExecutor() as executor, requests.Session() as session:
-            for indexer in self.indexers:
-                future = executor.submit(
-                    self.get_torrents_by_indexer, indexer, query, is_tv, session
-                )
-                futures.append(future)
+        # results are handed over in batches, handing over every single result makes the threads contend for the queue
+        batches: queue.Queue[list[IndexerQueryResult] | None] = queue.Queue()
 
-            responses = []
+        # set when the consumer stops iterating early, so the remaining downloads are aborted
+        stopped = threading.Event()
+        errors: list[Exception] = []
 
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    result = future.result()
-                    if result is not None:
-                        responses.extend(result)
-                except Exception as e:
-                    log.error(f"search result failed with: {e}")
+        def search_indexer(indexer: str) -> None:
+            batch: list[IndexerQueryResult] = []
+            try:
+                for result in self.get_torrents_by_indexer(
+                    indexer, query, is_tv, session
+                ):
+                    if stopped.is_set():
+                        break
+                    batch.append(result)
+                    if len(batch) >= RESULT_BATCH_SIZE:
+                        batches.put(batch)
+                        batch = []
+            except Exception as e:
+                log.error(f"search result failed with: {e}")
+                errors.append(e)
+            finally:
+                batches.put(batch)
+                # signals that this indexer is done
+                batches.put(None)
 
-        return responses
+        with ThreadPoolExecutor() as executor, requests.Session() as session:
+            for indexer in self.indexers:
+                executor.submit(search_indexer, indexer)
+
+            try:
+                remaining_indexers = len(self.indexers)
+                while remaining_indexers:
+                    batch = batches.get()
+                    if batch is None:
+                        remaining_indexers -= 1
+                    else:
+                        yield from batch
+            finally:
+                stopped.set()
+
+        # only a failure of all indexers is a failure of Jackett, e.g. because it is down
+        if errors and len(errors) == len(self.indexers):
+            raise RuntimeError(f"all Jackett indexers failed, first error: {errors[0]}")
 
     def get_torrents_by_indexer(
         self, indexer: str, query: str, is_tv: bool, session: requests.Session
-    ) -> list[IndexerQueryResult]:
-        download_volume_factor = 1.0  # Default value
-        upload_volume_factor = 1  # Default value
-        seeders = 0  # Default value
-
+    ) -> Iterator[IndexerQueryResult]:
+        """
+        Streams the Torznab response of a Jackett indexer and parses it item by item,
+        so the response never has to be held in memory as a whole.
+        """
         url = (
             self.url
             + f"/api/v2.0/indexers/{indexer}/results/torznab/api?apikey={self.api_key}&t={'tvsearch' if is_tv else 'movie'}&q={query}"
         )
-        response = session.get(url, timeout=self.timeout_seconds)
-
-        if response.status_code != 200:
-            log.error(
-                f"Jacket error with indexer {indexer}, error: {response.status_code}"
-            )
-            return []
-
-        result_list: list[IndexerQueryResult] = []
-        xml_tree = ET.fromstring(response.content)
-        xmlns = {
-            "torznab": "http://torznab.com/schemas/2015/feed",
-            "atom": "http://www.w3.org/2005/Atom",
-        }
-        for item in xml_tree.findall("channel/item"):
-            try:
-                attributes: list[Element] = [
-                    x for x in item.findall("torznab:attr", xmlns)
-                ]
-                for attribute in attributes:
-                    if attribute.attrib["name"] == "seeders":
-                        seeders = int(attribute.attrib["value"])
-                    if attribute.attrib["name"] == "downloadvolumefactor":
-                        download_volume_factor = float(attribute.attrib["value"])
-                    if attribute.attrib["name"] == "uploadvolumefactor":
-                        upload_volume_factor = int(attribute.attrib["value"])
-                flags = []
-                if download_volume_factor == 0:
-                    flags.append("freeleech")
-                if download_volume_factor == 0.5:
-                    flags.append("halfleech")
-                if download_volume_factor == 0.75:
-                    flags.append("freeleech75")
-                if download_volume_factor == 0.25:
-                    flags.append("freeleech25")
-                if upload_volume_factor == 2:
-                    flags.append("doubleupload")
-
-                result = IndexerQueryResult(
-                    title=item.find("title").text,
-                    download_url=str(item.find("enclosure").attrib["url"]),
-                    seeders=seeders,
-                    flags=flags,
-                    size=int(item.find("size").text),
-                    usenet=False,  # always False, because Jackett doesn't support usenet
-                    age=0,  # always 0 for torrents, as Jackett does not provide age information in a convenient format
-                    indexer=item.find("jackettindexer").text
-                    if item.find("jackettindexer") is not None
-                    else None,
-                )
-                result_list.append(result)
-            except Exception as e:
-                log.error(
-                    f"1 Jackett search result errored with indexer {indexer}, error: {e}"
+        result_count = 0
+        with session.get(url, timeout=self.timeout_seconds, stream=True) as response:
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Jacket error with indexer {indexer}, error: {response.status_code}"
                 )
 
+            response.raw.decode_content = True
+            for _, element in ET.iterparse(response.raw, events=("end",)):
+                if element.tag != "item":
+                    continue
+                try:
+                    yield parse_torznab_item(item=element)
+                    result_count += 1
+                except Exception as e:
+                    log.error(
+                        f"1 Jackett search result errored with indexer {indexer}, error: {e}"
+                    )
+                # drop the children of the consumed item, only an empty element per item is kept
+                element.clear()
+
         log.info(
-            f"found {len(result_list)} results for query '{query}' from indexer '{indexer}'"
+            f"found {result_count} results for query '{query}' from indexer '{indexer}'"
         )
-        return result_list
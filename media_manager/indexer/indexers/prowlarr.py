@@ -6,7 +6,7 @@ import requests
 from requests.adapters import HTTPAdapter
 
 from media_manager.indexer.indexers.generic import GenericIndexer
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.indexer.utils import follow_redirects_to_final_torrent_url
 
@@ -22,7 +22,7 @@ class Prowlarr(GenericIndexer):
         :param kwargs: Additional keyword arguments to pass to the superclass constructor.
         """
         super().__init__(name="prowlarr")
-        config = AllEncompassingConfig().indexers.prowlarr
+        config = get_config().indexers.prowlarr
         self.api_key = config.api_key
         self.url = config.url
         self.reject_torrents_on_url_error = config.reject_torrents_on_url_error
@@ -43,11 +43,10 @@ class Prowlarr(GenericIndexer):
             session.mount("http://", adapter)
             session.mount("https://", adapter)
 
-            response = session.get(url, params=params)
+            response = session.get(url, params=params, timeout=self.timeout_seconds)
 
             if response.status_code != 200:
-                log.error(f"Prowlarr Error: {response.status_code}")
-                return []
+                raise RuntimeError(f"Prowlarr Error: {response.status_code}")
 
             futures = []
             result_list: list[IndexerQueryResult] = []
@@ -0,0 +1,286 @@
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import Element
+
+import requests
+from pydantic import BaseModel
+
+from media_manager.indexer.config import TorznabConfig
+from media_manager.indexer.indexers.generic import GenericIndexer
+from media_manager.indexer.schemas import IndexerQueryResult, IndexerSearchParameters
+
+log = logging.getLogger(__name__)
+
+TORZNAB_ATTR = "{http://torznab.com/schemas/2015/feed}attr"
+NEWZNAB_ATTR = "{http://www.newznab.com/DTD/2010/feeds/attributes/}attr"
+
+# failed capability requests are retried after this many seconds, not only once the cache expires
+CAPABILITIES_RETRY_SECONDS = 300
+
+
+class TorznabCapabilities(BaseModel):
+    # the available search modes ("search", "tv-search", "movie-search") and the parameters each supports
+    search_modes: dict[str, frozenset[str]] = {}
+
+    def supports(self, mode: str, parameter: str) -> bool:
+        return parameter in self.search_modes.get(mode, frozenset())
+
+
+_capabilities: dict[tuple[str, str], tuple[float, TorznabCapabilities | None]] = {}
+# one lock per endpoint, so fetching the capabilities of a slow endpoint doesn't hold up the others
+_capabilities_locks: dict[tuple[str, str], threading.Lock] = {}
+_capabilities_locks_lock = threading.Lock()
+
+
+def parse_torznab_capabilities(content: bytes) -> TorznabCapabilities:
+    root = ET.fromstring(content)
+    if root.tag == "error":
+        raise RuntimeError(f"error {root.get('code')}: {root.get('description')}")
+    search_modes: dict[str, frozenset[str]] = {}
+    searching = root.find("searching")
+    if searching is not None:
+        for mode in searching:
+            if mode.get("available") != "yes":
+                continue
+            search_modes[mode.tag] = frozenset(
+                parameter.strip()
+                for parameter in mode.get("supportedParams", "q").split(",")
+                if parameter.strip()
+            )
+    return TorznabCapabilities(search_modes=search_modes)
+
+
+def parse_torznab_item(item: Element, indexer: str | None = None) -> IndexerQueryResult:
+    """
+    Parses an item of a Torznab or Newznab feed.
+
+    :param item: The item element.
+    :param indexer: The indexer to attribute the result to, if the item doesn't name one itself.
+    """
+    title = None
+    download_url = None
+    size = None
+    usenet = False
+    published = None
+    seeders = 0
+    download_volume_factor = 1.0
+    upload_volume_factor = 1.0
+    for child in item:
+        tag = child.tag
+        if tag == TORZNAB_ATTR or tag == NEWZNAB_ATTR:
+            name = child.get("name")
+            if name == "seeders":
+                seeders = int(child.get("value"))
+            elif name == "downloadvolumefactor":
+                download_volume_factor = float(child.get("value"))
+            elif name == "uploadvolumefactor":
+                upload_volume_factor = float(child.get("value"))
+            elif name == "size" and size is None:
+                size = int(child.get("value"))
+        elif tag == "title":
+            title = child.text
+        elif tag == "enclosure":
+            download_url = child.get("url")
+            usenet = child.get("type") == "application/x-nzb"
+            if child.get("length") and size is None:
+                size = int(child.get("length"))
+        elif tag == "size":
+            size = int(child.text)
+        elif tag == "pubDate" and child.text:
+            published = child.text
+        elif tag == "jackettindexer" or tag == "prowlarrindexer":
+            indexer = child.text
+
+    flags = []
+    if download_volume_factor == 0:
+        flags.append("freeleech")
+    if download_volume_factor == 0.5:
+        flags.append("halfleech")
+    if download_volume_factor == 0.75:
+        flags.append("freeleech75")
+    if download_volume_factor == 0.25:
+        flags.append("freeleech25")
+    if upload_volume_factor == 2:
+        flags.append("doubleupload")
+
+    age = 0  # torrent results do not need age information
+    if usenet and published:
+        try:
+            age = int(
+                (
+                    datetime.now(timezone.utc) - parsedate_to_datetime(published)
+                ).total_seconds()
+            )
+        except (TypeError, ValueError):
+            log.debug(f"Could not parse the publishing date {published} of {title}")
+
+    return IndexerQueryResult(
+        title=title,
+        download_url=str(download_url),
+        seeders=seeders,
+        flags=flags,
+        size=size,
+        usenet=usenet,
+        age=max(age, 0),
+        indexer=indexer,
+    )
+
+
+class Torznab(GenericIndexer):
+    def __init__(self, config: TorznabConfig):
+        """
+        A subclass of GenericIndexer for any Torznab or Newznab API, like the ones of Jackett, Prowlarr, NZBHydra
+        or of an indexer itself.
+
+        :param config: The config of the endpoint.
+        """
+        super().__init__(name=config.name)
+        self.url = config.url.rstrip("/")
+        if not self.url.endswith("/api"):
+            self.url += "/api"
+        self.api_key = config.api_key
+        self.tv_categories = config.tv_categories
+        self.movie_categories = config.movie_categories
+        self.timeout_seconds = config.timeout_seconds
+        self.capabilities_cache_seconds = config.capabilities_cache_seconds
+
+    def get_capabilities(self) -> TorznabCapabilities | None:
+        """
+        Returns the capabilities of the endpoint (t=caps), they are cached per endpoint.
+
+        :return: The capabilities, or None if they could not be fetched.
+        """
+        key = (self.url, self.api_key)
+        now = time.monotonic()
+        cached = _capabilities.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        with _capabilities_locks_lock:
+            lock = _capabilities_locks.setdefault(key, threading.Lock())
+        with lock:
+            # another search may have fetched them while waiting for the lock
+            cached = _capabilities.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            try:
+                response = requests.get(
+                    self.url,
+                    params={"t": "caps", "apikey": self.api_key},
+                    timeout=self.timeout_seconds,
+                )
+                response.raise_for_status()
+                capabilities = parse_torznab_capabilities(response.content)
+                expires_at = now + self.capabilities_cache_seconds
+                log.debug(f"Capabilities of {self.name}: {capabilities.search_modes}")
+            except Exception as e:
+                log.warning(
+                    f"Failed to fetch the capabilities of {self.name}, falling back to free-text search: {e}"
+                )
+                capabilities = None
+                expires_at = now + CAPABILITIES_RETRY_SECONDS
+            _capabilities[key] = (expires_at, capabilities)
+            return capabilities
+
+    def _get_search_mode(self, is_tv: bool) -> str:
+        capabilities = self.get_capabilities()
+        if capabilities is None:
+            return "search"
+        if is_tv and "tv-search" in capabilities.search_modes:
+            return "tvsearch"
+        if not is_tv and "movie-search" in capabilities.search_modes:
+            return "movie"
+        return "search"
+
+    def search(self, query: str, is_tv: bool) -> list[IndexerQueryResult]:
+        log.debug(f"Searching {self.name} for {query}")
+        return self._search(
+            params={"t": self._get_search_mode(is_tv=is_tv), "q": query}, is_tv=is_tv
+        )
+
+    def fetch_recent(self, is_tv: bool) -> list[IndexerQueryResult]:
+        # without a query, Torznab and Newznab APIs return their most recent releases
+        return self._search(
+            params={"t": self._get_search_mode(is_tv=is_tv)}, is_tv=is_tv
+        )
+
+    def _get_id_search_params(
+        self, parameters: IndexerSearchParameters
+    ) -> dict[str, str | int] | None:
+        capabilities = self.get_capabilities()
+        if capabilities is None:
+            return None
+        mode = "tv-search" if parameters.is_tv else "movie-search"
+        params: dict[str, str | int] = {}
+        for name, value in (
+            ("tvdbid", parameters.tvdb_id),
+            ("tmdbid", parameters.tmdb_id),
+        ):
+            if value is not None and capabilities.supports(mode, name):
+                params[name] = value
+        if not params:
+            return None
+
+        if parameters.is_tv:
+            params["t"] = "tvsearch"
+            if parameters.season is not None:
+                if not capabilities.supports(mode, "season"):
+                    # searching by ID alone would return the results of all seasons
+                    return None
+                params["season"] = parameters.season
+                if parameters.episode is not None and capabilities.supports(mode, "ep"):
+                    params["ep"] = parameters.episode
+        else:
+            params["t"] = "movie"
+        return params
+
+    def supports_id_search(self, parameters: IndexerSearchParameters) -> bool:
+        return self._get_id_search_params(parameters=parameters) is not None
+
+    def search_by_id(
+        self, parameters: IndexerSearchParameters
+    ) -> list[IndexerQueryResult]:
+        params = self._get_id_search_params(parameters=parameters)
+        if params is None:
+            raise ValueError(f"{self.name} does not support searching by these IDs")
+        log.debug(f"Searching {self.name} by ID with {params}")
+        return self._search(params=params, is_tv=parameters.is_tv)
+
+    def _search(
+        self, params: dict[str, str | int], is_tv: bool
+    ) -> list[IndexerQueryResult]:
+        categories = self.tv_categories if is_tv else self.movie_categories
+        params = {
+            **params,
+            "apikey": self.api_key,
+            "cat": ",".join(str(category) for category in categories),
+        }
+        results: list[IndexerQueryResult] = []
+        with requests.get(
+            self.url, params=params, timeout=self.timeout_seconds, stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"{self.name} responded with status code {response.status_code}"
+                )
+
+            response.raw.decode_content = True
+            for _, element in ET.iterparse(response.raw, events=("end",)):
+                if element.tag == "error":
+                    raise RuntimeError(
+                        f"{self.name} responded with error {element.get('code')}: {element.get('description')}"
+                    )
+                if element.tag != "item":
+                    continue
+                try:
+                    results.append(parse_torznab_item(item=element, indexer=self.name))
+                except Exception as e:
+                    log.error(f"1 search result of {self.name} errored with: {e}")
+                element.clear()
+
+        log.info(f"found {len(results)} results from {self.name} for {params['t']}")
+        return results
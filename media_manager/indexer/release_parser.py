@@ -0,0 +1,356 @@
+import functools
+import re
+import unicodedata
+from typing import Iterable
+
+from pydantic import BaseModel, ConfigDict
+
+from media_manager.torrent.schemas import Quality
+
+FILE_EXTENSION_PATTERN = re.compile(
+    r"\.(?:mkv|mp4|m4v|avi|wmv|mov|ts|m2ts|webm|srt|ass|ssa|sub|vtt|nfo|torrent)$",
+    re.IGNORECASE,
+)
+
+# all patterns except the ones for the group match against the lowercased name
+SEASON_EPISODE_PATTERN = re.compile(
+    r"\bs(\d{1,3})[ .]?e(\d{1,4})((?:-?e\d{1,4}|-\d{1,4})*)(?!\d)"
+)
+CROSS_EPISODE_PATTERN = re.compile(r"\b(\d{1,2})x(\d{2,3})\b")
+SEASON_RANGE_PATTERN = re.compile(r"\bs(\d{1,3})[ .]?(?:-|to)[ .]?s?(\d{1,3})\b")
+SEASON_PATTERN = re.compile(r"\bs(\d{1,3})\b")
+SEASON_WORD_PATTERN = re.compile(
+    r"\b(?:seasons?|saison|staffel)[ .]?(\d{1,3})(?:[ .]?(?:-|to|&|and)[ .]?(\d{1,3}))?\b"
+)
+EPISODE_WORD_PATTERN = re.compile(r"\b(?:episode|ep)[ .]?(\d{1,4})\b")
+COMPLETE_PATTERN = re.compile(r"\bcomplete(?:[ .](?:series|collection|seasons?))?\b")
+
+RESOLUTION_PATTERN = re.compile(
+    r"\b(2160p|4k|uhd|1440p|1080p|1080i|720p|576p|540p|480p|360p)\b"
+)
+RESOLUTIONS = {
+    "2160p": "2160p",
+    "4k": "2160p",
+    "uhd": "2160p",
+    "1440p": "1440p",
+    "1080p": "1080p",
+    "1080i": "1080p",
+    "720p": "720p",
+    "576p": "576p",
+    "540p": "540p",
+    "480p": "480p",
+    "360p": "360p",
+}
+RESOLUTION_QUALITIES = {
+    "2160p": Quality.uhd,
+    "1440p": Quality.fullhd,
+    "1080p": Quality.fullhd,
+    "720p": Quality.hd,
+    "576p": Quality.sd,
+    "540p": Quality.sd,
+    "480p": Quality.sd,
+    "360p": Quality.sd,
+}
+
+# ordered by precedence, e.g. "BluRay.REMUX" is a remux
+SOURCES = [
+    ("remux", {"remux", "bdremux"}),
+    ("bluray", {"bluray", "bdrip", "brrip", "bd25", "bd50"}),
+    ("web-dl", {"webdl"}),
+    ("webrip", {"webrip"}),
+    ("web", {"web"}),
+    ("hdtv", {"hdtv", "pdtv", "sdtv"}),
+    ("dvdrip", {"dvdrip", "dvdr", "dvd9", "dvd5", "dvd"}),
+    ("hdrip", {"hdrip"}),
+    ("screener", {"dvdscr", "screener", "scr"}),
+    ("cam", {"hdcam", "camrip", "cam"}),
+    ("telesync", {"hdts", "telesync", "ts"}),
+    ("telecine", {"telecine", "tc"}),
+]
+CODECS = [
+    ("h265", {"x265", "h265", "hevc"}),
+    ("h264", {"x264", "h264", "avc"}),
+    ("av1", {"av1"}),
+    ("vp9", {"vp9"}),
+    ("xvid", {"xvid"}),
+    ("divx", {"divx"}),
+]
+# maps the tokens of each source and codec to its precedence
+SOURCE_RANKS = {
+    token: rank for rank, (_, tokens) in enumerate(SOURCES) for token in tokens
+}
+CODEC_RANKS = {
+    token: rank for rank, (_, tokens) in enumerate(CODECS) for token in tokens
+}
+
+GROUP_PATTERN = re.compile(r"-([A-Za-z0-9]+)(?:\[[^\]]*\])?$")
+LEADING_GROUP_PATTERN = re.compile(r"^\[([^\]]+)\]")
+NOT_GROUPS = {"dl", "rip", "hd", "sd", "x264", "x265", "h264", "h265"}
+
+YEAR_PATTERN = re.compile(r"\b(19\d{2}|20\d{2})\b")
+
+LANGUAGES = {
+    "english": "en",
+    "eng": "en",
+    "german": "de",
+    "ger": "de",
+    "deutsch": "de",
+    "french": "fr",
+    "fre": "fr",
+    "fra": "fr",
+    "truefrench": "fr",
+    "vff": "fr",
+    "spanish": "es",
+    "spa": "es",
+    "esp": "es",
+    "castellano": "es",
+    "italian": "it",
+    "ita": "it",
+    "japanese": "ja",
+    "jpn": "ja",
+    "korean": "ko",
+    "kor": "ko",
+    "russian": "ru",
+    "rus": "ru",
+    "portuguese": "pt",
+    "por": "pt",
+    "dutch": "nl",
+    "polish": "pl",
+    "pol": "pl",
+    "swedish": "sv",
+    "swe": "sv",
+    "danish": "da",
+    "norwegian": "no",
+    "finnish": "fi",
+    "hindi": "hi",
+    "chinese": "zh",
+    "mandarin": "zh",
+    "multi": "multi",
+    "dual": "multi",
+}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SUBTITLE_WORDS = {"sub", "subs", "subbed", "subtitle", "subtitles"}
+
+# markers that end the name of the show or movie in a release name, besides the year
+NAME_END_PATTERNS = (
+    SEASON_EPISODE_PATTERN,
+    SEASON_RANGE_PATTERN,
+    SEASON_PATTERN,
+    SEASON_WORD_PATTERN,
+    EPISODE_WORD_PATTERN,
+    CROSS_EPISODE_PATTERN,
+    COMPLETE_PATTERN,
+    RESOLUTION_PATTERN,
+)
+
+SUBTITLE_LANGUAGE_PATTERN = re.compile(
+    r"[. _-]([a-z]{2}(?:-[a-z]{2})?)(?:[. _-](?:forced|sdh|cc|hi))?\.(?:srt|ass|ssa|sub|vtt)$",
+    re.IGNORECASE,
+)
+
+
+class ParsedRelease(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    title: str
+    # the normalized name of the show or movie, the part of the release name before the season, year or resolution
+    name: str = ""
+    seasons: list[int] = []
+    episodes: list[int] = []
+    complete: bool = False
+    resolution: str | None = None
+    quality: Quality = Quality.unknown
+    source: str | None = None
+    codec: str | None = None
+    group: str | None = None
+    year: int | None = None
+    languages: list[str] = []
+    subtitles: list[str] = []
+
+
+def _number_range(first: int, last: int) -> list[int]:
+    if last < first or last - first > 100:
+        return [first]
+    return list(range(first, last + 1))
+
+
+def _parse_seasons_and_episodes(name: str) -> tuple[list[int], list[int]]:
+    match = SEASON_EPISODE_PATTERN.search(name)
+    if match:
+        first_episode = int(match.group(2))
+        more_episodes = [int(n) for n in re.findall(r"\d+", match.group(3))]
+        if not more_episodes:
+            episodes = [first_episode]
+        elif "-" in match.group(3) and len(more_episodes) == 1:
+            episodes = _number_range(first_episode, more_episodes[0])
+        else:
+            episodes = sorted({first_episode, *more_episodes})
+        return [int(match.group(1))], episodes
+
+    match = SEASON_RANGE_PATTERN.search(name)
+    if match:
+        return _number_range(int(match.group(1)), int(match.group(2))), []
+
+    seasons = [int(season) for season in SEASON_PATTERN.findall(name)]
+    if len(seasons) == 2:
+        # "Show S01 S03" is a pack of seasons 1 to 3
+        return _number_range(min(seasons), max(seasons)), []
+    if seasons:
+        return sorted(set(seasons)), []
+
+    match = SEASON_WORD_PATTERN.search(name)
+    if match:
+        first = int(match.group(1))
+        last = int(match.group(2)) if match.group(2) else first
+        episodes = [int(n) for n in EPISODE_WORD_PATTERN.findall(name)]
+        return _number_range(first, last), episodes
+
+    match = CROSS_EPISODE_PATTERN.search(name)
+    if match:
+        return [int(match.group(1))], [int(match.group(2))]
+
+    return [], []
+
+
+def _parse_ranked(
+    candidates: set[str], ranks: dict[str, int], names: list[tuple[str, set[str]]]
+) -> str | None:
+    """
+    :return: The name of the source or codec with the highest precedence among the candidate tokens.
+    """
+    best = min((ranks[token] for token in candidates & ranks.keys()), default=None)
+    return names[best][0] if best is not None else None
+
+
+def _parse_languages(tokens: list[str]) -> tuple[list[str], list[str]]:
+    """
+    :return: The languages of the audio and the languages of the subtitles.
+    """
+    languages: dict[str, None] = {}
+    subtitles: dict[str, None] = {}
+    subtitle_language_index = -1
+    for i, token in enumerate(tokens):
+        if token in SUBTITLE_WORDS:
+            # "English.Subs"
+            language = tokens[i - 1] if i > 0 else ""
+            subtitle_language_index = i - 1
+        elif token.endswith(("subs", "sub")) and token not in LANGUAGES:
+            # "NLSubs", "MULTiSUBS"
+            language = token.removesuffix("s").removesuffix("sub")
+        elif token == "vostfr":
+            language = "fr"
+        else:
+            continue
+        if language in LANGUAGES or (len(language) == 2 and language.isalpha()):
+            subtitles[LANGUAGES.get(language, language)] = None
+    for i, token in enumerate(tokens):
+        if token in LANGUAGES and i != subtitle_language_index:
+            languages[LANGUAGES[token]] = None
+    return list(languages), list(subtitles)
+
+
+def _parse_group(name: str) -> str | None:
+    match = LEADING_GROUP_PATTERN.search(name)
+    if match:
+        return match.group(1).strip()
+    match = GROUP_PATTERN.search(name)
+    if match and match.group(1).lower() not in NOT_GROUPS:
+        return match.group(1)
+    return None
+
+
+def _find_year(name: str) -> re.Match | None:
+    # a year at the very start is most likely part of the name, like in "1917.1080p.BluRay"
+    years = [match for match in YEAR_PATTERN.finditer(name) if match.start() > 0]
+    return years[-1] if years else None
+
+
+def _parse_name(name: str, year: re.Match | None) -> str:
+    leading_group = LEADING_GROUP_PATTERN.match(name)
+    start = leading_group.end() if leading_group else 0
+    end = len(name)
+    if year is not None and year.start() > start:
+        end = year.start()
+    for pattern in NAME_END_PATTERNS:
+        match = pattern.search(name, start, end)
+        if match:
+            end = match.start()
+    return normalize_name(name[start:end])
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes the name of a show or movie for comparing it with the names parsed from releases,
+    e.g. "Grey's Anatomy" and "Greys.Anatomy" are both normalized to "greys anatomy".
+
+    :param name: The name of the show or movie.
+    :return: The lowercased words of the name, without accents and punctuation, separated by single spaces.
+    """
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    name = name.lower().replace("'", "").replace("&", " and ")
+    return " ".join(TOKEN_PATTERN.findall(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_release(title: str) -> ParsedRelease:
+    """
+    Parses a release name, like the title of an indexer result or the name of a file in a torrent.
+
+    :param title: The release name.
+    :return: Everything that could be parsed from the release name.
+    """
+    name = FILE_EXTENSION_PATTERN.sub("", title.strip()).replace("_", " ")
+    lowercase_name = name.lower()
+
+    seasons, episodes = _parse_seasons_and_episodes(lowercase_name)
+
+    resolution = max(
+        {
+            RESOLUTIONS[resolution]
+            for resolution in RESOLUTION_PATTERN.findall(lowercase_name)
+        },
+        key=lambda r: int(r[:-1]),
+        default=None,
+    )
+    tokens = TOKEN_PATTERN.findall(lowercase_name)
+    languages, subtitles = _parse_languages(tokens)
+    # pairs of tokens are candidates as well, to find names like "WEB-DL" or "H.264"
+    candidates = {*tokens, *map(str.__add__, tokens, tokens[1:])}
+    year = _find_year(lowercase_name)
+
+    return ParsedRelease(
+        title=title,
+        name=_parse_name(lowercase_name, year=year),
+        seasons=seasons,
+        episodes=episodes,
+        complete=COMPLETE_PATTERN.search(lowercase_name) is not None,
+        resolution=resolution,
+        quality=RESOLUTION_QUALITIES.get(resolution, Quality.unknown),
+        source=_parse_ranked(candidates=candidates, ranks=SOURCE_RANKS, names=SOURCES),
+        codec=_parse_ranked(candidates=candidates, ranks=CODEC_RANKS, names=CODECS),
+        group=_parse_group(name),
+        year=int(year.group(1)) if year else None,
+        languages=languages,
+        subtitles=subtitles,
+    )
+
+
+def parse_many(titles: Iterable[str]) -> list[ParsedRelease]:
+    """
+    Parses many release names at once, names that occur more than once are only parsed once.
+
+    :param titles: The release names.
+    :return: The parsed releases, in the same order as the names.
+    """
+    return [parse_release(title) for title in titles]
+
+
+def parse_subtitle_language(file_name: str) -> str | None:
+    """
+    Extracts the language code of a subtitle file, like "en" of "Show.S01E01.en.srt".
+
+    :param file_name: The name of the subtitle file.
+    :return: The language code, or None if the file name doesn't contain one.
+    """
+    match = SUBTITLE_LANGUAGE_PATTERN.search(file_name)
+    return match.group(1).lower() if match else None
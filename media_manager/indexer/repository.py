@@ -2,6 +2,8 @@ import logging
 
 from sqlalchemy.orm import Session
 
+from media_manager.database import pipeline
+from media_manager.database.async_repository import AsyncRepository
 from media_manager.indexer.models import IndexerQueryResult
 from media_manager.indexer.schemas import (
     IndexerQueryResultId,
@@ -27,5 +29,29 @@ class IndexerRepository:
         )  # this is the needful, because sqlalchemy is too dumb to handle the HttpUrl type
 
         self.db.add(IndexerQueryResult(**result_data))
-        self.db.commit()
+        self.db.flush()
         return result
+
+    def save_results(
+        self, results: list[IndexerQueryResultSchema]
+    ) -> list[IndexerQueryResultSchema]:
+        """
+        Saves multiple results with a single flush.
+        """
+        with pipeline(self.db):
+            self.db.add_all(
+                IndexerQueryResult(
+                    **result.model_dump(), download_url=result.download_url
+                )
+                for result in results
+            )
+            self.db.flush()
+        return results
+
+
+class AsyncIndexerRepository(AsyncRepository[IndexerRepository]):
+    """
+    The methods of IndexerRepository, awaitable on an AsyncSession.
+    """
+
+    repository_class = IndexerRepository
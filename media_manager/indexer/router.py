@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, status
+
+from media_manager.auth.users import current_superuser
+from media_manager.indexer.dependencies import indexer_service_dep
+from media_manager.indexer.health import IndexerHealth
+
+router = APIRouter()
+
+
+@router.get(
+    "/health",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    response_model=list[IndexerHealth],
+)
+def get_indexer_health(indexer_service: indexer_service_dep):
+    """
+    Get the health of all configured indexers. Indexers whose circuit breaker is open are skipped by searches
+    until their cool-down is over.
+    """
+    return indexer_service.get_health()
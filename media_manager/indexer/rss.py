@@ -0,0 +1,185 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import TypeVar
+
+from media_manager.config import get_config
+from media_manager.database import get_session, unit_of_work
+from media_manager.database.replicas import get_read_session
+from media_manager.indexer.repository import IndexerRepository
+from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.indexer.service import IndexerService
+from media_manager.indexer.utils import evaluate_indexer_query_results
+from media_manager.indexer.wanted import wanted_index
+from media_manager.movies.repository import MovieRepository
+from media_manager.movies.service import MovieService
+from media_manager.scheduler.schemas import JobResult
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.service import TorrentService
+from media_manager.tv.repository import TvRepository
+from media_manager.tv.service import TvService
+
+log = logging.getLogger(__name__)
+
+# releases that were already matched, feeds mostly return the same releases as on the previous read
+MAX_SEEN_RELEASES = 20_000
+_seen_releases: OrderedDict[tuple[bool, str, str | None], None] = OrderedDict()
+_seen_releases_lock = threading.Lock()
+
+Request = TypeVar("Request")
+
+
+def get_new_releases(
+    releases: list[IndexerQueryResult], is_tv: bool
+) -> list[IndexerQueryResult]:
+    """
+    :param releases: The releases of the feeds.
+    :param is_tv: Whether the releases are from the TV or the movie feeds.
+    :return: The releases that were not returned by a previous read of the same feeds.
+    """
+    new_releases = []
+    with _seen_releases_lock:
+        for release in releases:
+            key = (is_tv, release.title, release.indexer)
+            if key in _seen_releases:
+                _seen_releases.move_to_end(key)
+                continue
+            _seen_releases[key] = None
+            new_releases.append(release)
+        while len(_seen_releases) > MAX_SEEN_RELEASES:
+            _seen_releases.popitem(last=False)
+    return new_releases
+
+
+def _group_by_request(
+    matches: list[tuple[Request, IndexerQueryResult]],
+) -> list[tuple[Request, list[IndexerQueryResult]]]:
+    groups: dict = {}
+    for request, release in matches:
+        # every request is scored on its own copy, as scores depend on the library of the show or movie
+        groups.setdefault(request.id, (request, []))[1].append(release.model_copy())
+    return list(groups.values())
+
+
+def watch_rss_feeds() -> JobResult:
+    """
+    Reads the RSS feeds of all indexers and downloads new releases that match an authorized season or movie request.
+    This is a standalone function as it creates its own DB session.
+    """
+    config = get_config().indexers.rss
+    if not config.enabled:
+        log.debug("Watching the RSS feeds is disabled")
+        return JobResult()
+
+    if wanted_index.needs_rebuild(max_age_seconds=config.index_rebuild_minutes * 60):
+        with next(get_read_session()) as read_db:
+            wanted_index.rebuild(
+                season_requests=TvRepository(db=read_db).get_season_requests(),
+                movie_requests=MovieRepository(db=read_db).get_movie_requests(),
+            )
+
+    with next(get_session()) as db:
+        tv_repository = TvRepository(db=db)
+        movie_repository = MovieRepository(db=db)
+        if not (
+            wanted_index.has_season_requests() or wanted_index.has_movie_requests()
+        ):
+            log.debug("No authorized requests, skipping the RSS feeds")
+            return JobResult()
+
+        torrent_service = TorrentService(torrent_repository=TorrentRepository(db=db))
+        indexer_service = IndexerService(indexer_repository=IndexerRepository(db=db))
+        tv_service = TvService(
+            tv_repository=tv_repository,
+            torrent_service=torrent_service,
+            indexer_service=indexer_service,
+        )
+        movie_service = MovieService(
+            movie_repository=movie_repository,
+            torrent_service=torrent_service,
+            indexer_service=indexer_service,
+        )
+        count = 0
+        failures = 0
+
+        if wanted_index.has_season_requests():
+            releases = get_new_releases(
+                indexer_service.fetch_recent(is_tv=True), is_tv=True
+            )
+            log.info(f"Found {len(releases)} new TV releases in the RSS feeds")
+            matches = [
+                (season_request, release)
+                for release in releases
+                for season_request in wanted_index.match_season_requests(
+                    release=release.release
+                )
+            ]
+            for season_request, candidates in _group_by_request(matches):
+                candidates = tv_service.get_torrents_matching_season_request(
+                    season_request=season_request,
+                    season=season_request.season,
+                    torrents=candidates,
+                )
+                candidates = evaluate_indexer_query_results(
+                    query_results=candidates, media=season_request.show, is_tv=True
+                )
+                if not candidates:
+                    continue
+                try:
+                    with unit_of_work(db):
+                        tv_service.download_season_request_torrent(
+                            season_request=season_request,
+                            season=season_request.season,
+                            indexer_result=candidates[0],
+                        )
+                    count += 1
+                    log.info(
+                        f"Downloading {candidates[0].title} from the RSS feeds for season request {season_request.id}"
+                    )
+                except Exception as e:
+                    failures += 1
+                    log.error(
+                        f"Failed to download {candidates[0].title} for season request {season_request.id}: {e}"
+                    )
+
+        if wanted_index.has_movie_requests():
+            releases = get_new_releases(
+                indexer_service.fetch_recent(is_tv=False), is_tv=False
+            )
+            log.info(f"Found {len(releases)} new movie releases in the RSS feeds")
+            matches = [
+                (movie_request, release)
+                for release in releases
+                for movie_request in wanted_index.match_movie_requests(
+                    release=release.release
+                )
+            ]
+            for movie_request, candidates in _group_by_request(matches):
+                candidates = movie_service.get_torrents_matching_movie_request(
+                    movie_request=movie_request,
+                    movie=movie_request.movie,
+                    torrents=candidates,
+                )
+                candidates = evaluate_indexer_query_results(
+                    query_results=candidates, media=movie_request.movie, is_tv=False
+                )
+                if not candidates:
+                    continue
+                try:
+                    with unit_of_work(db):
+                        movie_service.download_movie_request_torrent(
+                            movie_request=movie_request,
+                            movie=movie_request.movie,
+                            indexer_result=candidates[0],
+                        )
+                    count += 1
+                    log.info(
+                        f"Downloading {candidates[0].title} from the RSS feeds for movie request {movie_request.id}"
+                    )
+                except Exception as e:
+                    failures += 1
+                    log.error(
+                        f"Failed to download {candidates[0].title} for movie request {movie_request.id}: {e}"
+                    )
+
+        return JobResult(items_processed=count, failures=failures)
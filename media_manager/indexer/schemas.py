@@ -1,10 +1,10 @@
-import re
 import typing
 from uuid import UUID, uuid4
 
 import pydantic
-from pydantic import BaseModel, computed_field, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 
+from media_manager.indexer.release_parser import ParsedRelease, parse_release
 from media_manager.torrent.models import Quality
 
 IndexerQueryResultId = typing.NewType("IndexerQueryResultId", UUID)
@@ -30,64 +30,60 @@ class IndexerQueryResult(BaseModel):
 
     indexer: str | None
 
-    @computed_field(return_type=Quality)
-    @property
-    def quality(self) -> Quality:
-        high_quality_pattern = r"\b(4k)\b"
-        medium_quality_pattern = r"\b(1080p)\b"
-        low_quality_pattern = r"\b(720p)\b"
-        very_low_quality_pattern = r"\b(480p|360p)\b"
-
-        if re.search(high_quality_pattern, self.title, re.IGNORECASE):
-            return Quality.uhd
-        elif re.search(medium_quality_pattern, self.title, re.IGNORECASE):
-            return Quality.fullhd
-        elif re.search(low_quality_pattern, self.title, re.IGNORECASE):
-            return Quality.hd
-        elif re.search(very_low_quality_pattern, self.title, re.IGNORECASE):
-            return Quality.sd
-
-        return Quality.unknown
-
-    @computed_field(return_type=list[int])
+    # parsed from the title once when the result is created, results loaded from the database keep the stored values
+    quality: Quality = Quality.unknown
+    season: list[int] = []
+
+    @model_validator(mode="before")
+    @classmethod
+    def parse_title(cls, data: typing.Any) -> typing.Any:
+        if isinstance(data, dict) and "title" in data:
+            release = parse_release(data["title"])
+            data = {"quality": release.quality, "season": release.seasons, **data}
+        return data
+
     @property
-    def season(self) -> list[int]:
-        pattern = r"\b[sS](\d+)\b"
-        matches = re.findall(pattern, self.title, re.IGNORECASE)
-        if matches.__len__() == 2:
-            result = []
-            for i in range(int(matches[0]), int(matches[1]) + 1):
-                result.append(i)
-        elif matches.__len__() == 1:
-            result = [int(matches[0])]
-        else:
-            result = []
-        return result
+    def release(self) -> ParsedRelease:
+        return parse_release(self.title)
+
+    def sort_key(self) -> tuple[int, int, bool, int, int]:
+        """
+        Key for sorting results from worst to best: better quality, then higher score, then usenet over torrents,
+        then more seeders (torrents) or older age (usenet), then smaller size.
+        """
+        return (
+            -self.quality.value,
+            self.score,
+            self.usenet,
+            self.age if self.usenet else self.seeders,
+            -self.size,
+        )
 
     def __gt__(self, other) -> bool:
-        if self.quality.value != other.quality.value:
-            return self.quality.value < other.quality.value
-        if self.score != other.score:
-            return self.score > other.score
-        if self.usenet != other.usenet:
-            return self.usenet
-        if self.usenet and other.usenet:
-            return self.age > other.age
-        if not self.usenet and not other.usenet:
-            return self.seeders > other.seeders
-
-        return self.size < other.size
+        return self.sort_key() > other.sort_key()
 
     def __lt__(self, other) -> bool:
-        if self.quality.value != other.quality.value:
-            return self.quality.value > other.quality.value
-        if self.score != other.score:
-            return self.score < other.score
-        if self.usenet != other.usenet:
-            return not self.usenet
-        if self.usenet and other.usenet:
-            return self.age < other.age
-        if not self.usenet and not other.usenet:
-            return self.seeders < other.seeders
-
-        return self.size > other.size
+        return self.sort_key() < other.sort_key()
+
+
+class IndexerSearchParameters(BaseModel):
+    """
+    What a search is looking for, so indexers that support it can search by ID instead of by a free-text query.
+    """
+
+    is_tv: bool
+    season: int | None = None
+    episode: int | None = None
+    tvdb_id: int | None = None
+    tmdb_id: int | None = None
+
+
+class IndexerSearchProgress(BaseModel):
+    """
+    The outcome of searching a single indexer, as part of a search streamed to the client.
+    """
+
+    indexer: str
+    failed: bool = False
+    # only the results that no indexer returned before during the same search
+    results: list[IndexerQueryResult] = []
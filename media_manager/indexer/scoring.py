@@ -0,0 +1,213 @@
+import logging
+import re
+from typing import Iterable, NamedTuple
+
+from media_manager.config import get_config
+from media_manager.indexer.config import IndexerConfig
+from media_manager.indexer.schemas import IndexerQueryResult
+
+log = logging.getLogger(__name__)
+
+
+class CompiledTitleRule(NamedTuple):
+    name: str
+    keyword_ids: frozenset[int]
+    always_matches: bool
+    score_modifier: int
+    negate: bool
+
+
+class CompiledFlagRule(NamedTuple):
+    name: str
+    flags: frozenset[str]
+    score_modifier: int
+    negate: bool
+
+
+class CompiledRuleSet(NamedTuple):
+    name: str
+    libraries: frozenset[str]
+    title_rules: tuple[CompiledTitleRule, ...]
+    flag_rules: tuple[CompiledFlagRule, ...]
+
+    def applies_to(self, library: str, is_tv: bool) -> bool:
+        return (
+            library in self.libraries
+            or ("ALL_TV" in self.libraries and is_tv)
+            or ("ALL_MOVIES" in self.libraries and not is_tv)
+        )
+
+
+def _overlaps(keyword: str, other: str) -> bool:
+    """
+    Checks whether the end of a keyword can be the start of another keyword, like "x26" and "264" in "x264".
+    """
+    return any(
+        other.startswith(keyword[i:]) and len(other) > len(keyword) - i
+        for i in range(1, len(keyword))
+    )
+
+
+class ScoringEngine:
+    """
+    The scoring rules and rulesets of an IndexerConfig, compiled for scoring many results at once.
+
+    All keywords of all title rules are matched by a single regex, so every title is only lowercased
+    and scanned once, no matter how many rules and rulesets apply to it.
+    """
+
+    def __init__(self, config: IndexerConfig):
+        keywords: dict[str, int] = {}
+        for rule in config.title_scoring_rules:
+            for keyword in rule.keywords:
+                if keyword:
+                    keywords.setdefault(keyword.lower(), len(keywords))
+
+        # Matches of the regex never overlap, so a match also stands for all keywords it contains,
+        # and keywords that start inside it but end after it have to be looked for separately.
+        self._implied_keyword_ids: dict[str, frozenset[int]] = {}
+        self._overlapping_keywords: dict[str, tuple[tuple[str, int], ...]] = {}
+        for keyword in keywords:
+            self._implied_keyword_ids[keyword] = frozenset(
+                keyword_id for other, keyword_id in keywords.items() if other in keyword
+            )
+            self._overlapping_keywords[keyword] = tuple(
+                (other, keyword_id)
+                for other, keyword_id in keywords.items()
+                if other != keyword and _overlaps(keyword=keyword, other=other)
+            )
+        self._keyword_pattern: re.Pattern | None = None
+        if keywords:
+            self._keyword_pattern = re.compile(
+                "|".join(
+                    re.escape(keyword)
+                    for keyword in sorted(keywords, key=len, reverse=True)
+                )
+            )
+
+        title_rules: dict[str, list[CompiledTitleRule]] = {}
+        for rule in config.title_scoring_rules:
+            title_rules.setdefault(rule.name, []).append(
+                CompiledTitleRule(
+                    name=rule.name,
+                    keyword_ids=frozenset(
+                        keywords[keyword.lower()]
+                        for keyword in rule.keywords
+                        if keyword
+                    ),
+                    always_matches="" in rule.keywords,
+                    score_modifier=rule.score_modifier,
+                    negate=rule.negate,
+                )
+            )
+        flag_rules: dict[str, list[CompiledFlagRule]] = {}
+        for rule in config.indexer_flag_scoring_rules:
+            flag_rules.setdefault(rule.name, []).append(
+                CompiledFlagRule(
+                    name=rule.name,
+                    flags=frozenset(rule.flags),
+                    score_modifier=rule.score_modifier,
+                    negate=rule.negate,
+                )
+            )
+
+        self.rule_sets: tuple[CompiledRuleSet, ...] = tuple(
+            CompiledRuleSet(
+                name=rule_set.name,
+                libraries=frozenset(rule_set.libraries),
+                title_rules=tuple(
+                    rule
+                    for rule_name in rule_set.rule_names
+                    for rule in title_rules.get(rule_name, [])
+                ),
+                flag_rules=tuple(
+                    rule
+                    for rule_name in rule_set.rule_names
+                    for rule in flag_rules.get(rule_name, [])
+                ),
+            )
+            for rule_set in config.scoring_rule_sets
+        )
+
+    def matching_keyword_ids(self, title: str) -> set[int]:
+        """
+        Finds all keywords that occur in a title, ignoring case.
+
+        :param title: The title to search.
+        :return: The ids of all keywords that occur in the title.
+        """
+        if self._keyword_pattern is None:
+            return set()
+        title = title.lower()
+        keyword_ids: set[int] = set()
+        for keyword in self._keyword_pattern.findall(title):
+            keyword_ids.update(self._implied_keyword_ids[keyword])
+            for other, keyword_id in self._overlapping_keywords[keyword]:
+                if keyword_id not in keyword_ids and other in title:
+                    keyword_ids.add(keyword_id)
+        return keyword_ids
+
+    def get_rule_sets(self, library: str, is_tv: bool) -> list[CompiledRuleSet]:
+        return [
+            rule_set
+            for rule_set in self.rule_sets
+            if rule_set.applies_to(library=library, is_tv=is_tv)
+        ]
+
+    def score(
+        self, query_results: Iterable[IndexerQueryResult], library: str, is_tv: bool
+    ) -> None:
+        """
+        Adds the score modifiers of all matching rules to the score of each result.
+
+        :param query_results: The results to score, their score is updated in place.
+        :param library: The library of the show or movie the results are for.
+        :param is_tv: Whether the results are for a show.
+        """
+        rule_sets = self.get_rule_sets(library=library, is_tv=is_tv)
+        if not rule_sets:
+            return
+        title_rules = [rule for rule_set in rule_sets for rule in rule_set.title_rules]
+        flag_rules = [rule for rule_set in rule_sets for rule in rule_set.flag_rules]
+
+        # Results of a search tend to share keywords and flags, so each combination is only scored once.
+        title_scores: dict[frozenset[int], int] = {}
+        flag_scores: dict[frozenset[str], int] = {}
+        for result in query_results:
+            keyword_ids = frozenset(self.matching_keyword_ids(result.title))
+            title_score = title_scores.get(keyword_ids)
+            if title_score is None:
+                title_score = title_scores[keyword_ids] = sum(
+                    rule.score_modifier
+                    for rule in title_rules
+                    if (
+                        rule.always_matches
+                        or not rule.keyword_ids.isdisjoint(keyword_ids)
+                    )
+                    != rule.negate
+                )
+            flags = frozenset(result.flags)
+            flag_score = flag_scores.get(flags)
+            if flag_score is None:
+                flag_score = flag_scores[flags] = sum(
+                    rule.score_modifier
+                    for rule in flag_rules
+                    if (not rule.flags.isdisjoint(flags)) != rule.negate
+                )
+            result.score += title_score + flag_score
+
+
+_engine: tuple[IndexerConfig, ScoringEngine] | None = None
+
+
+def get_scoring_engine() -> ScoringEngine:
+    """
+    Returns the scoring engine of the current config, it is only compiled again once the config changes.
+    """
+    global _engine
+    config = get_config().indexers
+    engine = _engine
+    if engine is None or engine[0] is not config:
+        engine = (config, ScoringEngine(config=config))
+        _engine = engine
+    return engine[1]
@@ -1,19 +1,62 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, Iterator, NamedTuple
 
-from media_manager.config import AllEncompassingConfig
+from prometheus_client import Histogram
+
+from media_manager.config import get_config
+from media_manager.database import unit_of_work
+from media_manager.exceptions import IndexerUnavailableError
+from media_manager.indexer.health import (
+    CircuitState,
+    IndexerHealth,
+    get_circuit_breaker,
+)
 from media_manager.indexer.indexers.generic import GenericIndexer
 from media_manager.indexer.indexers.jackett import Jackett
 from media_manager.indexer.indexers.prowlarr import Prowlarr
-from media_manager.indexer.schemas import IndexerQueryResultId, IndexerQueryResult
+from media_manager.indexer.indexers.torznab import Torznab
+from media_manager.indexer.schemas import (
+    IndexerQueryResultId,
+    IndexerQueryResult,
+    IndexerSearchParameters,
+    IndexerSearchProgress,
+)
 from media_manager.indexer.repository import IndexerRepository
+from media_manager.indexer.utils import (
+    IndexerQueryResultDeduplicator,
+    deduplicate_indexer_query_results,
+)
 from media_manager.notification.manager import notification_manager
 
 log = logging.getLogger(__name__)
 
+indexer_search_duration_seconds = Histogram(
+    "mediamanager_indexer_search_duration_seconds",
+    "Duration of indexer searches",
+    ["indexer", "status"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120),
+)
+indexer_search_results = Histogram(
+    "mediamanager_indexer_search_results",
+    "Number of results returned per indexer search",
+    ["indexer"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+
+class _SearchOutcome(NamedTuple):
+    indexer: GenericIndexer
+    query: str | None
+    results: list[IndexerQueryResult]
+    error: Exception | None
+
 
 class IndexerService:
     def __init__(self, indexer_repository: IndexerRepository):
-        config = AllEncompassingConfig()
+        config = get_config()
         self.repository = indexer_repository
         self.indexers: list[GenericIndexer] = []
 
@@ -21,6 +64,9 @@ class IndexerService:
             self.indexers.append(Prowlarr())
         if config.indexers.jackett.enabled:
             self.indexers.append(Jackett())
+        for torznab_config in config.indexers.torznab:
+            if torznab_config.enabled:
+                self.indexers.append(Torznab(config=torznab_config))
 
     def get_result(self, result_id: IndexerQueryResultId) -> IndexerQueryResult:
         return self.repository.get_result(result_id=result_id)
@@ -31,41 +77,240 @@ class IndexerService:
 
         :param is_tv: Whether the search is for TV shows or movies.
         :param query: The search query.
-        :param db: The database session.
         :return: A list of search results.
         """
-        log.debug(f"Searching for: {query}")
-        results = []
-        failed_indexers = []
+        return self.search_variants(queries=[query], is_tv=is_tv)
+
+    def search_variants(
+        self,
+        queries: list[str],
+        is_tv: bool,
+        parameters: IndexerSearchParameters | None = None,
+    ) -> list[IndexerQueryResult]:
+        """
+        Search all indexers for all variants of a query at once, e.g. "show s03" and "show season 3".
+        Results returned by multiple indexers or for multiple variants are only saved and returned once.
+
+        :param is_tv: Whether the search is for TV shows or movies.
+        :param queries: The variants of the search query.
+        :param parameters: What is being searched for, indexers that can search by ID do so instead of
+            searching for the queries.
+        :return: A list of deduplicated search results.
+        """
+        log.debug(f"Searching for: {queries}")
+        results: list[IndexerQueryResult] = []
+        answered_indexers = 0
+        for outcome in self._run_searches(
+            queries=queries, is_tv=is_tv, parameters=parameters
+        ):
+            if outcome.error is None:
+                results.extend(outcome.results)
+                answered_indexers += 1
+
+        # Send notification if no results found from any indexer, failing indexers are notified about by their
+        # circuit breaker instead
+        if not results and answered_indexers and notification_manager.is_configured():
+            queries_text = "', '".join(queries)
+            notification_manager.send_notification(
+                title="No Search Results",
+                message=f"No torrents found for query '{queries_text}' from any configured indexer. Consider checking the search terms or indexer availability.",
+            )
+
+        unique_results = deduplicate_indexer_query_results(query_results=results)
+        log.debug(
+            f"Found {len(unique_results)} unique results out of {len(results)} results for {queries}"
+        )
+        self.repository.save_results(results=unique_results)
+
+        return unique_results
+
+    def search_variants_iter(
+        self,
+        queries: list[str],
+        is_tv: bool,
+        parameters: IndexerSearchParameters | None = None,
+    ) -> Iterator[IndexerSearchProgress]:
+        """
+        Like search_variants, but yields the results of every indexer as soon as it responds,
+        instead of waiting for the slowest one.
+        Results that an earlier indexer already returned are left out, so the first copy of a release wins,
+        not the one with the most seeders. The results are saved before they are yielded.
+
+        :param is_tv: Whether the search is for TV shows or movies.
+        :param queries: The variants of the search query.
+        :param parameters: What is being searched for, see search_variants.
+        :return: The outcome of every search of an indexer, in the order they finish.
+        """
+        log.debug(f"Streaming search for: {queries}")
+        deduplicator = IndexerQueryResultDeduplicator()
+        for outcome in self._run_searches(
+            queries=queries, is_tv=is_tv, parameters=parameters
+        ):
+            if outcome.error is not None:
+                yield IndexerSearchProgress(indexer=outcome.indexer.name, failed=True)
+                continue
+            new_results = [
+                result for result in outcome.results if deduplicator.add(result)
+            ]
+            # streamed responses outlive the session dependency, which has committed by then
+            with unit_of_work(self.repository.db):
+                self.repository.save_results(results=new_results)
+            yield IndexerSearchProgress(
+                indexer=outcome.indexer.name, results=new_results
+            )
 
+    def _run_searches(
+        self,
+        queries: list[str],
+        is_tv: bool,
+        parameters: IndexerSearchParameters | None,
+    ) -> Iterator[_SearchOutcome]:
+        """
+        Searches all indexers concurrently and yields the outcome of each search as soon as it finishes.
+        Indexers that can search by ID are searched once, the others once per query.
+        Pending searches are cancelled if the caller stops iterating.
+        """
+        # a query of None stands for a search by ID
+        searches: list[tuple[GenericIndexer, str | None]] = []
         for indexer in self.indexers:
-            try:
-                indexer_results = indexer.search(query, is_tv=is_tv)
-                results.extend(indexer_results)
-                log.debug(
-                    f"Indexer {indexer.__class__.__name__} returned {len(indexer_results)} results for query: {query}"
+            if get_circuit_breaker(indexer=indexer.name).is_open():
+                log.info(f"Skipping indexer {indexer.name}, it failed repeatedly")
+            elif parameters is not None and indexer.supports_id_search(parameters):
+                searches.append((indexer, None))
+            else:
+                searches.extend((indexer, query) for query in queries)
+        if not searches:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=len(searches))
+        try:
+            futures = {
+                executor.submit(
+                    self._search_indexer, indexer, query, is_tv, parameters
+                ): (indexer, query)
+                for indexer, query in searches
+            }
+            for future in as_completed(futures):
+                indexer, query = futures[future]
+                try:
+                    outcome = _SearchOutcome(indexer, query, future.result(), None)
+                except IndexerUnavailableError as e:
+                    log.info(e)
+                    outcome = _SearchOutcome(indexer, query, [], e)
+                except Exception as e:
+                    log.error(
+                        f"Indexer {indexer.__class__.__name__} failed for query '{query or parameters}': {e}"
+                    )
+                    outcome = _SearchOutcome(indexer, query, [], e)
+                yield outcome
+        finally:
+            # searches that are already running can't be interrupted, they finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def fetch_recent(self, is_tv: bool) -> list[IndexerQueryResult]:
+        """
+        Fetches the most recent releases of all indexers, i.e. their RSS feeds.
+        Unlike search results, the releases are not saved.
+
+        :param is_tv: Whether to fetch TV shows or movies.
+        :return: A list of deduplicated releases.
+        """
+        results: list[IndexerQueryResult] = []
+        if not self.indexers:
+            return results
+        with ThreadPoolExecutor(max_workers=len(self.indexers)) as executor:
+            futures = {
+                executor.submit(
+                    self._call_indexer, indexer, partial(indexer.fetch_recent, is_tv)
+                ): indexer
+                for indexer in self.indexers
+            }
+            for future in as_completed(futures):
+                indexer = futures[future]
+                try:
+                    results.extend(future.result())
+                except IndexerUnavailableError as e:
+                    log.info(e)
+                except Exception as e:
+                    log.error(
+                        f"Indexer {indexer.__class__.__name__} failed to fetch recent releases: {e}"
+                    )
+        return deduplicate_indexer_query_results(query_results=results)
+
+    def _search_indexer(
+        self,
+        indexer: GenericIndexer,
+        query: str | None,
+        is_tv: bool,
+        parameters: IndexerSearchParameters | None = None,
+    ) -> list[IndexerQueryResult]:
+        indexer_name = indexer.__class__.__name__
+        start = time.perf_counter()
+        try:
+            if query is None:
+                indexer_results = self._call_indexer(
+                    indexer, lambda: indexer.search_by_id(parameters)
                 )
-            except Exception as e:
-                failed_indexers.append(indexer.__class__.__name__)
-                log.error(
-                    f"Indexer {indexer.__class__.__name__} failed for query '{query}': {e}"
+            else:
+                indexer_results = self._call_indexer(
+                    indexer, lambda: indexer.search(query, is_tv=is_tv)
                 )
-
-        # Send notification if indexers failed
-        if failed_indexers and notification_manager.is_configured():
-            notification_manager.send_notification(
-                title="Indexer Failure",
-                message=f"The following indexers failed for query '{query}': {', '.join(failed_indexers)}. Check indexer configuration and connectivity.",
+        except IndexerUnavailableError:
+            raise
+        except Exception:
+            indexer_search_duration_seconds.labels(indexer_name, "error").observe(
+                time.perf_counter() - start
             )
+            raise
+        indexer_search_duration_seconds.labels(indexer_name, "success").observe(
+            time.perf_counter() - start
+        )
+        indexer_search_results.labels(indexer_name).observe(len(indexer_results))
+        log.debug(
+            f"Indexer {indexer_name} returned {len(indexer_results)} results for query: {query or parameters}"
+        )
+        return indexer_results
+
+    def _call_indexer(
+        self,
+        indexer: GenericIndexer,
+        call: Callable[[], list[IndexerQueryResult]],
+    ) -> list[IndexerQueryResult]:
+        """
+        Sends a request to an indexer through its circuit breaker.
 
-        # Send notification if no results found from any indexer
-        if not results and notification_manager.is_configured():
+        :param indexer: The indexer.
+        :param call: Sends the request.
+        :raises IndexerUnavailableError: If the indexer is skipped, because it failed repeatedly.
+        """
+        circuit_breaker = get_circuit_breaker(indexer=indexer.name)
+        if not circuit_breaker.allow_request():
+            raise IndexerUnavailableError(
+                f"Skipping indexer {indexer.name}, it failed repeatedly"
+            )
+        try:
+            indexer_results = call()
+        except Exception as e:
+            state = circuit_breaker.record_failure(error=f"{e.__class__.__name__}: {e}")
+            if state == CircuitState.open and notification_manager.is_configured():
+                notification_manager.send_notification(
+                    title="Indexer Failure",
+                    message=f"Indexer {indexer.name} failed {circuit_breaker.consecutive_failures} times in a row and is skipped for {circuit_breaker.cooldown_seconds:.0f} seconds. Last error: {circuit_breaker.last_error}. Check indexer configuration and connectivity.",
+                )
+            raise
+        state = circuit_breaker.record_success()
+        if state == CircuitState.closed and notification_manager.is_configured():
             notification_manager.send_notification(
-                title="No Search Results",
-                message=f"No torrents found for query '{query}' from any configured indexer. Consider checking the search terms or indexer availability.",
+                title="Indexer Recovered",
+                message=f"Indexer {indexer.name} is working again.",
             )
+        return indexer_results
 
-        for result in results:
-            self.repository.save_result(result=result)
-
-        return results
+    def get_health(self) -> list[IndexerHealth]:
+        """
+        Returns the health of all configured indexers.
+        """
+        return [
+            get_circuit_breaker(indexer=indexer.name).get_health()
+            for indexer in self.indexers
+        ]
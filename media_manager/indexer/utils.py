@@ -1,117 +1,118 @@
+import base64
 import logging
+import re
+from typing import Iterator
 from urllib.parse import urljoin
 
 import requests
+from pydantic import TypeAdapter
 
-from media_manager.config import AllEncompassingConfig
-from media_manager.indexer.config import ScoringRuleSet
-from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.indexer.schemas import IndexerQueryResult, IndexerSearchProgress
+from media_manager.indexer.scoring import get_scoring_engine
 from media_manager.movies.schemas import Movie
+from media_manager.sse import format_event
 from media_manager.tv.schemas import Show
 
 log = logging.getLogger(__name__)
 
+indexer_query_results_adapter = TypeAdapter(list[IndexerQueryResult])
 
-def evaluate_indexer_query_result(
-    query_result: IndexerQueryResult, ruleset: ScoringRuleSet
-) -> (IndexerQueryResult, bool):
-    title_rules = AllEncompassingConfig().indexers.title_scoring_rules
-    indexer_flag_rules = AllEncompassingConfig().indexers.indexer_flag_scoring_rules
-    for rule_name in ruleset.rule_names:
-        for rule in title_rules:
-            if rule.name == rule_name:
-                log.debug(f"Applying rule {rule.name} to {query_result.title}")
-                if (
-                    any(
-                        keyword.lower() in query_result.title.lower()
-                        for keyword in rule.keywords
-                    )
-                    and not rule.negate
-                ):
-                    log.debug(
-                        f"Rule {rule.name} with keywords {rule.keywords} matched for {query_result.title}"
-                    )
-                    query_result.score += rule.score_modifier
-                elif (
-                    not any(
-                        keyword.lower() in query_result.title.lower()
-                        for keyword in rule.keywords
-                    )
-                    and rule.negate
-                ):
-                    log.debug(
-                        f"Negated rule {rule.name} with keywords {rule.keywords} matched for {query_result.title}"
-                    )
-                    query_result.score += rule.score_modifier
-                else:
-                    log.debug(
-                        f"Rule {rule.name} with keywords {rule.keywords} did not match for {query_result.title}"
-                    )
-        for rule in indexer_flag_rules:
-            if rule.name == rule_name:
-                log.debug(f"Applying rule {rule.name} to {query_result.title}")
-                if (
-                    any(flag in query_result.flags for flag in rule.flags)
-                    and not rule.negate
-                ):
-                    log.debug(
-                        f"Rule {rule.name} with flags {rule.flags} matched for {query_result.title} with flags {query_result.flags}"
-                    )
-                    query_result.score += rule.score_modifier
-                elif (
-                    not any(flag in query_result.flags for flag in rule.flags)
-                    and rule.negate
-                ):
-                    log.debug(
-                        f"Negated rule {rule.name} with flags {rule.flags} matched for {query_result.title} with flags {query_result.flags}"
-                    )
-                    query_result.score += rule.score_modifier
-                else:
-                    log.debug(
-                        f"Rule {rule.name} with flags {rule.flags} did not match for {query_result.title} with flags {query_result.flags}"
-                    )
-    if query_result.score <= 0:
-        return query_result, False
-
-    return query_result, True
+INFO_HASH_PATTERN = re.compile(
+    r"xt=urn:btih:([0-9a-f]{40}|[a-z2-7]{32})(?![0-9a-z])", re.IGNORECASE
+)
+NON_ALPHANUMERIC_PATTERN = re.compile(r"[^0-9a-z]+")
 
 
 def evaluate_indexer_query_results(
     query_results: list[IndexerQueryResult], media: Show | Movie, is_tv: bool
 ) -> list[IndexerQueryResult]:
-    scoring_rulesets: list[ScoringRuleSet] = (
-        AllEncompassingConfig().indexers.scoring_rule_sets
+    log.debug(
+        f"Scoring {len(query_results)} indexer query results for {media.name} ({media.year})"
+    )
+    get_scoring_engine().score(
+        query_results=query_results, library=media.library, is_tv=is_tv
     )
-    for ruleset in scoring_rulesets:
-        if (
-            (media.library in ruleset.libraries)
-            or ("ALL_TV" in ruleset.libraries and is_tv)
-            or ("ALL_MOVIES" in ruleset.libraries and not is_tv)
-        ):
-            log.debug(
-                f"Applying scoring ruleset {ruleset.name} for {media.name} ({media.year})"
-            )
-            for result in query_results:
-                log.debug(
-                    f"Applying scoring ruleset {ruleset.name} for IndexerQueryResult {result.title} for {media.name} ({media.year})"
-                )
-                result, passed = evaluate_indexer_query_result(
-                    query_result=result, ruleset=ruleset
-                )
-                if not passed:
-                    log.debug(
-                        f"Indexer query result {result.title} did not pass scoring ruleset {ruleset.name} with score {result.score}, removing from results."
-                    )
-                else:
-                    log.debug(
-                        f"Indexer query result {result.title} passed scoring ruleset {ruleset.name} with score {result.score}."
-                    )
 
     query_results = [result for result in query_results if result.score >= 0]
-    query_results.sort(reverse=True)
+    query_results.sort(key=IndexerQueryResult.sort_key, reverse=True)
     return query_results
 
 
+def get_info_hash(download_url: str) -> str | None:
+    """
+    Extracts the info hash of a magnet link.
+
+    :param download_url: The download URL of an indexer query result.
+    :return: The info hash as uppercase hex, or None if the URL is not a magnet link with an info hash.
+    """
+    if not download_url.startswith("magnet:"):
+        return None
+    match = INFO_HASH_PATTERN.search(download_url)
+    if match is None:
+        return None
+    info_hash = match.group(1)
+    if len(info_hash) == 32:
+        info_hash = base64.b32decode(info_hash.upper()).hex()
+    return info_hash.upper()
+
+
+class IndexerQueryResultDeduplicator:
+    """
+    Deduplicates results as they arrive. Results are the same release if they have the same info hash,
+    or the same title (ignoring case and punctuation) and size. Of each release the copy with the most seeders is kept.
+    """
+
+    def __init__(self):
+        self._unique_results: dict[tuple, IndexerQueryResult] = {}
+        self._keys_by_info_hash: dict[str, tuple] = {}
+
+    def add(self, result: IndexerQueryResult) -> bool:
+        """
+        :param result: The result to add.
+        :return: Whether the result is a release that wasn't added before.
+        """
+        key = (
+            result.usenet,
+            NON_ALPHANUMERIC_PATTERN.sub(" ", result.title.lower()).strip(),
+            result.size,
+        )
+        info_hash = get_info_hash(result.download_url)
+        if info_hash is not None:
+            key = self._keys_by_info_hash.setdefault(info_hash, key)
+
+        existing = self._unique_results.get(key)
+        if existing is None:
+            self._unique_results[key] = result
+            return True
+        if result.seeders > existing.seeders:
+            # replace the copy, but keep the position of the first occurrence
+            self._unique_results[key] = result
+        return False
+
+    @property
+    def results(self) -> list[IndexerQueryResult]:
+        """
+        The deduplicated results, in the order of their first occurrence.
+        """
+        return list(self._unique_results.values())
+
+
+def deduplicate_indexer_query_results(
+    query_results: list[IndexerQueryResult],
+) -> list[IndexerQueryResult]:
+    """
+    Removes results that are the same release, e.g. because multiple trackers or query variants returned it.
+    Of each release the copy with the most seeders is kept.
+
+    :param query_results: The results to deduplicate.
+    :return: The deduplicated results, in the order of their first occurrence.
+    """
+    deduplicator = IndexerQueryResultDeduplicator()
+    for result in query_results:
+        deduplicator.add(result)
+    return deduplicator.results
+
+
 def follow_redirects_to_final_torrent_url(
     initial_url: str, session: requests.Session, timeout: float = 10
 ) -> str:
@@ -150,3 +151,20 @@ def follow_redirects_to_final_torrent_url(
         raise RuntimeError(f"An error occurred during the request: {e}") from e
 
     return current_url
+
+
+def stream_search_events(progress: Iterator[IndexerSearchProgress]) -> Iterator[str]:
+    """
+    Turns the progress of a search into server-sent events: a "results" event per indexer search as soon as it
+    finishes, then a "done" event with all results, ranked best first.
+
+    :param progress: The progress of the search.
+    """
+    results: list[IndexerQueryResult] = []
+    for indexer_progress in progress:
+        results.extend(indexer_progress.results)
+        yield format_event(event="results", data=indexer_progress.model_dump_json())
+    results.sort(key=IndexerQueryResult.sort_key, reverse=True)
+    yield format_event(
+        event="done", data=indexer_query_results_adapter.dump_json(results).decode()
+    )
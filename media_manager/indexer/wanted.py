@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+from uuid import UUID
+
+from media_manager.indexer.release_parser import ParsedRelease, normalize_name
+from media_manager.movies.schemas import RichMovieRequest
+from media_manager.tv.schemas import RichSeasonRequest
+
+log = logging.getLogger(__name__)
+
+
+class WantedIndex:
+    """
+    The authorized season and movie requests, indexed by the normalized name of their show or movie,
+    so every release of an RSS feed is matched against all requests with a single lookup.
+
+    It is rebuilt from the database periodically and kept up to date in between by the TV and movie services,
+    requests changed by other processes are picked up by the next rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._season_requests: dict[str, dict[UUID, RichSeasonRequest]] = {}
+        self._movie_requests: dict[str, dict[UUID, RichMovieRequest]] = {}
+        # the key each request is indexed by, to remove it without knowing its show or movie
+        self._keys: dict[UUID, str] = {}
+        self._built_at: float | None = None
+
+    def needs_rebuild(self, max_age_seconds: float) -> bool:
+        built_at = self._built_at
+        return built_at is None or time.monotonic() - built_at > max_age_seconds
+
+    def rebuild(
+        self,
+        season_requests: list[RichSeasonRequest],
+        movie_requests: list[RichMovieRequest],
+    ) -> None:
+        """
+        Replaces the whole index, unauthorized requests are left out.
+
+        :param season_requests: All season requests.
+        :param movie_requests: All movie requests.
+        """
+        seasons: dict[str, dict[UUID, RichSeasonRequest]] = {}
+        movies: dict[str, dict[UUID, RichMovieRequest]] = {}
+        keys: dict[UUID, str] = {}
+        for season_request in season_requests:
+            if season_request.authorized:
+                key = normalize_name(season_request.show.name)
+                seasons.setdefault(key, {})[season_request.id] = season_request
+                keys[season_request.id] = key
+        for movie_request in movie_requests:
+            if movie_request.authorized:
+                key = normalize_name(movie_request.movie.name)
+                movies.setdefault(key, {})[movie_request.id] = movie_request
+                keys[movie_request.id] = key
+        with self._lock:
+            self._season_requests = seasons
+            self._movie_requests = movies
+            self._keys = keys
+            self._built_at = time.monotonic()
+        log.info(
+            f"Indexed {sum(map(len, seasons.values()))} wanted seasons and {sum(map(len, movies.values()))} wanted movies"
+        )
+
+    def add_season_request(self, season_request: RichSeasonRequest) -> None:
+        """
+        Adds or replaces a season request, it is removed instead if it is not authorized.
+        """
+        self.remove(request_id=season_request.id)
+        if not season_request.authorized:
+            return
+        key = normalize_name(season_request.show.name)
+        with self._lock:
+            self._season_requests.setdefault(key, {})[season_request.id] = (
+                season_request
+            )
+            self._keys[season_request.id] = key
+
+    def add_movie_request(self, movie_request: RichMovieRequest) -> None:
+        """
+        Adds or replaces a movie request, it is removed instead if it is not authorized.
+        """
+        self.remove(request_id=movie_request.id)
+        if not movie_request.authorized:
+            return
+        key = normalize_name(movie_request.movie.name)
+        with self._lock:
+            self._movie_requests.setdefault(key, {})[movie_request.id] = movie_request
+            self._keys[movie_request.id] = key
+
+    def remove(self, request_id: UUID) -> None:
+        with self._lock:
+            key = self._keys.pop(request_id, None)
+            if key is None:
+                return
+            for requests in (self._season_requests, self._movie_requests):
+                requests_by_id = requests.get(key)
+                if requests_by_id is not None and request_id in requests_by_id:
+                    del requests_by_id[request_id]
+                    if not requests_by_id:
+                        del requests[key]
+
+    def has_season_requests(self) -> bool:
+        return bool(self._season_requests)
+
+    def has_movie_requests(self) -> bool:
+        return bool(self._movie_requests)
+
+    def match_season_requests(self, release: ParsedRelease) -> list[RichSeasonRequest]:
+        """
+        :return: The season requests of the show of the release, whose season is contained in the release.
+        """
+        with self._lock:
+            season_requests = list(self._season_requests.get(release.name, {}).values())
+        return [
+            season_request
+            for season_request in season_requests
+            if season_request.season.number in release.seasons
+        ]
+
+    def match_movie_requests(self, release: ParsedRelease) -> list[RichMovieRequest]:
+        """
+        :return: The movie requests of the movie of the release, if the years differ by at most one.
+        """
+        with self._lock:
+            movie_requests = list(self._movie_requests.get(release.name, {}).values())
+        return [
+            movie_request
+            for movie_request in movie_requests
+            if movie_request.movie.year is None
+            or release.year is None
+            or abs(movie_request.movie.year - release.year) <= 1
+        ]
+
+
+wanted_index = WantedIndex()
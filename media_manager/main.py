@@ -74,7 +74,7 @@ log = logging.getLogger(__name__)
 
 from psycopg.errors import UniqueViolation  # noqa: E402
 from sqlalchemy.exc import IntegrityError  # noqa: E402
-from media_manager.config import AllEncompassingConfig  # noqa: E402
+from media_manager.config import get_config, reload_config  # noqa: E402
 import media_manager.torrent.router as torrent_router  # noqa: E402
 import media_manager.movies.router as movies_router  # noqa: E402
 import media_manager.tv.router as tv_router  # noqa: E402
@@ -86,7 +86,6 @@ from media_manager.tv.service import (  # noqa: E402
 from media_manager.movies.service import (  # noqa: E402
     import_all_movie_torrents,
     update_all_movies_metadata,
-    auto_download_all_approved_movie_requests,
 )
 from media_manager.notification.router import router as notification_router  # noqa: E402
 import uvicorn  # noqa: E402
@@ -117,6 +116,8 @@ from starlette.responses import FileResponse, RedirectResponse  # noqa: E402
 
 import media_manager.database  # noqa: E402
 import shutil  # noqa: E402
+import signal  # noqa: E402
+import threading  # noqa: E402
 from fastapi import FastAPI, APIRouter  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware  # noqa: E402
@@ -124,9 +125,23 @@ from starlette.responses import Response  # noqa: E402
 from contextlib import asynccontextmanager  # noqa: E402
 from apscheduler.schedulers.background import BackgroundScheduler  # noqa: E402
 from apscheduler.triggers.cron import CronTrigger  # noqa: E402
-from media_manager.database import init_engine  # noqa: E402
-
-config = AllEncompassingConfig()
+from apscheduler.triggers.interval import IntervalTrigger  # noqa: E402
+from media_manager.database import init_async_engine, init_engine  # noqa: E402
+from media_manager.database.replicas import (  # noqa: E402
+    ReadYourWritesMiddleware,
+    replica_set,
+)
+from media_manager.torrent.import_queue import import_worker_pool  # noqa: E402
+from media_manager.notification.manager import notification_manager  # noqa: E402
+from media_manager.scheduler.leader import LeaderElection  # noqa: E402
+from media_manager.scheduler.jobs import run_job  # noqa: E402
+from media_manager.scheduler.router import router as scheduler_router  # noqa: E402
+from media_manager.indexer.router import router as indexer_router  # noqa: E402
+from media_manager.events.router import router as events_router  # noqa: E402
+from media_manager.metrics import MetricsMiddleware, make_metrics_app  # noqa: E402
+from media_manager.database.query_stats import QueryStatsMiddleware  # noqa: E402
+
+config = get_config()
 
 if config.misc.development:
     log.warning("Development Mode activated!")
@@ -134,6 +149,15 @@ else:
     log.info("Development Mode not activated!")
 
 
+def reload_config_on_sighup(signum, frame):
+    # reloading involves I/O and a lock, so don't do it inside the signal handler
+    threading.Thread(target=reload_config, name="config-reload", daemon=True).start()
+
+
+if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGHUP, reload_config_on_sighup)
+
+
 def hourly_tasks():
     log.info(f"Hourly tasks are running at {datetime.now()}")
     auto_download_all_approved_season_requests()
@@ -148,10 +172,19 @@ def weekly_tasks():
 
 
 init_engine(config.database)
+init_async_engine(config.database)
+replica_set.init(config.database)
 
 jobstores = {"default": SQLAlchemyJobStore(engine=media_manager.database.engine)}
 
-scheduler = BackgroundScheduler(jobstores=jobstores)
+scheduler = BackgroundScheduler(
+    jobstores=jobstores,
+    job_defaults={
+        "max_instances": config.scheduler.max_instances,
+        "coalesce": config.scheduler.coalesce,
+        "misfire_grace_time": config.scheduler.misfire_grace_time_seconds,
+    },
+)
 every_15_minutes_trigger = CronTrigger(minute="*/15", hour="*")
 daily_trigger = CronTrigger(hour=0, minute=0, jitter=60 * 60 * 24 * 2)
 weekly_trigger = CronTrigger(
@@ -159,51 +192,105 @@ weekly_trigger = CronTrigger(
 )
 
 scheduler.add_job(
-    import_all_movie_torrents,
+    run_job,
     every_15_minutes_trigger,
+    args=["import_all_movie_torrents"],
     id="import_all_movie_torrents",
     replace_existing=True,
 )
 scheduler.add_job(
-    import_all_show_torrents,
+    run_job,
     every_15_minutes_trigger,
+    args=["import_all_show_torrents"],
     id="import_all_show_torrents",
     replace_existing=True,
 )
 scheduler.add_job(
-    auto_download_all_approved_season_requests,
+    run_job,
     daily_trigger,
+    args=["auto_download_all_approved_season_requests"],
     id="auto_download_all_approved_season_requests",
     replace_existing=True,
 )
 scheduler.add_job(
-    auto_download_all_approved_movie_requests,
+    run_job,
     daily_trigger,
+    args=["auto_download_all_approved_movie_requests"],
     id="auto_download_all_approved_movie_requests",
     replace_existing=True,
 )
 scheduler.add_job(
-    update_all_movies_metadata,
+    run_job,
     weekly_trigger,
+    args=["update_all_movies_metadata"],
     id="update_all_movies_metadata",
     replace_existing=True,
 )
 scheduler.add_job(
-    update_all_non_ended_shows_metadata,
+    run_job,
     weekly_trigger,
+    args=["update_all_non_ended_shows_metadata"],
     id="update_all_non_ended_shows_metadata",
     replace_existing=True,
 )
-scheduler.start()
+scheduler.add_job(
+    run_job,
+    daily_trigger,
+    args=["purge_old_notifications"],
+    id="purge_old_notifications",
+    replace_existing=True,
+)
+# the job returns right away while watching the RSS feeds is disabled, so it can be enabled by reloading the config
+scheduler.add_job(
+    run_job,
+    IntervalTrigger(minutes=config.indexers.rss.interval_minutes),
+    args=["watch_rss_feeds"],
+    id="watch_rss_feeds",
+    replace_existing=True,
+)
+
+
+def start_scheduler():
+    if scheduler.running:
+        scheduler.resume()
+    else:
+        scheduler.start()
+
+
+def pause_scheduler():
+    if scheduler.running:
+        scheduler.pause()
+
+
+# when running multiple workers or replicas, only the elected leader runs the scheduled jobs
+leader_election = LeaderElection(
+    engine=media_manager.database.get_session_engine(),
+    lock_id=config.scheduler.leader_lock_id,
+    retry_seconds=config.scheduler.leader_retry_seconds,
+    on_elected=start_scheduler,
+    on_demoted=pause_scheduler,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Create default admin user if needed
     await create_default_admin_user()
+    replica_set.start()
+    import_worker_pool.start()
+    if config.scheduler.leader_election:
+        leader_election.start()
+    else:
+        start_scheduler()
     yield
     # Shutdown
-    scheduler.shutdown()
+    leader_election.stop()
+    if scheduler.running:
+        scheduler.shutdown()
+    import_worker_pool.shutdown()
+    notification_manager.shutdown()
+    replica_set.stop()
+    await media_manager.database.async_engine.dispose()
 
 
 BASE_PATH = os.getenv("BASE_PATH", "")
@@ -217,6 +304,14 @@ DISABLE_FRONTEND_MOUNT = os.getenv("DISABLE_FRONTEND_MOUNT", "").lower() in [
 
 app = FastAPI(lifespan=lifespan, root_path=BASE_PATH)
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
+app.add_middleware(MetricsMiddleware)
+if config.database.replicas:
+    app.add_middleware(ReadYourWritesMiddleware)
+if config.misc.development:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        repeated_statement_threshold=config.database.repeated_statement_threshold,
+    )
 
 origins = config.misc.cors_urls
 log.info(f"CORS URLs activated for following origins: {origins}")
@@ -233,6 +328,8 @@ app.add_middleware(
         "HEAD",
         "OPTIONS",
     ],
+    # the cursor of the next page of paginated endpoints
+    expose_headers=["X-Next-Cursor"],
 )
 
 api_app = APIRouter(prefix="/api/v1")
@@ -305,6 +402,9 @@ api_app.include_router(movies_router.router, prefix="/movies", tags=["movie"])
 api_app.include_router(
     notification_router, prefix="/notification", tags=["notification"]
 )
+api_app.include_router(scheduler_router, prefix="/scheduler", tags=["scheduler"])
+api_app.include_router(indexer_router, prefix="/indexers", tags=["indexer"])
+api_app.include_router(events_router, prefix="/events", tags=["events"])
 
 app.mount(
     "/api/v1/static/image",
@@ -314,6 +414,9 @@ app.mount(
 
 app.include_router(api_app)
 
+# Prometheus metrics
+app.mount("/metrics", make_metrics_app(), name="metrics")
+
 # ----------------------------
 # Frontend mounting (disabled in development)
 # ----------------------------
@@ -1,14 +1,20 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class TmdbConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     tmdb_relay_url: str = "https://metadata-relay.dorninger.co/tmdb"
 
 
 class TvdbConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     tvdb_relay_url: str = "https://metadata-relay.dorninger.co/tvdb"
 
 
 class MetadataProviderConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     tvdb: TvdbConfig = TvdbConfig()
     tmdb: TmdbConfig = TmdbConfig()
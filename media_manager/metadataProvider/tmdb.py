@@ -3,7 +3,7 @@ import logging
 import requests
 
 import media_manager.metadataProvider.utils
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 from media_manager.metadataProvider.abstractMetaDataProvider import (
     AbstractMetadataProvider,
 )
@@ -22,7 +22,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
     name = "tmdb"
 
     def __init__(self):
-        config = AllEncompassingConfig().metadata.tmdb
+        config = get_config().metadata.tmdb
         self.url = config.tmdb_relay_url
 
     def __get_show_metadata(self, id: int) -> dict:
@@ -131,6 +131,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
                 )
             raise
 
+    @media_manager.metadataProvider.utils.observe_latency
     def download_show_poster_image(self, show: Show) -> bool:
         show_metadata = self.__get_show_metadata(show.external_id)
         # downloading the poster
@@ -151,6 +152,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
             return False
         return True
 
+    @media_manager.metadataProvider.utils.observe_latency
     def get_show_metadata(self, id: int = None) -> Show:
         """
 
@@ -203,6 +205,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
         return show
 
+    @media_manager.metadataProvider.utils.observe_latency
     def search_show(
         self, query: str | None = None, max_pages: int = 5
     ) -> list[MetaDataProviderSearchResult]:
@@ -249,6 +252,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
                 log.warning(f"Error processing search result: {e}")
         return formatted_results
 
+    @media_manager.metadataProvider.utils.observe_latency
     def get_movie_metadata(self, id: int = None) -> Movie:
         """
 
@@ -272,6 +276,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
         return movie
 
+    @media_manager.metadataProvider.utils.observe_latency
     def search_movie(
         self, query: str | None = None, max_pages: int = 5
     ) -> list[MetaDataProviderSearchResult]:
@@ -318,6 +323,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
                 log.warning(f"Error processing search result: {e}")
         return formatted_results
 
+    @media_manager.metadataProvider.utils.observe_latency
     def download_movie_poster_image(self, movie: Movie) -> bool:
         movie_metadata = self.__get_movie_metadata(id=movie.external_id)
         # downloading the poster
@@ -3,7 +3,7 @@ import logging
 
 
 import media_manager.metadataProvider.utils
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 from media_manager.metadataProvider.abstractMetaDataProvider import (
     AbstractMetadataProvider,
 )
@@ -19,7 +19,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
     name = "tvdb"
 
     def __init__(self):
-        config = AllEncompassingConfig().metadata.tvdb
+        config = get_config().metadata.tvdb
         self.url = config.tvdb_relay_url
 
     def __get_show(self, id: int) -> dict:
@@ -43,6 +43,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
     def __get_trending_movies(self) -> dict:
         return requests.get(f"{self.url}/movies/trending").json()
 
+    @media_manager.metadataProvider.utils.observe_latency
     def download_show_poster_image(self, show: Show) -> bool:
         show_metadata = self.__get_show(id=show.external_id)
 
@@ -58,6 +59,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
             log.warning(f"image for show {show.name} could not be downloaded")
             return False
 
+    @media_manager.metadataProvider.utils.observe_latency
     def get_show_metadata(self, id: int = None) -> Show:
         """
 
@@ -116,6 +118,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
 
         return show
 
+    @media_manager.metadataProvider.utils.observe_latency
     def search_show(
         self, query: str | None = None
     ) -> list[MetaDataProviderSearchResult]:
@@ -172,6 +175,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
                     log.warning(f"Error processing search result: {e}")
             return formatted_results
 
+    @media_manager.metadataProvider.utils.observe_latency
     def search_movie(
         self, query: str | None = None
     ) -> list[MetaDataProviderSearchResult]:
@@ -236,6 +240,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
                     log.warning(f"Error processing search result: {e}")
             return formatted_results
 
+    @media_manager.metadataProvider.utils.observe_latency
     def download_movie_poster_image(self, movie: Movie) -> bool:
         movie_metadata = self.__get_movie(movie.external_id)
 
@@ -251,6 +256,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
             log.warning(f"image for show {movie.name} could not be downloaded")
             return False
 
+    @media_manager.metadataProvider.utils.observe_latency
     def get_movie_metadata(self, id: int = None) -> Movie:
         """
 
@@ -1,9 +1,33 @@
+import functools
 from uuid import UUID
 
 from PIL import Image
+from prometheus_client import Histogram
 import requests
 import pillow_avif
 
+metadata_provider_request_duration_seconds = Histogram(
+    "mediamanager_metadata_provider_request_duration_seconds",
+    "Duration of metadata provider calls",
+    ["provider", "method"],
+)
+
+
+def observe_latency(func):
+    """
+    Decorator for methods of metadata providers, records their duration by provider and method.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with metadata_provider_request_duration_seconds.labels(
+            self.name, func.__name__
+        ).time():
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 pillow_avif
 
 
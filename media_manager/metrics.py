@@ -0,0 +1,69 @@
+"""
+Prometheus metrics of the MediaManager backend, served at /metrics.
+The instruments themselves live in the modules they measure, this module only contains the HTTP middleware
+and the ASGI app that exposes the metrics.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CollectorRegistry,
+    Histogram,
+    make_asgi_app,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+http_request_duration_seconds = Histogram(
+    "mediamanager_http_request_duration_seconds",
+    "Duration of HTTP requests by route template",
+    ["method", "route", "status_code"],
+)
+
+
+class MetricsMiddleware:
+    """
+    Measures the duration of every HTTP request, labeled with the path template of the matched route
+    (e.g. /api/v1/tv/shows/{show_id}), so that the number of time series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_template = getattr(route, "path_format", None) or getattr(
+                route, "path", "unmatched"
+            )
+            http_request_duration_seconds.labels(
+                scope["method"], route_template, str(status_code)
+            ).observe(time.perf_counter() - start)
+
+
+def make_metrics_app() -> ASGIApp:
+    """
+    Creates the ASGI app serving the metrics.
+    If PROMETHEUS_MULTIPROC_DIR is set, e.g. when running multiple workers, the metrics of all workers are aggregated.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
@@ -6,6 +6,7 @@ from sqlalchemy.exc import (
 from sqlalchemy.orm import Session, joinedload
 import logging
 
+from media_manager.database.async_repository import AsyncRepository
 from media_manager.exceptions import NotFoundError
 from media_manager.movies.models import Movie, MovieRequest, MovieFile
 from media_manager.movies.schemas import (
@@ -108,31 +109,29 @@ class MovieRepository:
         log.debug(f"Attempting to save movie: {movie.name} (ID: {movie.id})")
         db_movie = self.db.get(Movie, movie.id) if movie.id else None
 
-        if db_movie:  # Update existing movie
-            log.debug(f"Updating existing movie with ID: {movie.id}")
-            db_movie.external_id = movie.external_id
-            db_movie.metadata_provider = movie.metadata_provider
-            db_movie.name = movie.name
-            db_movie.overview = movie.overview
-            db_movie.year = movie.year
-        else:  # Insert new movie
-            log.debug(f"Creating new movie: {movie.name}")
-            db_movie = Movie(**movie.model_dump())
-            self.db.add(db_movie)
-
         try:
-            self.db.commit()
+            # a savepoint, so a conflict leaves the surrounding transaction usable
+            with self.db.begin_nested():
+                if db_movie:  # Update existing movie
+                    log.debug(f"Updating existing movie with ID: {movie.id}")
+                    db_movie.external_id = movie.external_id
+                    db_movie.metadata_provider = movie.metadata_provider
+                    db_movie.name = movie.name
+                    db_movie.overview = movie.overview
+                    db_movie.year = movie.year
+                else:  # Insert new movie
+                    log.debug(f"Creating new movie: {movie.name}")
+                    db_movie = Movie(**movie.model_dump())
+                    self.db.add(db_movie)
             self.db.refresh(db_movie)
             log.info(f"Successfully saved movie: {db_movie.name} (ID: {db_movie.id})")
             return MovieSchema.model_validate(db_movie)
         except IntegrityError as e:
-            self.db.rollback()
             log.error(f"Integrity error while saving movie {movie.name}: {e}")
             raise ValueError(
                 f"Movie with this primary key or unique constraint violation: {e.orig}"
             )
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while saving movie {movie.name}: {e}")
             raise
 
@@ -151,10 +150,9 @@ class MovieRepository:
                 log.warning(f"Movie with id {movie_id} not found for deletion.")
                 raise NotFoundError(f"Movie with id {movie_id} not found.")
             self.db.delete(movie)
-            self.db.commit()
+            self.db.flush()
             log.info(f"Successfully deleted movie with id: {movie_id}")
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while deleting movie {movie_id}: {e}")
             raise
 
@@ -184,17 +182,15 @@ class MovieRepository:
             authorized=movie_request.authorized,
         )
         try:
-            self.db.add(db_model)
-            self.db.commit()
+            with self.db.begin_nested():
+                self.db.add(db_model)
             self.db.refresh(db_model)
             log.info(f"Successfully added movie request with id: {db_model.id}")
             return MovieRequestSchema.model_validate(db_model)
         except IntegrityError as e:
-            self.db.rollback()
             log.error(f"Integrity error while adding movie request: {e}")
             raise
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while adding movie request: {e}")
             raise
 
@@ -212,9 +208,8 @@ class MovieRepository:
             if not movie:
                 raise NotFoundError(f"movie with id {movie_id} not found.")
             movie.library = library
-            self.db.commit()
+            self.db.flush()
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error setting library for movie {movie_id}: {e}")
             raise
 
@@ -230,14 +225,11 @@ class MovieRepository:
             stmt = delete(MovieRequest).where(MovieRequest.id == movie_request_id)
             result = self.db.execute(stmt)
             if result.rowcount == 0:
-                self.db.rollback()
                 raise NotFoundError(
                     f"movie request with id {movie_request_id} not found."
                 )
-            self.db.commit()
             # Successfully deleted movie request with id: {movie_request_id}
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(
                 f"Database error while deleting movie request {movie_request_id}: {e}"
             )
@@ -273,16 +265,14 @@ class MovieRepository:
         """
         db_model = MovieFile(**movie_file.model_dump())
         try:
-            self.db.add(db_model)
-            self.db.commit()
+            with self.db.begin_nested():
+                self.db.add(db_model)
             self.db.refresh(db_model)
             return MovieFileSchema.model_validate(db_model)
         except IntegrityError as e:
-            self.db.rollback()
             log.error(f"Integrity error while adding movie file: {e}")
             raise
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while adding movie file: {e}")
             raise
 
@@ -297,11 +287,9 @@ class MovieRepository:
         try:
             stmt = delete(MovieFile).where(MovieFile.torrent_id == torrent_id)
             result = self.db.execute(stmt)
-            self.db.commit()
             deleted_count = result.rowcount
             return deleted_count
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(
                 f"Database error removing movie files for torrent_id {torrent_id}: {e}"
             )
@@ -460,6 +448,14 @@ class MovieRepository:
             updated = True
 
         if updated:
-            self.db.commit()
+            self.db.flush()
             self.db.refresh(db_movie)
         return MovieSchema.model_validate(db_movie)
+
+
+class AsyncMovieRepository(AsyncRepository[MovieRepository]):
+    """
+    The methods of MovieRepository, awaitable on an AsyncSession.
+    """
+
+    repository_class = MovieRepository
@@ -5,13 +5,15 @@ from fastapi import APIRouter, Depends, status, HTTPException
 
 from media_manager.auth.schemas import UserRead
 from media_manager.auth.users import current_active_user, current_superuser
-from media_manager.config import LibraryItem, AllEncompassingConfig
+from media_manager.config import LibraryItem, get_config
 from media_manager.indexer.schemas import (
     IndexerQueryResultId,
     IndexerQueryResult,
 )
+from media_manager.indexer.utils import stream_search_events
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
 from media_manager.schemas import MediaImportSuggestion
+from media_manager.sse import EventStreamResponse
 from media_manager.torrent.utils import detect_unknown_media
 from media_manager.torrent.schemas import Torrent
 from media_manager.movies import log
@@ -28,6 +30,7 @@ from media_manager.movies.schemas import (
 )
 from media_manager.movies.dependencies import (
     movie_service_dep,
+    read_movie_service_dep,
 )
 from media_manager.metadataProvider.dependencies import metadata_provider_dep
 from media_manager.movies.schemas import MovieRequestBase
@@ -85,7 +88,7 @@ def get_all_importable_movies(
     """
     get a list of unknown movies that were detected in the movie directory and are importable
     """
-    directories = detect_unknown_media(AllEncompassingConfig().misc.movie_directory)
+    directories = detect_unknown_media(get_config().misc.movie_directory)
     movies = []
     for directory in directories:
         movies.append(
@@ -108,9 +111,7 @@ def import_detected_movie(
     get a list of unknown movies that were detected in the movie directory and are importable
     """
     source_directory = Path(directory)
-    if source_directory not in detect_unknown_media(
-        AllEncompassingConfig().misc.movie_directory
-    ):
+    if source_directory not in detect_unknown_media(get_config().misc.movie_directory):
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "No such directory")
     movie = movie_service.get_movie_by_id(movie_id=movie_id)
     success = movie_service.import_existing_movie(
@@ -125,7 +126,7 @@ def import_detected_movie(
     dependencies=[Depends(current_active_user)],
     response_model=list[PublicMovie],
 )
-def get_all_movies(movie_service: movie_service_dep):
+def get_all_movies(movie_service: read_movie_service_dep):
     return movie_service.get_all_movies()
 
 
@@ -135,7 +136,7 @@ def get_all_movies(movie_service: movie_service_dep):
     response_model=list[LibraryItem],
 )
 def get_available_libraries():
-    return AllEncompassingConfig().misc.movie_libraries
+    return get_config().misc.movie_libraries
 
 
 @router.get(
@@ -170,7 +171,7 @@ def get_popular_movies(
     dependencies=[Depends(current_active_user)],
     response_model=list[RichMovieTorrent],
 )
-def get_all_movies_with_torrents(movie_service: movie_service_dep):
+def get_all_movies_with_torrents(movie_service: read_movie_service_dep):
     return movie_service.get_all_movies_with_torrents()
 
 
@@ -206,7 +207,7 @@ def create_movie_request(
     dependencies=[Depends(current_active_user)],
     response_model=list[RichMovieRequest],
 )
-def get_all_movie_requests(movie_service: movie_service_dep):
+def get_all_movie_requests(movie_service: read_movie_service_dep):
     return movie_service.get_all_movie_requests()
 
 
@@ -272,7 +273,7 @@ def delete_movie_request(
     dependencies=[Depends(current_active_user)],
     response_model=PublicMovie,
 )
-def get_movie_by_id(movie_service: movie_service_dep, movie_id: MovieId):
+def get_movie_by_id(movie_service: read_movie_service_dep, movie_id: MovieId):
     return movie_service.get_public_movie_by_id(movie_id=movie_id)
 
 
@@ -291,6 +292,26 @@ def get_all_available_torrents_for_a_movie(
     )
 
 
+@router.get(
+    "/{movie_id}/torrents/stream",
+    dependencies=[Depends(current_active_user)],
+    response_class=EventStreamResponse,
+)
+def stream_available_torrents_for_a_movie(
+    movie_service: movie_service_dep,
+    movie_id: MovieId,
+    search_query_override: str | None = None,
+):
+    """
+    Like GET /{movie_id}/torrents, but streams the results of every indexer as server-sent events
+    as soon as it responds.
+    """
+    progress = movie_service.stream_available_torrents_for_a_movie(
+        movie_id=movie_id, search_query_override=search_query_override
+    )
+    return EventStreamResponse(stream_search_events(progress))
+
+
 @router.post(
     "/{movie_id}/torrents",
     status_code=status.HTTP_201_CREATED,
@@ -1,16 +1,21 @@
-import re
 from pathlib import Path
+from typing import Iterator
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 from media_manager.exceptions import InvalidConfigError
 from media_manager.indexer.repository import IndexerRepository
-from media_manager.database import SessionLocal, get_session
+from media_manager.database import SessionLocal, get_session, unit_of_work
+from media_manager.database.replicas import get_read_session
 from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.indexer.release_parser import parse_subtitle_language
 from media_manager.indexer.schemas import IndexerQueryResultId
+from media_manager.indexer.schemas import IndexerSearchParameters
+from media_manager.indexer.schemas import IndexerSearchProgress
 from media_manager.indexer.utils import evaluate_indexer_query_results
+from media_manager.indexer.wanted import wanted_index
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
 from media_manager.notification.service import NotificationService
 from media_manager.schemas import MediaImportSuggestion
@@ -29,6 +34,7 @@ from media_manager.movies.schemas import (
     RichMovieRequest,
 )
 from media_manager.torrent.schemas import QualityStrings
+from media_manager.scheduler.schemas import JobResult
 from media_manager.movies.repository import MovieRepository
 from media_manager.exceptions import NotFoundError
 from media_manager.torrent.repository import TorrentRepository
@@ -80,7 +86,11 @@ class MovieService:
         :param movie_request: The movie request to add.
         :return: The added movie request.
         """
-        return self.movie_repository.add_movie_request(movie_request=movie_request)
+        movie_request = self.movie_repository.add_movie_request(
+            movie_request=movie_request
+        )
+        self._update_wanted_index(movie_request=movie_request)
+        return movie_request
 
     def get_movie_request_by_id(
         self, movie_request_id: MovieRequestId
@@ -103,7 +113,29 @@ class MovieService:
         :return: The updated movie request.
         """
         self.movie_repository.delete_movie_request(movie_request_id=movie_request.id)
-        return self.movie_repository.add_movie_request(movie_request=movie_request)
+        movie_request = self.movie_repository.add_movie_request(
+            movie_request=movie_request
+        )
+        self._update_wanted_index(movie_request=movie_request)
+        return movie_request
+
+    def _update_wanted_index(self, movie_request: MovieRequest) -> None:
+        """
+        Updates the movie request in the index of wanted requests that is matched against the RSS feeds.
+        """
+        if not get_config().indexers.rss.enabled:
+            return
+        if not movie_request.authorized:
+            wanted_index.remove(request_id=movie_request.id)
+            return
+        wanted_index.add_movie_request(
+            movie_request=RichMovieRequest(
+                **movie_request.model_dump(),
+                movie=self.movie_repository.get_movie_by_id(
+                    movie_id=movie_request.movie_id
+                ),
+            )
+        )
 
     def delete_movie_request(self, movie_request_id: MovieRequestId) -> None:
         """
@@ -112,6 +144,7 @@ class MovieService:
         :param movie_request_id: The ID of the movie request to delete.
         """
         self.movie_repository.delete_movie_request(movie_request_id=movie_request_id)
+        wanted_index.remove(request_id=movie_request_id)
 
     def get_public_movie_files_by_movie_id(
         self, movie_id: MovieId
@@ -179,17 +212,71 @@ class MovieService:
         """
         log.debug(f"getting all available torrents for movie {movie_id}")
         movie = self.movie_repository.get_movie_by_id(movie_id=movie_id)
+        search_queries, search_parameters = self._get_movie_search(
+            movie=movie, search_query_override=search_query_override
+        )
+        torrents: list[IndexerQueryResult] = self.indexer_service.search_variants(
+            queries=search_queries, is_tv=False, parameters=search_parameters
+        )
         if search_query_override:
-            search_query = search_query_override
-        else:
-            search_query = f"{movie.name}"
+            log.debug(f"Found with search query override {torrents.__len__()} torrents")
+        return self._evaluate_movie_torrents(
+            movie=movie, torrents=torrents, search_query_override=search_query_override
+        )
 
-        torrents: list[IndexerQueryResult] = self.indexer_service.search(
-            query=search_query, is_tv=False
+    def stream_available_torrents_for_a_movie(
+        self, movie_id: MovieId, search_query_override: str = None
+    ) -> Iterator[IndexerSearchProgress]:
+        """
+        Like get_all_available_torrents_for_a_movie, but yields the evaluated results of every indexer
+        as soon as it responds.
+        The movie is looked up right away, the indexers are only searched once the iterator is consumed.
+
+        :param movie_id: The ID of the movie.
+        :param search_query_override: Optional override for the search query.
+        :return: The progress of the search, in the order the indexers respond.
+        """
+        movie = self.movie_repository.get_movie_by_id(movie_id=movie_id)
+        search_queries, search_parameters = self._get_movie_search(
+            movie=movie, search_query_override=search_query_override
         )
 
+        def search() -> Iterator[IndexerSearchProgress]:
+            for progress in self.indexer_service.search_variants_iter(
+                queries=search_queries, is_tv=False, parameters=search_parameters
+            ):
+                progress.results = self._evaluate_movie_torrents(
+                    movie=movie,
+                    torrents=progress.results,
+                    search_query_override=search_query_override,
+                )
+                yield progress
+
+        return search()
+
+    @staticmethod
+    def _get_movie_search(
+        movie: Movie, search_query_override: str | None
+    ) -> tuple[list[str], IndexerSearchParameters | None]:
+        if search_query_override:
+            return [search_query_override], None
+        search_queries = [movie.name]
+        if movie.year:
+            search_queries.append(f"{movie.name} {movie.year}")
+        search_parameters = IndexerSearchParameters(
+            is_tv=False,
+            tvdb_id=movie.external_id if movie.metadata_provider == "tvdb" else None,
+            tmdb_id=movie.external_id if movie.metadata_provider == "tmdb" else None,
+        )
+        return search_queries, search_parameters
+
+    @staticmethod
+    def _evaluate_movie_torrents(
+        movie: Movie,
+        torrents: list[IndexerQueryResult],
+        search_query_override: str | None,
+    ) -> list[IndexerQueryResult]:
         if search_query_override:
-            log.debug(f"Found with search query override {torrents.__len__()} torrents")
             return torrents
 
         result: list[IndexerQueryResult] = []
@@ -298,7 +385,9 @@ class MovieService:
         if movie_file.torrent_id is None:
             return True
         else:
-            torrent_file = self.torrent_service.get_torrent_by_id(
+            # the stored torrent is enough to know whether it was imported, refreshing its status would write to
+            # the database, which read-only sessions don't allow
+            torrent_file = self.torrent_service.torrent_repository.get_torrent_by_id(
                 torrent_id=movie_file.torrent_id
             )
             if torrent_file.imported:
@@ -421,6 +510,39 @@ class MovieService:
         log.info(f"Downloading approved movie request {movie_request.id}")
 
         torrents = self.get_all_available_torrents_for_a_movie(movie_id=movie.id)
+        available_torrents = self.get_torrents_matching_movie_request(
+            movie_request=movie_request, movie=movie, torrents=torrents
+        )
+
+        if len(available_torrents) == 0:
+            log.warning(
+                f"No torrents matching criteria were found (wanted quality: {movie_request.wanted_quality}, min_quality: {movie_request.min_quality} for movie {movie.id})"
+            )
+            return False
+
+        available_torrents.sort(key=IndexerQueryResult.sort_key, reverse=True)
+
+        self.download_movie_request_torrent(
+            movie_request=movie_request,
+            movie=movie,
+            indexer_result=available_torrents[0],
+        )
+        return True
+
+    def get_torrents_matching_movie_request(
+        self,
+        movie_request: MovieRequest,
+        movie: Movie,
+        torrents: list[IndexerQueryResult],
+    ) -> list[IndexerQueryResult]:
+        """
+        Filters torrents by the quality wanted by a movie request, torrents with too few seeders are left out.
+
+        :param movie_request: The movie request.
+        :param movie: The requested movie.
+        :param torrents: The torrents to filter.
+        :return: The torrents that can be downloaded for the movie request.
+        """
         available_torrents: list[IndexerQueryResult] = []
 
         for torrent in torrents:
@@ -438,15 +560,23 @@ class MovieService:
                     f"Taking torrent {torrent.title} with quality {torrent.quality} for movie {movie.id} into consideration"
                 )
 
-        if len(available_torrents) == 0:
-            log.warning(
-                f"No torrents matching criteria were found (wanted quality: {movie_request.wanted_quality}, min_quality: {movie_request.min_quality} for movie {movie.id})"
-            )
-            return False
+        return available_torrents
 
-        available_torrents.sort()
+    def download_movie_request_torrent(
+        self,
+        movie_request: MovieRequest,
+        movie: Movie,
+        indexer_result: IndexerQueryResult,
+    ) -> Torrent:
+        """
+        Downloads a torrent for a movie request and deletes the request afterwards.
 
-        torrent = self.torrent_service.download(indexer_result=available_torrents[0])
+        :param movie_request: The movie request.
+        :param movie: The requested movie.
+        :param indexer_result: The torrent to download.
+        :return: The downloaded torrent.
+        """
+        torrent = self.torrent_service.download(indexer_result=indexer_result)
         movie_file = MovieFile(
             movie_id=movie.id,
             quality=torrent.quality,
@@ -460,10 +590,10 @@ class MovieService:
                 f"Movie file for movie {movie.id} and quality {torrent.quality} already exists, skipping."
             )
         self.delete_movie_request(movie_request.id)
-        return True
+        return torrent
 
     def get_movie_root_path(self, movie: Movie) -> Path:
-        misc_config = AllEncompassingConfig().misc
+        misc_config = get_config().misc
         movie_file_path = (
             misc_config.movie_directory
             / f"{remove_special_characters(movie.name)} ({movie.year})  [{movie.metadata_provider}id-{movie.external_id}]"
@@ -514,15 +644,12 @@ class MovieService:
 
         # import subtitles
         for subtitle_file in subtitle_files:
-            language_code_match = re.search(
-                r"[. ]([a-z]{2})\.srt$", subtitle_file.name, re.IGNORECASE
-            )
-            if not language_code_match:
+            language_code = parse_subtitle_language(subtitle_file.name)
+            if not language_code:
                 log.warning(
                     f"Subtitle file {subtitle_file.name} does not match expected format, can't extract language code, skipping."
                 )
                 continue
-            language_code = language_code_match.group(1)
             target_subtitle_file = (
                 movie_root_path / f"{movie_file_name}.{language_code}.srt"
             )
@@ -530,45 +657,66 @@ class MovieService:
 
         return success
 
-    def import_torrent_files(self, torrent: Torrent, movie: Movie) -> None:
+    def import_torrent_files(
+        self, torrent: Torrent, movie: Movie, movie_files: list[MovieFile]
+    ) -> tuple[bool, int]:
         """
         Organizes files from a torrent into the movie directory structure.
+        This only touches the filesystem, the result is recorded by finish_torrent_import.
+
         :param torrent: The Torrent object
         :param movie: The Movie object
+        :param movie_files: The movie files of the torrent, see TorrentService.get_movie_files_of_torrent
+        :return: Whether the import was successful and the number of video files found in the torrent.
         """
 
         video_files, subtitle_files, all_files = get_files_for_import(torrent=torrent)
-        success: bool = False  # determines if the import was successful, if true, the Imported flag will be set to True after the import
+        # determines if the import was successful, if true, the Imported flag will be set to True after the import
+        success: bool = False
 
         if len(video_files) != 1:
-            # Send notification about multiple video files found
-            if self.notification_service:
-                self.notification_service.send_notification_to_all_providers(
-                    title="Multiple Video Files Found",
-                    message=f"Found {len(video_files)} video files in movie torrent '{torrent.title}' for {movie.name} ({movie.year}). Only the first will be imported. Manual intervention recommended.",
-                )
             log.error(
                 "Found multiple video files in movie torrent, only the first will be imported. Manual intervention is recommended."
             )
         log.debug(
             f"Importing these {len(video_files)} video files and {len(subtitle_files)} subtitle files"
         )
-
-        movie_files: list[MovieFile] = self.torrent_service.get_movie_files_of_torrent(
-            torrent=torrent
-        )
         log.info(
             f"Found {len(movie_files)} movie files associated with torrent {torrent.title}"
         )
 
         for movie_file in movie_files:
-            self.import_movie(
-                movie=movie,
-                video_files=video_files,
-                subtitle_files=subtitle_files,
-                file_path_suffix=movie_file.file_path_suffix,
+            success = (
+                self.import_movie(
+                    movie=movie,
+                    video_files=video_files,
+                    subtitle_files=subtitle_files,
+                    file_path_suffix=movie_file.file_path_suffix,
+                )
+                or success
             )
 
+        return success, len(video_files)
+
+    def finish_torrent_import(
+        self, torrent: Torrent, movie: Movie, success: bool, video_file_count: int
+    ) -> None:
+        """
+        Records the result of import_torrent_files.
+
+        :param torrent: The Torrent object
+        :param movie: The Movie object
+        :param success: Whether the import was successful, if true, the torrent is marked as imported
+        :param video_file_count: The number of video files found in the torrent
+        """
+        if video_file_count != 1:
+            # Send notification about multiple video files found
+            if self.notification_service:
+                self.notification_service.send_notification_to_all_providers(
+                    title="Multiple Video Files Found",
+                    message=f"Found {video_file_count} video files in movie torrent '{torrent.title}' for {movie.name} ({movie.year}). Only the first will be imported. Manual intervention recommended.",
+                )
+
         if success:
             torrent.imported = True
             self.torrent_service.torrent_repository.save_torrent(torrent=torrent)
@@ -662,7 +810,7 @@ class MovieService:
         return updated_movie
 
 
-def auto_download_all_approved_movie_requests() -> None:
+def auto_download_all_approved_movie_requests() -> JobResult:
     """
     Auto download all approved movie requests.
     This is a standalone function as it creates its own DB session.
@@ -681,56 +829,50 @@ def auto_download_all_approved_movie_requests() -> None:
     movie_requests = movie_repository.get_movie_requests()
     log.info(f"Found {len(movie_requests)} movie requests to process")
     count = 0
+    failures = 0
 
     for movie_request in movie_requests:
         if movie_request.authorized:
             movie = movie_repository.get_movie_by_id(movie_id=movie_request.movie_id)
-            if movie_service.download_approved_movie_request(
-                movie_request=movie_request, movie=movie
-            ):
+            with unit_of_work(db):
+                downloaded = movie_service.download_approved_movie_request(
+                    movie_request=movie_request, movie=movie
+                )
+            if downloaded:
                 count += 1
             else:
+                failures += 1
                 log.warning(
                     f"Failed to download movie request {movie_request.id} for movie {movie.name}"
                 )
 
     log.info(f"Auto downloaded {count} approved movie requests")
-    db.commit()
     db.close()
+    return JobResult(items_processed=count, failures=failures)
 
 
-def import_all_movie_torrents() -> None:
-    with next(get_session()) as db:
-        movie_repository = MovieRepository(db=db)
+def import_all_movie_torrents() -> JobResult:
+    """
+    Queues all finished, not yet imported movie torrents for import.
+    The actual import is done by the import workers, see media_manager.torrent.import_queue.
+    """
+    with next(get_session()) as db, unit_of_work(db):
         torrent_service = TorrentService(torrent_repository=TorrentRepository(db=db))
-        indexer_service = IndexerService(indexer_repository=IndexerRepository(db=db))
-        movie_service = MovieService(
-            movie_repository=movie_repository,
-            torrent_service=torrent_service,
-            indexer_service=indexer_service,
-        )
-        log.info("Importing all torrents")
+        log.info("Queueing imports of all finished torrents")
         torrents = torrent_service.get_all_torrents()
-        log.info("Found %d torrents to import", len(torrents))
+        count = 0
         for t in torrents:
-            try:
-                if not t.imported and t.status == TorrentStatus.finished:
-                    movie = torrent_service.get_movie_of_torrent(torrent=t)
-                    if movie is None:
-                        log.warning(
-                            f"torrent {t.title} is not a movie torrent, skipping import."
-                        )
-                        continue
-                    movie_service.import_torrent_files(torrent=t, movie=movie)
-            except RuntimeError as e:
-                log.error(
-                    f"Error importing torrent {t.title} for movie {movie.name}: {e}"
-                )
-        log.info("Finished importing all torrents")
-        db.commit()
+            if t.imported or t.status != TorrentStatus.finished:
+                continue
+            if torrent_service.get_movie_of_torrent(torrent=t) is None:
+                continue
+            torrent_service.enqueue_import(torrent=t)
+            count += 1
+        log.info(f"Queued {count} movie torrents for import")
+        return JobResult(items_processed=count)
 
 
-def update_all_movies_metadata() -> None:
+def update_all_movies_metadata() -> JobResult:
     """
     Updates the metadata of all movies.
     """
@@ -744,9 +886,12 @@ def update_all_movies_metadata() -> None:
 
         log.info("Updating metadata for all movies")
 
-        movies = movie_repository.get_movies()
+        with next(get_read_session()) as read_db:
+            movies = MovieRepository(db=read_db).get_movies()
 
         log.info(f"Found {len(movies)} movies to update")
+        count = 0
+        failures = 0
 
         for movie in movies:
             try:
@@ -758,20 +903,25 @@ def update_all_movies_metadata() -> None:
                     log.error(
                         f"Unsupported metadata provider {movie.metadata_provider} for movie {movie.name}, skipping update."
                     )
+                    failures += 1
                     continue
             except InvalidConfigError as e:
                 log.error(
                     f"Error initializing metadata provider {movie.metadata_provider} for movie {movie.name}: {str(e)}"
                 )
+                failures += 1
                 continue
-            updated_movie = movie_service.update_movie_metadata(
-                db_movie=movie, metadata_provider=metadata_provider
-            )
+            with unit_of_work(db):
+                updated_movie = movie_service.update_movie_metadata(
+                    db_movie=movie, metadata_provider=metadata_provider
+                )
 
             if updated_movie:
+                count += 1
                 log.info(
                     f"Successfully updated metadata for movie: {updated_movie.name}"
                 )
             else:
+                failures += 1
                 log.warning(f"Failed to update metadata for movie: {movie.name}")
-        db.commit()
+        return JobResult(items_processed=count, failures=failures)
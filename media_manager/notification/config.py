@@ -1,21 +1,30 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class EmailConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     smtp_host: str = ""
     smtp_port: int = 587
     smtp_user: str = ""
     smtp_password: str = ""
     from_email: str = ""
     use_tls: bool = False
+    timeout_seconds: int = 30
+    # the connection is kept open between emails and closed once it was idle this long
+    connection_idle_seconds: int = 60
 
 
 class EmailNotificationsConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = False
     emails: list[str] = []  # the email addresses to send notifications to
 
 
 class GotifyConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = False
     api_key: str | None = None
     url: str | None = (
@@ -24,6 +33,8 @@ class GotifyConfig(BaseSettings):
 
 
 class NtfyConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = False
     url: str | None = (
         None  # e.g. https://ntfy.sh/your-topic (note lack of trailing slash)
@@ -31,14 +42,56 @@ class NtfyConfig(BaseSettings):
 
 
 class PushoverConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = False
     api_key: str | None = None
     user: str | None = None
 
 
+class WebhookConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    name: str
+    url: str
+    enabled: bool = True
+    headers: dict[str, str] = {}  # e.g. for authorization
+
+
+class NotificationHttpConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    timeout_seconds: float = 10
+    connect_timeout_seconds: float = 5
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30
+
+
+class NotificationDispatchConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    # notifications waiting per provider, further ones are dropped
+    queue_size: int = 1000
+    max_attempts: int = 3
+    retry_backoff_seconds: float = 5  # doubled after every failed attempt
+    # similar notifications sent within this window are combined, 0 disables it
+    coalesce_window_seconds: float = 10
+    # how long to wait for queued notifications when shutting down
+    shutdown_timeout_seconds: float = 10
+
+
 class NotificationConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     smtp_config: EmailConfig = EmailConfig()
     email_notifications: EmailNotificationsConfig = EmailNotificationsConfig()
     gotify: GotifyConfig = GotifyConfig()
     ntfy: NtfyConfig = NtfyConfig()
     pushover: PushoverConfig = PushoverConfig()
+    webhooks: list[WebhookConfig] = []
+    # notifications older than this many days are deleted, 0 keeps them forever
+    retention_days: int = 90
+    unread_retention_days: int = 365
+    http: NotificationHttpConfig = NotificationHttpConfig()
+    dispatch: NotificationDispatchConfig = NotificationDispatchConfig()
@@ -2,9 +2,16 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from media_manager.database import DbSessionDependency
-from media_manager.notification.repository import NotificationRepository
-from media_manager.notification.service import NotificationService
+from media_manager.database import AsyncDbSessionDependency, DbSessionDependency
+from media_manager.database.replicas import AsyncReadDbSessionDependency
+from media_manager.notification.repository import (
+    AsyncNotificationRepository,
+    NotificationRepository,
+)
+from media_manager.notification.service import (
+    AsyncNotificationService,
+    NotificationService,
+)
 
 
 def get_notification_repository(
@@ -27,3 +34,39 @@ def get_notification_service(
 notification_service_dep = Annotated[
     NotificationService, Depends(get_notification_service)
 ]
+
+
+def get_async_notification_repository(
+    db_session: AsyncDbSessionDependency,
+) -> AsyncNotificationRepository:
+    return AsyncNotificationRepository(db_session)
+
+
+async_notification_repository_dep = Annotated[
+    AsyncNotificationRepository, Depends(get_async_notification_repository)
+]
+
+
+def get_async_notification_service(
+    notification_repository: async_notification_repository_dep,
+) -> AsyncNotificationService:
+    return AsyncNotificationService(notification_repository)
+
+
+async_notification_service_dep = Annotated[
+    AsyncNotificationService, Depends(get_async_notification_service)
+]
+
+
+def get_async_read_notification_service(
+    db_session: AsyncReadDbSessionDependency,
+) -> AsyncNotificationService:
+    """
+    An AsyncNotificationService on a read replica, for polling notifications.
+    """
+    return AsyncNotificationService(AsyncNotificationRepository(db_session))
+
+
+async_read_notification_service_dep = Annotated[
+    AsyncNotificationService, Depends(get_async_read_notification_service)
+]
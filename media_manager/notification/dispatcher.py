@@ -0,0 +1,241 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+from prometheus_client import Counter, Histogram
+
+from media_manager.config import get_config
+from media_manager.notification.schemas import MessageNotification
+from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
+    AbstractNotificationServiceProvider,
+)
+
+log = logging.getLogger(__name__)
+
+notification_send_duration_seconds = Histogram(
+    "mediamanager_notification_send_duration_seconds",
+    "Duration of sending a notification by provider",
+    ["provider", "status"],
+)
+notifications_dropped = Counter(
+    "mediamanager_notifications_dropped_total",
+    "Notifications that were dropped because the queue of their provider was full",
+    ["provider"],
+)
+
+# tells a worker to stop once it has sent everything queued before it
+_STOP = object()
+
+
+@dataclass
+class _NotificationGroup:
+    title: str
+    group_message: str | None
+    deadline: float
+    messages: list[str] = field(default_factory=list)
+
+    def to_notification(self) -> MessageNotification:
+        if len(self.messages) == 1:
+            return MessageNotification(title=self.title, message=self.messages[0])
+        if self.group_message is not None:
+            message = self.group_message.replace("{count}", str(len(self.messages)))
+        else:
+            message = "\n".join(self.messages)
+        return MessageNotification(title=self.title, message=message)
+
+
+class NotificationDispatcher:
+    """
+    Sends notifications through the providers on background threads, so callers return immediately.
+
+    Every provider has its own bounded queue and worker thread, so a slow or failing provider doesn't delay
+    the others. Failed notifications are retried with exponential backoff. Notifications of the same group
+    that are sent within the coalesce window are combined into a single one.
+    The threads are started by the first notification.
+    """
+
+    def __init__(self, providers: list[AbstractNotificationServiceProvider]):
+        self.config = get_config().notifications.dispatch
+        self.providers = providers
+        self._queues: list[queue.Queue] = []
+        self._threads: list[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._condition = threading.Condition()
+        self._groups: dict[str, _NotificationGroup] = {}
+
+    def start(self) -> None:
+        with self._condition:
+            if self._threads:
+                return
+            self._stop_event.clear()
+            self._queues = []
+            for provider in self.providers:
+                provider_queue = queue.Queue(maxsize=self.config.queue_size)
+                self._queues.append(provider_queue)
+                self._threads.append(
+                    threading.Thread(
+                        target=self._run_worker,
+                        args=(provider, provider_queue),
+                        name=f"notification-{provider.name}",
+                        daemon=True,
+                    )
+                )
+            self._threads.append(
+                threading.Thread(
+                    target=self._run_coalescer,
+                    name="notification-coalescer",
+                    daemon=True,
+                )
+            )
+            for thread in self._threads:
+                thread.start()
+
+    def shutdown(self) -> None:
+        """
+        Sends the pending groups and waits for the queued notifications to be sent, at most for the shutdown timeout.
+        """
+        with self._condition:
+            if not self._threads:
+                return
+            self._stop_event.set()
+            self._condition.notify_all()
+            groups = list(self._groups.values())
+            self._groups.clear()
+            threads, self._threads = self._threads, []
+            queues = self._queues
+        for group in groups:
+            self._enqueue(group.to_notification(), queues=queues)
+        deadline = time.monotonic() + self.config.shutdown_timeout_seconds
+        for provider_queue in queues:
+            try:
+                # blocks only while the queue is full, the worker keeps draining it
+                provider_queue.put(_STOP, timeout=max(deadline - time.monotonic(), 0))
+            except queue.Full:
+                pass
+        for thread in threads:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+            if thread.is_alive():
+                log.warning(f"{thread.name} did not send all queued notifications")
+
+    def dispatch(
+        self,
+        notification: MessageNotification,
+        group: str | None = None,
+        group_message: str | None = None,
+    ) -> None:
+        """
+        Queues a notification for all providers.
+
+        :param notification: The notification.
+        :param group: Notifications with the same group that are sent within the coalesce window are combined,
+            e.g. one per missing episode of a season.
+        :param group_message: The message of a combined notification, {count} is replaced by the number of
+            combined notifications. If None, the messages are joined.
+        """
+        if not self.providers:
+            return
+        self.start()
+        if group is None or self.config.coalesce_window_seconds <= 0:
+            self._enqueue(notification, queues=self._queues)
+            return
+
+        with self._condition:
+            existing = self._groups.get(group)
+            if existing is None:
+                existing = _NotificationGroup(
+                    title=notification.title,
+                    group_message=group_message,
+                    deadline=time.monotonic() + self.config.coalesce_window_seconds,
+                )
+                self._groups[group] = existing
+                self._condition.notify()
+            existing.messages.append(notification.message)
+
+    def _enqueue(
+        self, notification: MessageNotification, queues: list[queue.Queue]
+    ) -> None:
+        for provider, provider_queue in zip(self.providers, queues):
+            try:
+                provider_queue.put_nowait(notification)
+            except queue.Full:
+                provider_name = provider.name
+                notifications_dropped.labels(provider_name).inc()
+                log.error(
+                    f"Dropping notification '{notification.title}' for {provider_name}, its queue is full"
+                )
+
+    def _run_coalescer(self) -> None:
+        while True:
+            with self._condition:
+                if self._stop_event.is_set():
+                    return
+                now = time.monotonic()
+                due = [
+                    key for key, group in self._groups.items() if group.deadline <= now
+                ]
+                groups = [self._groups.pop(key) for key in due]
+                queues = self._queues
+                if not groups:
+                    next_deadline = min(
+                        (group.deadline for group in self._groups.values()),
+                        default=None,
+                    )
+                    self._condition.wait(
+                        timeout=None if next_deadline is None else next_deadline - now
+                    )
+                    continue
+            for group in groups:
+                if len(group.messages) > 1:
+                    log.debug(
+                        f"Combined {len(group.messages)} notifications '{group.title}'"
+                    )
+                self._enqueue(group.to_notification(), queues=queues)
+
+    def _run_worker(
+        self, provider: AbstractNotificationServiceProvider, provider_queue: queue.Queue
+    ) -> None:
+        while True:
+            notification = provider_queue.get()
+            if notification is _STOP:
+                return
+            self._send(provider=provider, notification=notification)
+
+    def _send(
+        self,
+        provider: AbstractNotificationServiceProvider,
+        notification: MessageNotification,
+    ) -> None:
+        provider_name = provider.name
+        for attempt in range(1, self.config.max_attempts + 1):
+            start = time.perf_counter()
+            try:
+                success = provider.send_notification(notification)
+                notification_send_duration_seconds.labels(
+                    provider_name, "success" if success else "failure"
+                ).observe(time.perf_counter() - start)
+                if success:
+                    log.info(f"Notification sent successfully via {provider_name}")
+                    return
+                log.warning(
+                    f"Failed to send notification via {provider_name} (attempt {attempt})"
+                )
+            except Exception as e:
+                notification_send_duration_seconds.labels(
+                    provider_name, "error"
+                ).observe(time.perf_counter() - start)
+                log.error(
+                    f"Error sending notification via {provider_name} (attempt {attempt}): {e}"
+                )
+
+            if attempt == self.config.max_attempts:
+                break
+            # don't hold up the shutdown with retries
+            if self._stop_event.wait(
+                self.config.retry_backoff_seconds * 2 ** (attempt - 1)
+            ):
+                break
+        log.error(
+            f"Giving up on sending notification '{notification.title}' via {provider_name}"
+        )
@@ -0,0 +1,45 @@
+import logging
+import threading
+
+import httpx
+
+from media_manager.config import get_config
+
+log = logging.getLogger(__name__)
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Returns the HTTP client shared by the push notification providers. It keeps connections alive between
+    notifications and enforces strict timeouts, so an unresponsive endpoint can't stall the notification workers.
+    """
+    global _client
+    client = _client
+    if client is None:
+        with _client_lock:
+            if _client is None:
+                config = get_config().notifications.http
+                _client = httpx.Client(
+                    timeout=httpx.Timeout(
+                        config.timeout_seconds, connect=config.connect_timeout_seconds
+                    ),
+                    limits=httpx.Limits(
+                        max_connections=config.max_connections,
+                        max_keepalive_connections=config.max_keepalive_connections,
+                        keepalive_expiry=config.keepalive_expiry_seconds,
+                    ),
+                    headers={"User-Agent": "MediaManager"},
+                )
+            client = _client
+    return client
+
+
+def close_http_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -4,7 +4,11 @@ Notification Manager - Orchestrates sending notifications through all configured
 
 import logging
 from typing import List
+
+from media_manager.notification.dispatcher import NotificationDispatcher
+from media_manager.notification.http import close_http_client
 from media_manager.notification.schemas import MessageNotification
+from media_manager.notification.utils import smtp_sender
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
     AbstractNotificationServiceProvider,
 )
@@ -20,7 +24,10 @@ from media_manager.notification.service_providers.ntfy import (
 from media_manager.notification.service_providers.pushover import (
     PushoverNotificationServiceProvider,
 )
-from media_manager.config import AllEncompassingConfig
+from media_manager.notification.service_providers.webhook import (
+    WebhookNotificationServiceProvider,
+)
+from media_manager.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +38,10 @@ class NotificationManager:
     """
 
     def __init__(self):
-        self.config = AllEncompassingConfig().notifications
+        self.config = get_config().notifications
         self.providers: List[AbstractNotificationServiceProvider] = []
         self._initialize_providers()
+        self.dispatcher = NotificationDispatcher(providers=self.providers)
 
     def _initialize_providers(self) -> None:
         # Email provider
@@ -68,31 +76,55 @@ class NotificationManager:
             except Exception as e:
                 logger.error(f"Failed to initialize Pushover provider: {e}")
 
+        # Webhook providers
+        for webhook_config in self.config.webhooks:
+            if webhook_config.enabled:
+                self.providers.append(
+                    WebhookNotificationServiceProvider(config=webhook_config)
+                )
+                logger.info(
+                    f"Webhook notification provider {webhook_config.name} initialized"
+                )
+
         logger.info(f"Initialized {len(self.providers)} notification providers")
 
-    def send_notification(self, title: str, message: str) -> None:
+    def send_notification(
+        self,
+        title: str,
+        message: str,
+        group: str | None = None,
+        group_message: str | None = None,
+    ) -> None:
+        """
+        Queues a notification for all providers, it is sent in the background.
+
+        :param title: The title of the notification.
+        :param message: The message of the notification.
+        :param group: Notifications with the same group that are sent shortly after each other are combined
+            into one, e.g. one per missing episode of a season.
+        :param group_message: The message of a combined notification, {count} is replaced by the number of
+            combined notifications.
+        """
         if not self.providers:
             logger.warning("No notification providers configured")
+            return
 
-        notification = MessageNotification(title=title, message=message)
-
-        for provider in self.providers:
-            provider_name = provider.__class__.__name__
-            try:
-                success = provider.send_notification(notification)
-                if success:
-                    logger.info(f"Notification sent successfully via {provider_name}")
-                else:
-                    logger.warning(f"Failed to send notification via {provider_name}")
-
-            except Exception as e:
-                logger.error(f"Error sending notification via {provider_name}: {e}")
+        self.dispatcher.dispatch(
+            MessageNotification(title=title, message=message),
+            group=group,
+            group_message=group_message,
+        )
 
     def get_configured_providers(self) -> List[str]:
-        return [provider.__class__.__name__ for provider in self.providers]
+        return [provider.name for provider in self.providers]
 
     def is_configured(self) -> bool:
         return len(self.providers) > 0
 
+    def shutdown(self) -> None:
+        self.dispatcher.shutdown()
+        smtp_sender.close()
+        close_http_client()
+
 
 notification_manager = NotificationManager()
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from media_manager.database import Base
@@ -12,4 +12,12 @@ class Notification(Base):
     id: Mapped[UUID] = mapped_column(primary_key=True)
     message: Mapped[str]
     read: Mapped[bool]
-    timestamp = mapped_column(DateTime, nullable=False)
+    timestamp = mapped_column(DateTime, nullable=False, index=True)
+
+
+# serves the unread notifications, newest first, and counting them
+Index(
+    "ix_notification_read_timestamp",
+    Notification.read,
+    Notification.timestamp.desc(),
+)
@@ -1,4 +1,6 @@
-from sqlalchemy import select, delete, update
+from datetime import datetime
+
+from sqlalchemy import select, delete, update, func, tuple_
 from sqlalchemy.exc import (
     IntegrityError,
     SQLAlchemyError,
@@ -6,11 +8,13 @@ from sqlalchemy.exc import (
 from sqlalchemy.orm import Session
 import logging
 
+from media_manager.database.async_repository import AsyncRepository
 from media_manager.exceptions import NotFoundError, MediaAlreadyExists
 from media_manager.notification.models import Notification
 from media_manager.notification.schemas import (
     NotificationId,
     Notification as NotificationSchema,
+    NotificationCursor,
 )
 
 log = logging.getLogger(__name__)
@@ -28,25 +32,32 @@ class NotificationRepository:
 
         return NotificationSchema.model_validate(result)
 
-    def get_unread_notifications(self) -> list[NotificationSchema]:
-        try:
-            stmt = (
-                select(Notification)
-                .where(Notification.read == False)  # noqa: E712
-                .order_by(Notification.timestamp.desc())
-            )
-            results = self.db.execute(stmt).scalars().all()
-            return [
-                NotificationSchema.model_validate(notification)
-                for notification in results
-            ]
-        except SQLAlchemyError as e:
-            log.error(f"Database error while retrieving unread notifications: {e}")
-            raise
+    def get_notifications(
+        self,
+        read: bool | None = None,
+        limit: int | None = None,
+        cursor: NotificationCursor | None = None,
+    ) -> list[NotificationSchema]:
+        """
+        Returns notifications ordered by timestamp, newest first.
 
-    def get_all_notifications(self) -> list[NotificationSchema]:
+        :param read: Only return read or unread notifications, all if None.
+        :param limit: The maximum number of notifications to return, all if None.
+        :param cursor: Only return notifications after this position.
+        """
         try:
-            stmt = select(Notification).order_by(Notification.timestamp.desc())
+            stmt = select(Notification).order_by(
+                Notification.timestamp.desc(), Notification.id.desc()
+            )
+            if read is not None:
+                stmt = stmt.where(Notification.read == read)
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(Notification.timestamp, Notification.id)
+                    < tuple_(cursor.timestamp, cursor.id)
+                )
+            if limit is not None:
+                stmt = stmt.limit(limit)
             results = self.db.execute(stmt).scalars().all()
             return [
                 NotificationSchema.model_validate(notification)
@@ -56,17 +67,25 @@ class NotificationRepository:
             log.error(f"Database error while retrieving notifications: {e}")
             raise
 
+    def count_unread_notifications(self) -> int:
+        stmt = (
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.read == False)  # noqa: E712
+        )
+        return self.db.execute(stmt).scalar_one()
+
     def save_notification(self, notification: NotificationSchema):
         try:
-            self.db.add(
-                Notification(
-                    id=notification.id,
-                    read=notification.read,
-                    timestamp=notification.timestamp,
-                    message=notification.message,
+            with self.db.begin_nested():
+                self.db.add(
+                    Notification(
+                        id=notification.id,
+                        read=notification.read,
+                        timestamp=notification.timestamp,
+                        message=notification.message,
+                    )
                 )
-            )
-            self.db.commit()
         except IntegrityError as e:
             log.error(f"Could not save notification, Error: {e}")
             raise MediaAlreadyExists(
@@ -79,6 +98,20 @@ class NotificationRepository:
         self.db.execute(stmt)
         return
 
+    def mark_notifications_as_read(self, ids: list[NotificationId] | None) -> int:
+        """
+        :param ids: The notifications to mark as read, all unread notifications if None.
+        :return: The number of notifications that were marked as read.
+        """
+        stmt = (
+            update(Notification)
+            .where(Notification.read == False)  # noqa: E712
+            .values(read=True)
+        )
+        if ids is not None:
+            stmt = stmt.where(Notification.id.in_(ids))
+        return self.db.execute(stmt).rowcount
+
     def mark_notification_as_unread(self, id: NotificationId) -> None:
         stmt = update(Notification).where(Notification.id == id).values(read=False)
         self.db.execute(stmt)
@@ -89,5 +122,34 @@ class NotificationRepository:
         result = self.db.execute(stmt)
         if result.rowcount == 0:
             raise NotFoundError(f"Notification with id {id} not found.")
-        self.db.commit()
         return
+
+    def delete_notifications_older_than(
+        self, timestamp: datetime, read: bool, batch_size: int = 10_000
+    ) -> int:
+        """
+        Deletes a batch of the notifications older than a timestamp, commit every batch on its own,
+        so no single transaction locks a large part of the table.
+
+        :param timestamp: Notifications older than this are deleted.
+        :param read: Whether to delete read or unread notifications.
+        :param batch_size: The maximum number of notifications to delete.
+        :return: The number of deleted notifications, all of them are deleted once it is below batch_size.
+        """
+        batch = (
+            select(Notification.id)
+            .where(Notification.read == read, Notification.timestamp < timestamp)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        return self.db.execute(
+            delete(Notification).where(Notification.id.in_(batch))
+        ).rowcount
+
+
+class AsyncNotificationRepository(AsyncRepository[NotificationRepository]):
+    """
+    The methods of NotificationRepository, awaitable on an AsyncSession.
+    """
+
+    repository_class = NotificationRepository
@@ -1,27 +1,60 @@
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from media_manager.auth.users import current_active_user
-from media_manager.notification.schemas import Notification, NotificationId
-from media_manager.notification.dependencies import notification_service_dep
+from media_manager.notification.schemas import (
+    MarkNotificationsAsRead,
+    Notification,
+    NotificationCursor,
+    NotificationId,
+    UnreadNotificationCount,
+)
+from media_manager.notification.dependencies import (
+    async_notification_service_dep,
+    async_read_notification_service_dep,
+)
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 # --------------------------------
 # GET NOTIFICATIONS
 # --------------------------------
 
 
+def get_cursor(cursor: str | None = None) -> NotificationCursor | None:
+    if cursor is None:
+        return None
+    try:
+        return NotificationCursor.decode(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
 @router.get(
     "",
     dependencies=[Depends(current_active_user)],
     response_model=list[Notification],
 )
-def get_all_notifications(notification_service: notification_service_dep):
+async def get_all_notifications(
+    notification_service: async_read_notification_service_dep,
+    response: Response,
+    cursor: Annotated[NotificationCursor | None, Depends(get_cursor)],
+    limit: int = Query(100, ge=1, le=1000),
+):
     """
-    Get all notifications.
+    Get notifications, newest first.
+    If there are more, the X-Next-Cursor header contains the cursor of the next page.
     """
-    return notification_service.get_all_notifications()
+    page = await notification_service.get_notifications(limit=limit, cursor=cursor)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.notifications
 
 
 @router.get(
@@ -29,11 +62,38 @@ def get_all_notifications(notification_service: notification_service_dep):
     dependencies=[Depends(current_active_user)],
     response_model=list[Notification],
 )
-def get_unread_notifications(notification_service: notification_service_dep):
+async def get_unread_notifications(
+    notification_service: async_read_notification_service_dep,
+    response: Response,
+    cursor: Annotated[NotificationCursor | None, Depends(get_cursor)],
+    limit: int = Query(100, ge=1, le=1000),
+):
     """
-    Get all unread notifications.
+    Get unread notifications, newest first.
+    If there are more, the X-Next-Cursor header contains the cursor of the next page.
     """
-    return notification_service.get_unread_notifications()
+    page = await notification_service.get_notifications(
+        read=False, limit=limit, cursor=cursor
+    )
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.notifications
+
+
+@router.get(
+    "/unread/count",
+    dependencies=[Depends(current_active_user)],
+    response_model=UnreadNotificationCount,
+)
+async def count_unread_notifications(
+    notification_service: async_read_notification_service_dep,
+):
+    """
+    Get the number of unread notifications.
+    """
+    return UnreadNotificationCount(
+        count=await notification_service.count_unread_notifications()
+    )
 
 
 @router.get(
@@ -44,13 +104,14 @@ def get_unread_notifications(notification_service: notification_service_dep):
         status.HTTP_404_NOT_FOUND: {"description": "Notification not found"},
     },
 )
-def get_notification(
-    notification_id: NotificationId, notification_service: notification_service_dep
+async def get_notification(
+    notification_id: NotificationId,
+    notification_service: async_read_notification_service_dep,
 ):
     """
     Get a specific notification by ID.
     """
-    return notification_service.get_notification(id=notification_id)
+    return await notification_service.get_notification(id=notification_id)
 
 
 # --------------------------------
@@ -58,6 +119,21 @@ def get_notification(
 # --------------------------------
 
 
+@router.patch(
+    "/read",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(current_active_user)],
+)
+async def mark_notifications_as_read(
+    notification_service: async_notification_service_dep,
+    body: MarkNotificationsAsRead,
+):
+    """
+    Mark multiple notifications as read, all unread notifications if no IDs are given.
+    """
+    await notification_service.mark_notifications_as_read(ids=body.ids)
+
+
 @router.patch(
     "/{notification_id}/read",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -66,13 +142,14 @@ def get_notification(
         status.HTTP_404_NOT_FOUND: {"description": "Notification not found"},
     },
 )
-def mark_notification_as_read(
-    notification_id: NotificationId, notification_service: notification_service_dep
+async def mark_notification_as_read(
+    notification_id: NotificationId,
+    notification_service: async_notification_service_dep,
 ):
     """
     Mark a notification as read.
     """
-    notification_service.mark_notification_as_read(id=notification_id)
+    await notification_service.mark_notification_as_read(id=notification_id)
 
 
 @router.patch(
@@ -83,13 +160,14 @@ def mark_notification_as_read(
         status.HTTP_404_NOT_FOUND: {"description": "Notification not found"},
     },
 )
-def mark_notification_as_unread(
-    notification_id: NotificationId, notification_service: notification_service_dep
+async def mark_notification_as_unread(
+    notification_id: NotificationId,
+    notification_service: async_notification_service_dep,
 ):
     """
     Mark a notification as unread.
     """
-    notification_service.mark_notification_as_unread(id=notification_id)
+    await notification_service.mark_notification_as_unread(id=notification_id)
 
 
 @router.delete(
@@ -100,10 +178,11 @@ def mark_notification_as_unread(
         status.HTTP_404_NOT_FOUND: {"description": "Notification not found"},
     },
 )
-def delete_notification(
-    notification_id: NotificationId, notification_service: notification_service_dep
+async def delete_notification(
+    notification_id: NotificationId,
+    notification_service: async_notification_service_dep,
 ):
     """
     Delete a notification.
     """
-    notification_service.delete_notification(id=notification_id)
+    await notification_service.delete_notification(id=notification_id)
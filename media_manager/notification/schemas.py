@@ -1,3 +1,4 @@
+import base64
 import typing
 import uuid
 from datetime import datetime
@@ -29,3 +30,39 @@ class MessageNotification(BaseModel):
 
     message: str
     title: str
+
+
+class NotificationCursor(BaseModel):
+    """
+    Position in the list of notifications, which is ordered by timestamp and ID, newest first.
+    """
+
+    timestamp: datetime
+    id: NotificationId
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "NotificationCursor":
+        """
+        :raises ValueError: If the cursor is invalid.
+        """
+        return cls.model_validate_json(base64.urlsafe_b64decode(cursor.encode()))
+
+
+class NotificationPage(BaseModel):
+    notifications: list[Notification]
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page, None if this is the last page"
+    )
+
+
+class UnreadNotificationCount(BaseModel):
+    count: int
+
+
+class MarkNotificationsAsRead(BaseModel):
+    ids: list[NotificationId] | None = Field(
+        None, description="The notifications to mark as read, all if omitted"
+    )
@@ -1,7 +1,41 @@
-from media_manager.notification.repository import NotificationRepository
-from media_manager.notification.schemas import NotificationId, Notification
+import logging
+from datetime import datetime, timedelta
+
+from media_manager.config import get_config
+from media_manager.database import get_session, unit_of_work
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
+from media_manager.notification.repository import (
+    AsyncNotificationRepository,
+    NotificationRepository,
+)
+from media_manager.notification.schemas import (
+    NotificationId,
+    Notification,
+    NotificationCursor,
+    NotificationPage,
+)
+from media_manager.scheduler.schemas import JobResult
 from media_manager.notification.manager import notification_manager
 
+log = logging.getLogger(__name__)
+
+# notifications deleted per transaction by the retention purge
+PURGE_BATCH_SIZE = 10_000
+
+
+def _to_page(notifications: list[Notification], limit: int) -> NotificationPage:
+    """
+    :param notifications: The notifications of the page, plus the first one of the next page if there is one.
+    :param limit: The maximum number of notifications on the page.
+    """
+    next_cursor = None
+    if len(notifications) > limit:
+        notifications = notifications[:limit]
+        last = notifications[-1]
+        next_cursor = NotificationCursor(timestamp=last.timestamp, id=last.id).encode()
+    return NotificationPage(notifications=notifications, next_cursor=next_cursor)
+
 
 class NotificationService:
     def __init__(
@@ -14,11 +48,27 @@ class NotificationService:
     def get_notification(self, id: NotificationId) -> Notification:
         return self.notification_repository.get_notification(id=id)
 
-    def get_unread_notifications(self) -> list[Notification]:
-        return self.notification_repository.get_unread_notifications()
+    def get_notifications(
+        self,
+        read: bool | None = None,
+        limit: int = 100,
+        cursor: NotificationCursor | None = None,
+    ) -> NotificationPage:
+        """
+        Returns a page of notifications, newest first.
+
+        :param read: Only return read or unread notifications, all if None.
+        :param limit: The maximum number of notifications on the page.
+        :param cursor: The cursor of the page, the first page if None.
+        """
+        # fetching one more tells whether there is a next page
+        notifications = self.notification_repository.get_notifications(
+            read=read, limit=limit + 1, cursor=cursor
+        )
+        return _to_page(notifications=notifications, limit=limit)
 
-    def get_all_notifications(self) -> list[Notification]:
-        return self.notification_repository.get_all_notifications()
+    def count_unread_notifications(self) -> int:
+        return self.notification_repository.count_unread_notifications()
 
     def save_notification(self, notification: Notification) -> None:
         return self.notification_repository.save_notification(notification)
@@ -26,15 +76,107 @@ class NotificationService:
     def mark_notification_as_read(self, id: NotificationId) -> None:
         return self.notification_repository.mark_notification_as_read(id=id)
 
+    def mark_notifications_as_read(self, ids: list[NotificationId] | None) -> int:
+        return self.notification_repository.mark_notifications_as_read(ids=ids)
+
     def mark_notification_as_unread(self, id: NotificationId) -> None:
         return self.notification_repository.mark_notification_as_unread(id=id)
 
     def delete_notification(self, id: NotificationId) -> None:
         return self.notification_repository.delete_notification(id=id)
 
-    def send_notification_to_all_providers(self, title: str, message: str) -> None:
-        self.notification_manager.send_notification(title, message)
+    def send_notification_to_all_providers(
+        self,
+        title: str,
+        message: str,
+        group: str | None = None,
+        group_message: str | None = None,
+    ) -> None:
+        """
+        Queues a notification for all providers and saves it as an in-app notification.
+        See NotificationManager.send_notification for combining notifications with group and group_message.
+        """
+        self.notification_manager.send_notification(
+            title, message, group=group, group_message=group_message
+        )
 
         internal_notification = Notification(message=f"{title}: {message}", read=False)
         self.save_notification(internal_notification)
+        event_bus.publish_after_commit(
+            self.notification_repository.db,
+            EventType.notification,
+            internal_notification,
+        )
         return
+
+
+class AsyncNotificationService:
+    """
+    The in-app notification methods of NotificationService for async routes.
+    """
+
+    def __init__(
+        self,
+        notification_repository: AsyncNotificationRepository,
+    ):
+        self.notification_repository = notification_repository
+
+    async def get_notification(self, id: NotificationId) -> Notification:
+        return await self.notification_repository.get_notification(id=id)
+
+    async def get_notifications(
+        self,
+        read: bool | None = None,
+        limit: int = 100,
+        cursor: NotificationCursor | None = None,
+    ) -> NotificationPage:
+        """
+        See NotificationService.get_notifications.
+        """
+        notifications = await self.notification_repository.get_notifications(
+            read=read, limit=limit + 1, cursor=cursor
+        )
+        return _to_page(notifications=notifications, limit=limit)
+
+    async def count_unread_notifications(self) -> int:
+        return await self.notification_repository.count_unread_notifications()
+
+    async def mark_notification_as_read(self, id: NotificationId) -> None:
+        return await self.notification_repository.mark_notification_as_read(id=id)
+
+    async def mark_notifications_as_read(self, ids: list[NotificationId] | None) -> int:
+        return await self.notification_repository.mark_notifications_as_read(ids=ids)
+
+    async def mark_notification_as_unread(self, id: NotificationId) -> None:
+        return await self.notification_repository.mark_notification_as_unread(id=id)
+
+    async def delete_notification(self, id: NotificationId) -> None:
+        return await self.notification_repository.delete_notification(id=id)
+
+
+def purge_old_notifications() -> JobResult:
+    """
+    Deletes notifications that are older than their retention period.
+    This is a standalone function as it creates its own DB session.
+    """
+    config = get_config().notifications
+    deleted = 0
+    with next(get_session()) as db:
+        repository = NotificationRepository(db=db)
+        for read, retention_days in (
+            (True, config.retention_days),
+            (False, config.unread_retention_days),
+        ):
+            if retention_days <= 0:
+                continue
+            timestamp = datetime.now() - timedelta(days=retention_days)
+            while True:
+                with unit_of_work(db):
+                    batch = repository.delete_notifications_older_than(
+                        timestamp=timestamp, read=read, batch_size=PURGE_BATCH_SIZE
+                    )
+                deleted += batch
+                if batch < PURGE_BATCH_SIZE:
+                    break
+    log.info(f"Deleted {deleted} old notifications")
+    return JobResult(items_processed=deleted)
@@ -3,6 +3,13 @@ from media_manager.notification.schemas import MessageNotification
 
 
 class AbstractNotificationServiceProvider(abc.ABC):
+    @property
+    def name(self) -> str:
+        """
+        The name of the provider in logs and metrics.
+        """
+        return self.__class__.__name__
+
     @abc.abstractmethod
     def send_notification(self, message: MessageNotification) -> bool:
         """
@@ -3,12 +3,12 @@ from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
     AbstractNotificationServiceProvider,
 )
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 
 
 class EmailNotificationServiceProvider(AbstractNotificationServiceProvider):
     def __init__(self):
-        self.config = AllEncompassingConfig().notifications.email_notifications
+        self.config = get_config().notifications.email_notifications
 
     def send_notification(self, message: MessageNotification) -> bool:
         subject = "MediaManager - " + message.title
@@ -24,9 +24,9 @@ class EmailNotificationServiceProvider(AbstractNotificationServiceProvider):
                 </html>
                 """
 
-        for email in self.config.emails:
-            media_manager.notification.utils.send_email(
-                subject=subject, html=html, addressee=email
-            )
+        # all addressees share one envelope
+        media_manager.notification.utils.send_email(
+            subject=subject, html=html, addressee=self.config.emails
+        )
 
         return True
@@ -1,6 +1,5 @@
-import requests
-
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
+from media_manager.notification.http import get_http_client
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
     AbstractNotificationServiceProvider,
@@ -13,16 +12,14 @@ class NtfyNotificationServiceProvider(AbstractNotificationServiceProvider):
     """
 
     def __init__(self):
-        self.config = AllEncompassingConfig().notifications.ntfy
+        self.config = get_config().notifications.ntfy
 
     def send_notification(self, message: MessageNotification) -> bool:
-        response = requests.post(
+        response = get_http_client().post(
             url=self.config.url,
-            data=message.message.encode(encoding="utf-8"),
+            content=message.message.encode(encoding="utf-8"),
             headers={
                 "Title": "MediaManager - " + message.title,
             },
         )
-        if response.status_code not in range(200, 300):
-            return False
-        return True
+        return response.is_success
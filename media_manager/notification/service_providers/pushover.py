@@ -1,6 +1,5 @@
-import requests
-
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
+from media_manager.notification.http import get_http_client
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
     AbstractNotificationServiceProvider,
@@ -9,10 +8,10 @@ from media_manager.notification.service_providers.abstractNotificationServicePro
 
 class PushoverNotificationServiceProvider(AbstractNotificationServiceProvider):
     def __init__(self):
-        self.config = AllEncompassingConfig().notifications.pushover
+        self.config = get_config().notifications.pushover
 
     def send_notification(self, message: MessageNotification) -> bool:
-        response = requests.post(
+        response = get_http_client().post(
             url="https://api.pushover.net/1/messages.json",
             params={
                 "token": self.config.api_key,
@@ -21,6 +20,4 @@ class PushoverNotificationServiceProvider(AbstractNotificationServiceProvider):
                 "title": "MediaManager - " + message.title,
             },
         )
-        if response.status_code not in range(200, 300):
-            return False
-        return True
+        return response.is_success
@@ -0,0 +1,30 @@
+from media_manager.notification.config import WebhookConfig
+from media_manager.notification.http import get_http_client
+from media_manager.notification.schemas import MessageNotification
+from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
+    AbstractNotificationServiceProvider,
+)
+
+
+class WebhookNotificationServiceProvider(AbstractNotificationServiceProvider):
+    """
+    Posts notifications as JSON to an arbitrary URL, e.g. a home automation or chat integration.
+    """
+
+    def __init__(self, config: WebhookConfig):
+        self.config = config
+
+    @property
+    def name(self) -> str:
+        return f"Webhook {self.config.name}"
+
+    def send_notification(self, message: MessageNotification) -> bool:
+        response = get_http_client().post(
+            url=self.config.url,
+            json={
+                "title": message.title,
+                "message": message.message,
+            },
+            headers=self.config.headers,
+        )
+        return response.is_success
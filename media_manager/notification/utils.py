@@ -1,25 +1,190 @@
 import logging
 import smtplib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
-from media_manager.config import AllEncompassingConfig
+from prometheus_client import Histogram
+
+from media_manager.config import get_config
+from media_manager.notification.config import EmailConfig
 
 log = logging.getLogger(__name__)
 
+email_send_duration_seconds = Histogram(
+    "mediamanager_email_send_duration_seconds",
+    "Duration of sending an email, including connecting to the SMTP server if needed",
+    ["status"],
+)
+
+
+class SmtpSender:
+    """
+    Sends emails over a single SMTP connection, which is kept open and authenticated between emails.
+    It is closed after being idle for connection_idle_seconds and reopened by the next email,
+    a connection the server closed in the meantime is reopened transparently.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._server: smtplib.SMTP | None = None
+        self._server_config: EmailConfig | None = None
+        self._idle_timer: threading.Timer | None = None
+        # emails sent off the request path, a single thread as they share the connection anyway
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+
+    def send(self, subject: str, html: str, addressees: list[str]) -> None:
+        """
+        Sends an email to all addressees in a single envelope, they don't see each other's addresses.
+
+        :param subject: The subject of the email.
+        :param html: The HTML body of the email.
+        :param addressees: The email addresses to send the email to.
+        """
+        if not addressees:
+            return
+        email_conf = get_config().notifications.smtp_config
+        message = MIMEMultipart()
+        message["From"] = email_conf.from_email
+        message["To"] = (
+            addressees[0] if len(addressees) == 1 else "undisclosed-recipients:;"
+        )
+        message["Subject"] = str(subject)
+        message.attach(MIMEText(html, "html"))
+
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                self._cancel_idle_timer()
+                try:
+                    self._send_message(
+                        email_conf=email_conf, message=message, addressees=addressees
+                    )
+                finally:
+                    self._start_idle_timer(email_conf=email_conf)
+        except Exception:
+            email_send_duration_seconds.labels("error").observe(
+                time.perf_counter() - start
+            )
+            raise
+        email_send_duration_seconds.labels("success").observe(
+            time.perf_counter() - start
+        )
+        log.info(
+            f"Successfully sent email to {', '.join(addressees)} with subject: {subject}"
+        )
+
+    def send_in_background(
+        self, subject: str, html: str, addressees: list[str]
+    ) -> Future:
+        """
+        Like send, but returns immediately, failures are logged.
+        """
+
+        def log_failure(future: Future) -> None:
+            if future.exception() is not None:
+                log.error(
+                    f"Failed to send email with subject {subject}: {future.exception()}"
+                )
+
+        future = self._executor.submit(self.send, subject, html, addressees)
+        future.add_done_callback(log_failure)
+        return future
+
+    def close(self) -> None:
+        with self._lock:
+            self._cancel_idle_timer()
+            self._disconnect()
+
+    def _send_message(
+        self, email_conf: EmailConfig, message: MIMEMultipart, addressees: list[str]
+    ) -> None:
+        reused = self._server is not None and self._server_config == email_conf
+        if not reused:
+            self._connect(email_conf=email_conf)
+        try:
+            self._server.sendmail(
+                email_conf.from_email, addressees, message.as_string()
+            )
+        except (
+            smtplib.SMTPServerDisconnected,
+            smtplib.SMTPResponseException,
+            OSError,
+        ) as e:
+            if not reused or (
+                isinstance(e, smtplib.SMTPResponseException) and e.smtp_code != 421
+            ):
+                raise
+            # the server closed the idle connection, 421 is its way of announcing that
+            log.debug(f"SMTP connection was closed by the server, reconnecting: {e}")
+            self._connect(email_conf=email_conf)
+            self._server.sendmail(
+                email_conf.from_email, addressees, message.as_string()
+            )
+
+    def _connect(self, email_conf: EmailConfig) -> None:
+        self._disconnect()
+        server = smtplib.SMTP(
+            email_conf.smtp_host,
+            email_conf.smtp_port,
+            timeout=email_conf.timeout_seconds,
+        )
+        try:
+            if email_conf.use_tls:
+                server.starttls()
+            server.login(email_conf.smtp_user, email_conf.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        self._server_config = email_conf
+        log.debug(f"Connected to SMTP server {email_conf.smtp_host}")
+
+    def _disconnect(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+        self._server_config = None
+
+    def _start_idle_timer(self, email_conf: EmailConfig) -> None:
+        if self._server is None:
+            return
+        self._idle_timer = threading.Timer(
+            email_conf.connection_idle_seconds, self._close_idle_connection
+        )
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _close_idle_connection(self) -> None:
+        with self._lock:
+            # an email may have been sent while this timer waited for the lock
+            if self._idle_timer is threading.current_thread():
+                log.debug("Closing idle SMTP connection")
+                self._idle_timer = None
+                self._disconnect()
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+
+smtp_sender = SmtpSender()
 
-def send_email(subject: str, html: str, addressee: str) -> None:
-    email_conf = AllEncompassingConfig().notifications.smtp_config
-    message = MIMEMultipart()
-    message["From"] = email_conf.from_email
-    message["To"] = addressee
-    message["Subject"] = str(subject)
-    message.attach(MIMEText(html, "html"))
 
-    with smtplib.SMTP(email_conf.smtp_host, email_conf.smtp_port) as server:
-        if email_conf.use_tls:
-            server.starttls()
-        server.login(email_conf.smtp_user, email_conf.smtp_password)
-        server.sendmail(email_conf.from_email, addressee, message.as_string())
+def send_email(subject: str, html: str, addressee: str | list[str]) -> None:
+    """
+    Sends an email through the shared SMTP connection.
 
-    log.info(f"Successfully sent email to {addressee} with subject: {subject}")
+    :param subject: The subject of the email.
+    :param html: The HTML body of the email.
+    :param addressee: The email address or addresses to send the email to, multiple addresses share one envelope.
+    """
+    addressees = [addressee] if isinstance(addressee, str) else list(addressee)
+    smtp_sender.send(subject=subject, html=html, addressees=addressees)
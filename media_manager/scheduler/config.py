@@ -0,0 +1,17 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SchedulerConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    leader_election: bool = True  # only one process runs the scheduled jobs
+    leader_lock_id: int = 7_356_921  # key of the Postgres advisory lock, must be the same for all processes
+    leader_retry_seconds: int = 5  # how often followers try to become the leader
+
+    # apply to every scheduled job
+    max_instances: int = 1  # concurrent runs of the same job within the leader process
+    coalesce: bool = True  # run a job only once if several of its runs were missed
+    # a run that is late by more than this is skipped
+    misfire_grace_time_seconds: int = 300
+
+    run_history_days: int = 30  # how long the records of job runs are kept
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from media_manager.database import DbSessionDependency
+from media_manager.scheduler.repository import SchedulerRepository
+from media_manager.scheduler.service import SchedulerService
+
+
+def get_scheduler_repository(db: DbSessionDependency) -> SchedulerRepository:
+    return SchedulerRepository(db=db)
+
+
+scheduler_repository_dep = Annotated[
+    SchedulerRepository, Depends(get_scheduler_repository)
+]
+
+
+def get_scheduler_service(
+    scheduler_repository: scheduler_repository_dep,
+) -> SchedulerService:
+    return SchedulerService(scheduler_repository=scheduler_repository)
+
+
+scheduler_service_dep = Annotated[SchedulerService, Depends(get_scheduler_service)]
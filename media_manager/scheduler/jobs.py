@@ -0,0 +1,155 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import text
+
+from media_manager.config import get_config
+from media_manager.database import get_session, get_session_engine, unit_of_work
+from media_manager.database.query_stats import track_queries
+from media_manager.indexer.rss import watch_rss_feeds
+from media_manager.movies.service import (
+    auto_download_all_approved_movie_requests,
+    import_all_movie_torrents,
+    update_all_movies_metadata,
+)
+from media_manager.notification.service import purge_old_notifications
+from media_manager.scheduler import log
+from media_manager.scheduler.repository import SchedulerRepository
+from media_manager.scheduler.schemas import (
+    JobResult,
+    JobRun,
+    JobRunStatus,
+    JobTrigger,
+)
+from media_manager.tv.service import (
+    auto_download_all_approved_season_requests,
+    import_all_show_torrents,
+    update_all_non_ended_shows_metadata,
+)
+
+scheduled_jobs: dict[str, Callable[[], JobResult | None]] = {
+    "import_all_movie_torrents": import_all_movie_torrents,
+    "import_all_show_torrents": import_all_show_torrents,
+    "auto_download_all_approved_season_requests": auto_download_all_approved_season_requests,
+    "auto_download_all_approved_movie_requests": auto_download_all_approved_movie_requests,
+    "update_all_movies_metadata": update_all_movies_metadata,
+    "update_all_non_ended_shows_metadata": update_all_non_ended_shows_metadata,
+    "watch_rss_feeds": watch_rss_feeds,
+    "purge_old_notifications": purge_old_notifications,
+}
+
+job_duration_seconds = Histogram(
+    "mediamanager_scheduler_job_duration_seconds",
+    "Duration of scheduled job runs",
+    ["job_id", "status"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 7200, 14400),
+)
+job_items_processed = Histogram(
+    "mediamanager_scheduler_job_items_processed",
+    "Number of items processed per scheduled job run",
+    ["job_id"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+)
+job_failures = Counter(
+    "mediamanager_scheduler_job_failures_total",
+    "Number of items that failed during scheduled job runs",
+    ["job_id"],
+)
+
+
+@contextmanager
+def job_lock(job_id: str) -> Iterator[bool]:
+    """
+    Holds a Postgres advisory lock for the duration of a job run, so a run that was triggered manually
+    on any process never overlaps with a run of the same job on the leader.
+
+    :param job_id: The ID of the job.
+    :return: Whether the lock was acquired.
+    """
+    key = f"media_manager.scheduler.{job_id}"
+    with get_session_engine().connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(hashtext(:key))"), {"key": key}
+        ).scalar_one()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": key}
+                )
+
+
+def run_job(job_id: str, trigger: JobTrigger = JobTrigger.scheduled) -> JobRun:
+    """
+    Runs a scheduled job and records the run.
+    Both the scheduler and manual triggers run jobs through this function.
+
+    :param job_id: The ID of the job, one of the keys of `scheduled_jobs`.
+    :param trigger: What caused the run.
+    :return: The record of the run.
+    """
+    job = scheduled_jobs[job_id]
+    job_run = JobRun(job_id=job_id, trigger=trigger)
+
+    with job_lock(job_id=job_id) as acquired:
+        if not acquired:
+            log.warning(f"Job {job_id} is still running, skipping this run")
+            job_run.status = JobRunStatus.skipped
+            job_run.finished_at = job_run.started_at
+            job_run.duration_seconds = 0
+            save_job_run(job_run=job_run)
+            return job_run
+
+        save_job_run(job_run=job_run)
+        log.info(f"Running job {job_id} ({trigger.value})")
+        start = time.monotonic()
+        with track_queries() as query_stats:
+            try:
+                result = job() or JobResult()
+                job_run.status = JobRunStatus.succeeded
+                job_run.items_processed = result.items_processed
+                job_run.failures = result.failures
+            except Exception as e:
+                log.error(f"Job {job_id} failed: {e}")
+                job_run.status = JobRunStatus.failed
+                job_run.error = f"{e.__class__.__name__}: {e}"
+        job_run.duration_seconds = time.monotonic() - start
+        job_run.finished_at = datetime.now()
+
+    save_job_run(job_run=job_run)
+    log.info(
+        f"Job {job_id} {job_run.status.value} after {job_run.duration_seconds:.1f}s, "
+        f"processed {job_run.items_processed} items, {job_run.failures} failures, "
+        f"{query_stats.count} queries taking {query_stats.duration_seconds:.1f}s"
+    )
+    config = get_config()
+    if config.misc.development:
+        query_stats.log_repeated_statements(
+            context=f"Job {job_id}",
+            threshold=config.database.repeated_statement_threshold,
+        )
+    job_duration_seconds.labels(job_id, job_run.status.value).observe(
+        job_run.duration_seconds
+    )
+    job_items_processed.labels(job_id).observe(job_run.items_processed)
+    job_failures.labels(job_id).inc(job_run.failures)
+    return job_run
+
+
+def save_job_run(job_run: JobRun) -> None:
+    config = get_config().scheduler
+    try:
+        with next(get_session()) as db, unit_of_work(db):
+            repository = SchedulerRepository(db=db)
+            repository.save_job_run(job_run=job_run)
+            if job_run.finished_at is not None:
+                repository.delete_job_runs_before(
+                    before=datetime.now() - timedelta(days=config.run_history_days)
+                )
+    except Exception as e:
+        log.error(f"Failed to record run of job {job_run.job_id}: {e}")
@@ -0,0 +1,125 @@
+import threading
+from typing import Callable
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+
+from media_manager.scheduler import log
+
+
+class LeaderElection:
+    """
+    Elects a single leader among all MediaManager processes which share a database.
+
+    The leader holds a session-level Postgres advisory lock on a dedicated connection.
+    When the leader dies its connection is closed, Postgres releases the lock and another process
+    acquires it within `retry_seconds`. The connection is checked on the same interval,
+    if it breaks the process steps down.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        lock_id: int,
+        retry_seconds: int,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+    ):
+        # the lock lives as long as the connection, so it must not be returned to a pool
+        self._engine = create_engine(engine.url, poolclass=NullPool)
+        self.lock_id = lock_id
+        self.retry_seconds = retry_seconds
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._connection: Connection | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._connection is not None
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="leader-election", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.retry_seconds + 5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if self.is_leader:
+                self._heartbeat()
+            else:
+                self._try_acquire()
+            self._stop_event.wait(self.retry_seconds)
+        self._release()
+
+    def _try_acquire(self) -> None:
+        connection = None
+        try:
+            connection = self._engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            # lets Postgres notice a dead leader host within seconds, instead of
+            # waiting for the OS level TCP timeout, ignored on unix sockets
+            connection.execute(text("SET tcp_keepalives_idle = 5"))
+            connection.execute(text("SET tcp_keepalives_interval = 2"))
+            connection.execute(text("SET tcp_keepalives_count = 3"))
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:lock_id)"),
+                {"lock_id": self.lock_id},
+            ).scalar_one()
+        except Exception as e:
+            log.warning(f"Leader election failed: {e}")
+            acquired = False
+
+        if not acquired:
+            if connection is not None:
+                connection.close()
+            return
+
+        self._connection = connection
+        log.info("This process is now the leader and runs the scheduled jobs")
+        try:
+            self._on_elected()
+        except Exception as e:
+            log.error(f"Error while taking over leadership: {e}")
+
+    def _heartbeat(self) -> None:
+        try:
+            self._connection.execute(text("SELECT 1"))
+        except Exception as e:
+            log.warning(f"Lost connection holding the leader lock: {e}")
+            self._demote()
+
+    def _release(self) -> None:
+        if not self.is_leader:
+            return
+        try:
+            self._connection.execute(
+                text("SELECT pg_advisory_unlock(:lock_id)"),
+                {"lock_id": self.lock_id},
+            )
+        except Exception as e:
+            log.warning(f"Failed to release the leader lock: {e}")
+        self._demote()
+
+    def _demote(self) -> None:
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+        log.info("This process is no longer the leader")
+        try:
+            self._on_demoted()
+        except Exception as e:
+            log.error(f"Error while stepping down as leader: {e}")
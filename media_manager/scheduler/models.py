@@ -0,0 +1,25 @@
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from media_manager.database import Base
+from media_manager.scheduler.schemas import JobRunStatus, JobTrigger
+
+
+class JobRun(Base):
+    __tablename__ = "scheduler_job_run"
+    __table_args__ = (
+        Index("ix_scheduler_job_run_job_id_started_at", "job_id", "started_at"),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    job_id: Mapped[str]
+    trigger: Mapped[JobTrigger]
+    status: Mapped[JobRunStatus]
+    started_at = mapped_column(DateTime, nullable=False, index=True)
+    finished_at = mapped_column(DateTime, nullable=True)
+    duration_seconds: Mapped[float | None]
+    items_processed: Mapped[int] = mapped_column(default=0)
+    failures: Mapped[int] = mapped_column(default=0)
+    error: Mapped[str | None]
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import select, delete
+from sqlalchemy.orm import Session
+
+from media_manager.exceptions import NotFoundError
+from media_manager.scheduler.models import JobRun
+from media_manager.scheduler.schemas import JobRun as JobRunSchema, JobRunId
+
+
+class SchedulerRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_job_run(self, job_run: JobRunSchema) -> JobRunSchema:
+        self.db.merge(JobRun(**job_run.model_dump()))
+        self.db.flush()
+        return job_run
+
+    def get_job_run(self, job_run_id: JobRunId) -> JobRunSchema:
+        result = self.db.get(JobRun, job_run_id)
+        if result is None:
+            raise NotFoundError(f"Job run with ID {job_run_id} not found.")
+        return JobRunSchema.model_validate(result)
+
+    def get_job_runs(
+        self, job_id: str | None = None, limit: int = 100
+    ) -> list[JobRunSchema]:
+        stmt = select(JobRun).order_by(JobRun.started_at.desc()).limit(limit)
+        if job_id is not None:
+            stmt = stmt.where(JobRun.job_id == job_id)
+        result = self.db.execute(stmt).scalars().all()
+        return [JobRunSchema.model_validate(job_run) for job_run in result]
+
+    def get_last_job_runs(self) -> dict[str, JobRunSchema]:
+        """
+        :return: The most recent run of every job that ran at least once, by job ID.
+        """
+        stmt = (
+            select(JobRun)
+            .distinct(JobRun.job_id)
+            .order_by(JobRun.job_id, JobRun.started_at.desc())
+        )
+        result = self.db.execute(stmt).scalars().all()
+        return {
+            job_run.job_id: JobRunSchema.model_validate(job_run) for job_run in result
+        }
+
+    def delete_job_runs_before(self, before: datetime) -> None:
+        self.db.execute(delete(JobRun).where(JobRun.started_at < before))
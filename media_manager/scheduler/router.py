@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Query, status
+
+from media_manager.auth.users import current_superuser
+from media_manager.scheduler.dependencies import scheduler_service_dep
+from media_manager.scheduler.schemas import JobRun, ScheduledJob
+
+router = APIRouter()
+
+
+@router.get(
+    "/jobs",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    response_model=list[ScheduledJob],
+)
+def get_scheduled_jobs(scheduler_service: scheduler_service_dep):
+    """
+    Get all scheduled jobs together with their last run.
+    """
+    return scheduler_service.get_scheduled_jobs()
+
+
+@router.get(
+    "/runs",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    response_model=list[JobRun],
+)
+def get_job_runs(
+    scheduler_service: scheduler_service_dep,
+    job_id: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """
+    Get the most recent job runs, optionally only those of a single job.
+    """
+    return scheduler_service.get_job_runs(job_id=job_id, limit=limit)
+
+
+@router.post(
+    "/jobs/{job_id}/run",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(current_superuser)],
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Job not found"},
+    },
+)
+def run_job_now(job_id: str, scheduler_service: scheduler_service_dep):
+    """
+    Run a job now. The job runs in the background, check the job runs for its result.
+    """
+    scheduler_service.trigger_job(job_id=job_id)
@@ -0,0 +1,51 @@
+import typing
+import uuid
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ConfigDict
+
+JobRunId = typing.NewType("JobRunId", UUID)
+
+
+class JobRunStatus(Enum):
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    skipped = "skipped"  # another run of the same job was still in progress
+
+
+class JobTrigger(Enum):
+    scheduled = "scheduled"
+    manual = "manual"
+
+
+class JobResult(BaseModel):
+    """
+    Returned by scheduled jobs to report what they did.
+    """
+
+    items_processed: int = 0
+    failures: int = 0
+
+
+class JobRun(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: JobRunId = Field(default_factory=uuid.uuid4)
+    job_id: str
+    trigger: JobTrigger
+    status: JobRunStatus = JobRunStatus.running
+    started_at: datetime = Field(default_factory=datetime.now)
+    finished_at: datetime | None = None
+    duration_seconds: float | None = None
+    items_processed: int = 0
+    failures: int = 0
+    error: str | None = None
+
+
+class ScheduledJob(BaseModel):
+    id: str
+    description: str | None = None
+    last_run: JobRun | None = None
@@ -0,0 +1,46 @@
+import inspect
+import threading
+
+from media_manager.exceptions import NotFoundError
+from media_manager.scheduler.jobs import run_job, scheduled_jobs
+from media_manager.scheduler.repository import SchedulerRepository
+from media_manager.scheduler.schemas import JobRun, JobTrigger, ScheduledJob
+
+
+class SchedulerService:
+    def __init__(self, scheduler_repository: SchedulerRepository):
+        self.scheduler_repository = scheduler_repository
+
+    def get_scheduled_jobs(self) -> list[ScheduledJob]:
+        last_runs = self.scheduler_repository.get_last_job_runs()
+        jobs = []
+        for job_id, job in scheduled_jobs.items():
+            doc = inspect.getdoc(job)
+            jobs.append(
+                ScheduledJob(
+                    id=job_id,
+                    description=doc.splitlines()[0] if doc else None,
+                    last_run=last_runs.get(job_id),
+                )
+            )
+        return jobs
+
+    def get_job_runs(self, job_id: str | None = None, limit: int = 100) -> list[JobRun]:
+        return self.scheduler_repository.get_job_runs(job_id=job_id, limit=limit)
+
+    def trigger_job(self, job_id: str) -> None:
+        """
+        Runs a job now, in the background.
+        If the job is already running, the run is recorded as skipped.
+
+        :param job_id: The ID of the job.
+        :raises NotFoundError: If there is no job with this ID.
+        """
+        if job_id not in scheduled_jobs:
+            raise NotFoundError(f"Job with ID {job_id} not found.")
+        threading.Thread(
+            target=run_job,
+            kwargs={"job_id": job_id, "trigger": JobTrigger.manual},
+            name=f"job-{job_id}",
+            daemon=True,
+        ).start()
@@ -0,0 +1,33 @@
+from typing import AsyncIterator, Iterator
+
+from starlette.responses import StreamingResponse
+
+
+def format_event(event: str, data: str) -> str:
+    """
+    Formats a server-sent event.
+
+    :param event: The type of the event, clients listen for it with addEventListener.
+    :param data: The payload, usually JSON.
+    """
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
+
+class EventStreamResponse(StreamingResponse):
+    """
+    Streams server-sent events to the client, each event is flushed as soon as it is yielded.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content: Iterator[str] | AsyncIterator[str], **kwargs):
+        super().__init__(
+            content,
+            headers={
+                "Cache-Control": "no-cache",
+                # keeps nginx from buffering the whole response
+                "X-Accel-Buffering": "no",
+            },
+            **kwargs,
+        )
@@ -2,7 +2,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class QbittorrentConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="QBITTORRENT_")
+    model_config = SettingsConfigDict(env_prefix="QBITTORRENT_", frozen=True)
     host: str = "localhost"
     port: int = 8080
     username: str = "admin"
@@ -14,7 +14,7 @@ class QbittorrentConfig(BaseSettings):
 
 
 class TransmissionConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="TRANSMISSION_")
+    model_config = SettingsConfigDict(env_prefix="TRANSMISSION_", frozen=True)
     path: str = "/transmission/rpc"
     https_enabled: bool = True
     host: str = "localhost"
@@ -25,7 +25,7 @@ class TransmissionConfig(BaseSettings):
 
 
 class SabnzbdConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="SABNZBD_")
+    model_config = SettingsConfigDict(env_prefix="SABNZBD_", frozen=True)
     host: str = "localhost"
     port: int = 8080
     api_key: str = ""
@@ -33,7 +33,22 @@ class SabnzbdConfig(BaseSettings):
     base_path: str = "/api"
 
 
+class ImportConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
+    worker_count: int = 2
+    max_attempts: int = 5
+    retry_backoff_seconds: int = 60
+    # workers renew the lease of their job while they import it, a job whose lease expired is picked up again,
+    # e.g. after a crash
+    lease_seconds: int = 120
+    poll_interval_seconds: int = 10
+
+
 class TorrentConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
+
     qbittorrent: QbittorrentConfig = QbittorrentConfig()
     transmission: TransmissionConfig = TransmissionConfig()
     sabnzbd: SabnzbdConfig = SabnzbdConfig()
+    imports: ImportConfig = ImportConfig()
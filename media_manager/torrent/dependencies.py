@@ -4,6 +4,7 @@ from fastapi import Depends
 
 from media_manager.exceptions import NotFoundError
 from media_manager.database import DbSessionDependency
+from media_manager.database.replicas import ReadDbSessionDependency
 from media_manager.torrent.service import TorrentService
 from media_manager.torrent.repository import TorrentRepository
 from media_manager.torrent.schemas import TorrentId, Torrent
@@ -24,6 +25,27 @@ def get_torrent_service(torrent_repository: torrent_repository_dep) -> TorrentSe
 torrent_service_dep = Annotated[TorrentService, Depends(get_torrent_service)]
 
 
+def get_read_torrent_repository(db: ReadDbSessionDependency) -> TorrentRepository:
+    return TorrentRepository(db=db)
+
+
+read_torrent_repository_dep = Annotated[
+    TorrentRepository, Depends(get_read_torrent_repository)
+]
+
+
+def get_read_torrent_service(
+    torrent_repository: read_torrent_repository_dep,
+) -> TorrentService:
+    """
+    A TorrentService on a read replica, for routes that only read from the database.
+    """
+    return TorrentService(torrent_repository=torrent_repository)
+
+
+read_torrent_service_dep = Annotated[TorrentService, Depends(get_read_torrent_service)]
+
+
 def get_torrent_by_id(
     torrent_service: torrent_service_dep, torrent_id: TorrentId
 ) -> Torrent:
@@ -1,7 +1,7 @@
 import logging
 
 import transmission_rpc
-from media_manager.config import AllEncompassingConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.download_clients.abstractDownloadClient import (
     AbstractDownloadClient,
@@ -27,7 +27,7 @@ class TransmissionDownloadClient(AbstractDownloadClient):
     }
 
     def __init__(self):
-        self.config = AllEncompassingConfig().torrents.transmission
+        self.config = get_config().torrents.transmission
         try:
             self._client = transmission_rpc.Client(
                 host=self.config.host,
@@ -54,9 +54,7 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         log.info(f"Attempting to download torrent: {indexer_result.title}")
         torrent_hash = get_torrent_hash(torrent=indexer_result)
         log.info(f"parsed torrent hash: {torrent_hash}")
-        download_dir = (
-            AllEncompassingConfig().misc.torrent_directory / indexer_result.title
-        )
+        download_dir = get_config().misc.torrent_directory / indexer_result.title
         try:
             self._client.add_torrent(
                 torrent=str(indexer_result.download_url),
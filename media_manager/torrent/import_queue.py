@@ -0,0 +1,253 @@
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from media_manager.config import get_config
+from media_manager.database import get_session, unit_of_work
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
+from media_manager.exceptions import NotFoundError
+from media_manager.indexer.repository import IndexerRepository
+from media_manager.indexer.service import IndexerService
+from media_manager.movies.repository import MovieRepository
+from media_manager.movies.service import MovieService
+from media_manager.notification.repository import NotificationRepository
+from media_manager.notification.service import NotificationService
+from media_manager.torrent.manager import DownloadManager
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.schemas import ImportJob
+from media_manager.torrent.service import TorrentService
+from media_manager.tv.repository import TvRepository
+from media_manager.tv.service import TvService
+
+log = logging.getLogger(__name__)
+
+
+class ImportWorkerPool:
+    """
+    Runs queued torrent imports on a pool of worker threads.
+    Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so multiple pools (e.g. one per process)
+    can share the queue without ever importing the same torrent twice.
+    """
+
+    def __init__(self):
+        self.config = get_config().torrents.imports
+        self._stop_event = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._download_manager: DownloadManager | None = None
+        self._download_manager_lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for i in range(self.config.worker_count):
+            thread = threading.Thread(
+                target=self._run_worker, name=f"import-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        log.info(f"Started {len(self._threads)} import workers")
+
+    def shutdown(self) -> None:
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+            if thread.is_alive():
+                log.warning(
+                    f"{thread.name} is still importing, its job will be picked up again once its lease expires"
+                )
+        self._threads = []
+
+    def _get_download_manager(self) -> DownloadManager:
+        with self._download_manager_lock:
+            if self._download_manager is None:
+                self._download_manager = DownloadManager()
+            return self._download_manager
+
+    def _run_worker(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                job = self._claim_job()
+            except Exception as e:
+                log.error(f"Failed to claim import job: {e}")
+                job = None
+
+            if job is None:
+                self._stop_event.wait(self.config.poll_interval_seconds)
+                continue
+
+            self._process_job(job=job)
+
+    def _claim_job(self) -> ImportJob | None:
+        with next(get_session()) as db, unit_of_work(db):
+            return TorrentRepository(db=db).claim_next_import_job(
+                lease_seconds=self.config.lease_seconds
+            )
+
+    @contextmanager
+    def _renew_lease(self, job: ImportJob) -> Iterator[None]:
+        """
+        Renews the lease of the job in the background while the block runs,
+        so imports may take longer than lease_seconds.
+        """
+        stop_event = threading.Event()
+
+        def renew() -> None:
+            while not stop_event.wait(self.config.lease_seconds / 3):
+                try:
+                    with next(get_session()) as db, unit_of_work(db):
+                        renewed = TorrentRepository(db=db).renew_import_job_lease(
+                            job_id=job.id,
+                            attempts=job.attempts,
+                            lease_seconds=self.config.lease_seconds,
+                        )
+                except Exception as e:
+                    log.error(f"Failed to renew the lease of import job {job.id}: {e}")
+                    continue
+                if not renewed:
+                    log.warning(
+                        f"Lost the lease of import job {job.id}, another worker took it over"
+                    )
+                    return
+
+        thread = threading.Thread(
+            target=renew, name=f"import-lease-{job.id}", daemon=True
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            stop_event.set()
+            thread.join()
+
+    def _process_job(self, job: ImportJob) -> None:
+        log.info(f"Processing import job {job.id} (attempt {job.attempts})")
+        event_bus.publish(EventType.import_progress, job)
+        retry_at: datetime | None = None
+        retryable = True
+        try:
+            with self._renew_lease(job=job):
+                imported = self._import_torrent(job=job)
+            if imported:
+                with next(get_session()) as db, unit_of_work(db):
+                    finished_job = TorrentRepository(db=db).finish_import_job(
+                        job_id=job.id, attempts=job.attempts
+                    )
+                if finished_job is None:
+                    log.warning(
+                        f"Import job {job.id} finished after its lease was taken over, dropping the result"
+                    )
+                    return
+                log.info(f"Import job {job.id} finished")
+                event_bus.publish(EventType.import_progress, finished_job)
+                return
+            error = "Not all files of the torrent could be imported"
+            log.warning(f"Import job {job.id} did not import all files")
+        except NotFoundError as e:
+            error = str(e)
+            retryable = False
+            log.error(f"Import job {job.id} failed permanently: {e}")
+        except Exception as e:
+            error = f"{e.__class__.__name__}: {e}"
+            log.error(f"Import job {job.id} failed: {error}")
+
+        if retryable and job.attempts < self.config.max_attempts:
+            retry_at = datetime.now() + timedelta(
+                seconds=self.config.retry_backoff_seconds * 2 ** (job.attempts - 1)
+            )
+            log.info(f"Retrying import job {job.id} at {retry_at}")
+
+        try:
+            with next(get_session()) as db, unit_of_work(db):
+                failed_job = TorrentRepository(db=db).fail_import_job(
+                    job_id=job.id, attempts=job.attempts, error=error, retry_at=retry_at
+                )
+            if failed_job is None:
+                log.warning(
+                    f"Import job {job.id} failed after its lease was taken over, dropping the result"
+                )
+                return
+            event_bus.publish(EventType.import_progress, failed_job)
+        except Exception as e:
+            log.error(f"Failed to record failure of import job {job.id}: {e}")
+
+    def _import_torrent(self, job: ImportJob) -> bool:
+        """
+        Imports the torrent of an import job.
+
+        :return: True if the torrent is imported afterwards.
+        :raises NotFoundError: If the torrent does not belong to any show or movie.
+        """
+        # the session only holds a connection while a unit of work is open, the files are copied in between, so a
+        # long copy or hardlink doesn't keep a transaction open and a pooled connection checked out
+        with next(get_session()) as db:
+            torrent_repository = TorrentRepository(db=db)
+            torrent_service = TorrentService(
+                torrent_repository=torrent_repository,
+                download_manager=self._get_download_manager(),
+            )
+            indexer_service = IndexerService(
+                indexer_repository=IndexerRepository(db=db)
+            )
+            notification_service = NotificationService(
+                notification_repository=NotificationRepository(db=db)
+            )
+            tv_service = TvService(
+                tv_repository=TvRepository(db=db),
+                torrent_service=torrent_service,
+                indexer_service=indexer_service,
+                notification_service=notification_service,
+            )
+            movie_service = MovieService(
+                movie_repository=MovieRepository(db=db),
+                torrent_service=torrent_service,
+                indexer_service=indexer_service,
+                notification_service=notification_service,
+            )
+
+            with unit_of_work(db):
+                torrent = torrent_repository.get_torrent_by_id(
+                    torrent_id=job.torrent_id
+                )
+                if torrent.imported:
+                    return True
+                show = torrent_service.get_show_of_torrent(torrent=torrent)
+                if show is not None:
+                    seasons = tv_service.get_seasons_of_torrent(torrent=torrent)
+                else:
+                    movie = torrent_service.get_movie_of_torrent(torrent=torrent)
+                    if movie is None:
+                        raise NotFoundError(
+                            f"Torrent {torrent.title} is neither a show nor a movie torrent."
+                        )
+                    movie_files = torrent_service.get_movie_files_of_torrent(
+                        torrent=torrent
+                    )
+
+            if show is not None:
+                missing_episodes = tv_service.import_torrent_files(
+                    torrent=torrent, show=show, seasons=seasons
+                )
+                with unit_of_work(db):
+                    tv_service.finish_torrent_import(
+                        torrent=torrent, show=show, missing_episodes=missing_episodes
+                    )
+            else:
+                success, video_file_count = movie_service.import_torrent_files(
+                    torrent=torrent, movie=movie, movie_files=movie_files
+                )
+                with unit_of_work(db):
+                    movie_service.finish_torrent_import(
+                        torrent=torrent,
+                        movie=movie,
+                        success=success,
+                        video_file_count=video_file_count,
+                    )
+
+            return torrent.imported
+
+
+import_worker_pool = ImportWorkerPool()
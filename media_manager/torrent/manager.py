@@ -1,7 +1,9 @@
 import logging
 from enum import Enum
 
-from media_manager.config import AllEncompassingConfig
+from prometheus_client import Histogram
+
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.download_clients.abstractDownloadClient import (
     AbstractDownloadClient,
@@ -15,6 +17,12 @@ from media_manager.torrent.schemas import Torrent, TorrentStatus
 
 log = logging.getLogger(__name__)
 
+download_client_request_duration_seconds = Histogram(
+    "mediamanager_download_client_request_duration_seconds",
+    "Duration of calls to the download clients",
+    ["client", "method"],
+)
+
 
 class DownloadClientType(Enum):
     """Types of download clients supported"""
@@ -33,7 +41,7 @@ class DownloadManager:
     def __init__(self):
         self._torrent_client: AbstractDownloadClient | None = None
         self._usenet_client: AbstractDownloadClient | None = None
-        self.config = AllEncompassingConfig().torrents
+        self.config = get_config().torrents
         self._initialize_clients()
 
     def _initialize_clients(self) -> None:
@@ -113,7 +121,10 @@ class DownloadManager:
         log.info(f"Processing download request for: {indexer_result.title}")
 
         client = self._get_appropriate_client(indexer_result)
-        return client.download_torrent(indexer_result)
+        with download_client_request_duration_seconds.labels(
+            client.name, "download_torrent"
+        ).time():
+            return client.download_torrent(indexer_result)
 
     def remove_torrent(self, torrent: Torrent, delete_data: bool = False) -> None:
         """
@@ -125,7 +136,10 @@ class DownloadManager:
         log.info(f"Removing torrent: {torrent.title}")
 
         client = self._get_appropriate_client(torrent)
-        client.remove_torrent(torrent, delete_data)
+        with download_client_request_duration_seconds.labels(
+            client.name, "remove_torrent"
+        ).time():
+            client.remove_torrent(torrent, delete_data)
 
     def get_torrent_status(self, torrent: Torrent) -> TorrentStatus:
         """
@@ -135,7 +149,10 @@ class DownloadManager:
         :return: The current status of the torrent
         """
         client = self._get_appropriate_client(torrent)
-        return client.get_torrent_status(torrent)
+        with download_client_request_duration_seconds.labels(
+            client.name, "get_torrent_status"
+        ).time():
+            return client.get_torrent_status(torrent)
 
     def pause_torrent(self, torrent: Torrent) -> None:
         """
@@ -146,7 +163,10 @@ class DownloadManager:
         log.info(f"Pausing torrent: {torrent.title}")
 
         client = self._get_appropriate_client(torrent)
-        client.pause_torrent(torrent)
+        with download_client_request_duration_seconds.labels(
+            client.name, "pause_torrent"
+        ).time():
+            client.pause_torrent(torrent)
 
     def resume_torrent(self, torrent: Torrent) -> None:
         """
@@ -157,4 +177,7 @@ class DownloadManager:
         log.info(f"Resuming torrent: {torrent.title}")
 
         client = self._get_appropriate_client(torrent)
-        client.resume_torrent(torrent)
+        with download_client_request_duration_seconds.labels(
+            client.name, "resume_torrent"
+        ).time():
+            client.resume_torrent(torrent)
@@ -1,9 +1,10 @@
 from uuid import UUID
 
+from sqlalchemy import DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from media_manager.database import Base
-from media_manager.torrent.schemas import Quality, TorrentStatus
+from media_manager.torrent.schemas import Quality, TorrentStatus, ImportJobStatus
 
 
 class Torrent(Base):
@@ -18,3 +19,20 @@ class Torrent(Base):
 
     season_files = relationship("SeasonFile", back_populates="torrent")
     movie_files = relationship("MovieFile", back_populates="torrent")
+
+
+class ImportJob(Base):
+    __tablename__ = "import_job"
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    torrent_id: Mapped[UUID] = mapped_column(
+        ForeignKey(column="torrent.id", ondelete="CASCADE"), unique=True
+    )
+    status: Mapped[ImportJobStatus]
+    attempts: Mapped[int] = mapped_column(default=0)
+    run_at = mapped_column(DateTime, nullable=False)
+    locked_until = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[str | None]
+    created_at = mapped_column(DateTime, nullable=False)
+    updated_at = mapped_column(DateTime, nullable=False)
+
+    torrent = relationship("Torrent", uselist=False)
@@ -1,11 +1,22 @@
-from sqlalchemy import select
+import uuid
+from datetime import datetime, timedelta
 
+from sqlalchemy import select, or_, and_, update
+from sqlalchemy.dialects.postgresql import insert
+
+from media_manager.database.async_repository import AsyncRepository
 from media_manager.database import DbSessionDependency
-from media_manager.torrent.models import Torrent
-from media_manager.torrent.schemas import TorrentId, Torrent as TorrentSchema
+from media_manager.torrent.models import Torrent, ImportJob
+from media_manager.torrent.schemas import (
+    TorrentId,
+    Torrent as TorrentSchema,
+    ImportJob as ImportJobSchema,
+    ImportJobId,
+    ImportJobStatus,
+)
 from media_manager.tv.models import SeasonFile, Show, Season
 from media_manager.tv.schemas import SeasonFile as SeasonFileSchema, Show as ShowSchema
-from media_manager.exceptions import NotFoundError
+from media_manager.exceptions import ConflictError, NotFoundError
 from media_manager.movies.models import Movie, MovieFile
 from media_manager.movies.schemas import (
     Movie as MovieSchema,
@@ -38,7 +49,7 @@ class TorrentRepository:
 
     def save_torrent(self, torrent: TorrentSchema) -> TorrentSchema:
         self.db.merge(Torrent(**torrent.model_dump()))
-        self.db.commit()
+        self.db.flush()
         return TorrentSchema.model_validate(torrent)
 
     def get_all_torrents(self) -> list[TorrentSchema]:
@@ -73,3 +84,202 @@ class TorrentRepository:
         stmt = select(MovieFile).where(MovieFile.torrent_id == torrent_id)
         result = self.db.execute(stmt).scalars().all()
         return [MovieFileSchema.model_validate(movie_file) for movie_file in result]
+
+    def enqueue_import_job(self, torrent_id: TorrentId) -> None:
+        """
+        Creates a pending import job for a torrent.
+        Does nothing if the torrent already has an open job, a finished job is reset,
+        because that means the torrent was marked as not imported again.
+
+        :param torrent_id: The ID of the torrent to import.
+        """
+        now = datetime.now()
+        stmt = (
+            insert(ImportJob)
+            .values(
+                id=uuid.uuid4(),
+                torrent_id=torrent_id,
+                status=ImportJobStatus.pending,
+                attempts=0,
+                run_at=now,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_update(
+                index_elements=[ImportJob.torrent_id],
+                set_={
+                    "status": ImportJobStatus.pending,
+                    "attempts": 0,
+                    "run_at": now,
+                    "last_error": None,
+                    "updated_at": now,
+                },
+                where=ImportJob.status == ImportJobStatus.finished,
+            )
+        )
+        self.db.execute(stmt)
+
+    def claim_next_import_job(self, lease_seconds: int) -> ImportJobSchema | None:
+        """
+        Claims the next due import job, skipping jobs that are locked by other workers.
+        Running jobs whose lease has expired are claimed again.
+        The row stays locked until the transaction is committed, so claim the job in its own unit of work.
+
+        :param lease_seconds: How long the claimed job is reserved for this worker.
+        :return: The claimed job or None if no job is due.
+        """
+        now = datetime.now()
+        stmt = (
+            select(ImportJob)
+            .where(
+                or_(
+                    and_(
+                        ImportJob.status == ImportJobStatus.pending,
+                        ImportJob.run_at <= now,
+                    ),
+                    and_(
+                        ImportJob.status == ImportJobStatus.running,
+                        ImportJob.locked_until < now,
+                    ),
+                )
+            )
+            .order_by(ImportJob.run_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = self.db.execute(stmt).scalar_one_or_none()
+        if job is None:
+            return None
+        job.status = ImportJobStatus.running
+        job.attempts += 1
+        job.locked_until = now + timedelta(seconds=lease_seconds)
+        job.updated_at = now
+        self.db.flush()
+        return ImportJobSchema.model_validate(job)
+
+    def _update_claimed_import_job(
+        self, job_id: ImportJobId, attempts: int, **values
+    ) -> ImportJobSchema | None:
+        # the attempt identifies the claim, a worker whose lease expired and was taken over must not overwrite
+        # the state set by the worker that holds the job now
+        stmt = (
+            update(ImportJob)
+            .where(
+                ImportJob.id == job_id,
+                ImportJob.status == ImportJobStatus.running,
+                ImportJob.attempts == attempts,
+            )
+            .values(**values, updated_at=datetime.now())
+            .returning(ImportJob)
+            .execution_options(synchronize_session=False)
+        )
+        job = self.db.execute(stmt).scalar_one_or_none()
+        return ImportJobSchema.model_validate(job) if job is not None else None
+
+    def renew_import_job_lease(
+        self, job_id: ImportJobId, attempts: int, lease_seconds: int
+    ) -> bool:
+        """
+        Extends the lease of a claimed import job.
+
+        :param job_id: The ID of the import job.
+        :param attempts: The attempt of the claim, as returned by claim_next_import_job.
+        :param lease_seconds: How long the job stays reserved from now on.
+        :return: False if the claim was lost, because the lease expired and another worker took the job over.
+        """
+        job = self._update_claimed_import_job(
+            job_id=job_id,
+            attempts=attempts,
+            locked_until=datetime.now() + timedelta(seconds=lease_seconds),
+        )
+        return job is not None
+
+    def finish_import_job(
+        self, job_id: ImportJobId, attempts: int
+    ) -> ImportJobSchema | None:
+        """
+        Marks a claimed import job as finished.
+
+        :param job_id: The ID of the import job.
+        :param attempts: The attempt of the claim, as returned by claim_next_import_job.
+        :return: The finished job, or None if the claim was lost.
+        """
+        return self._update_claimed_import_job(
+            job_id=job_id,
+            attempts=attempts,
+            status=ImportJobStatus.finished,
+            locked_until=None,
+            last_error=None,
+        )
+
+    def fail_import_job(
+        self, job_id: ImportJobId, attempts: int, error: str, retry_at: datetime | None
+    ) -> ImportJobSchema | None:
+        """
+        Records a failed attempt of a claimed import job.
+
+        :param job_id: The ID of the import job.
+        :param attempts: The attempt of the claim, as returned by claim_next_import_job.
+        :param error: A summary of the error.
+        :param retry_at: When to retry the job, None marks the job as failed for good.
+        :return: The updated job, or None if the claim was lost.
+        """
+        values = {"run_at": retry_at} if retry_at is not None else {}
+        return self._update_claimed_import_job(
+            job_id=job_id,
+            attempts=attempts,
+            status=ImportJobStatus.pending
+            if retry_at is not None
+            else ImportJobStatus.failed,
+            locked_until=None,
+            last_error=error,
+            **values,
+        )
+
+    def retry_import_job(self, job_id: ImportJobId) -> ImportJobSchema:
+        """
+        Resets a failed or finished import job, so that it is claimed again.
+
+        :param job_id: The ID of the import job.
+        :raises ConflictError: If the job is pending or running, resetting a running job would start a second
+            import of the same torrent while the first one is still copying files.
+        """
+        # the row lock keeps workers from claiming the job between the check and the reset
+        job = self.db.get(ImportJob, job_id, with_for_update=True)
+        if job is None:
+            raise NotFoundError(f"Import job with ID {job_id} not found.")
+        if job.status not in (ImportJobStatus.failed, ImportJobStatus.finished):
+            raise ConflictError(
+                f"Import job with ID {job_id} is {job.status.value}, only failed or finished jobs can be retried."
+            )
+        now = datetime.now()
+        job.status = ImportJobStatus.pending
+        job.attempts = 0
+        job.run_at = now
+        job.locked_until = None
+        job.updated_at = now
+        self.db.flush()
+        return ImportJobSchema.model_validate(job)
+
+    def get_import_job(self, job_id: ImportJobId) -> ImportJobSchema:
+        result = self.db.get(ImportJob, job_id)
+        if result is None:
+            raise NotFoundError(f"Import job with ID {job_id} not found.")
+        return ImportJobSchema.model_validate(result)
+
+    def get_import_jobs(
+        self, status: ImportJobStatus | None = None
+    ) -> list[ImportJobSchema]:
+        stmt = select(ImportJob).order_by(ImportJob.updated_at.desc())
+        if status is not None:
+            stmt = stmt.where(ImportJob.status == status)
+        result = self.db.execute(stmt).scalars().all()
+        return [ImportJobSchema.model_validate(job) for job in result]
+
+
+class AsyncTorrentRepository(AsyncRepository[TorrentRepository]):
+    """
+    The methods of TorrentRepository, awaitable on an AsyncSession.
+    """
+
+    repository_class = TorrentRepository
@@ -6,11 +6,19 @@ from fastapi.params import Depends
 
 from media_manager.auth.users import current_active_user, current_superuser
 from media_manager.torrent.dependencies import (
+    read_torrent_service_dep,
     torrent_service_dep,
     torrent_dep,
     torrent_repository_dep,
 )
-from media_manager.torrent.schemas import Torrent, TorrentStatus
+from media_manager.exceptions import ConflictError, NotFoundError
+from media_manager.torrent.schemas import (
+    Torrent,
+    TorrentStatus,
+    ImportJob,
+    ImportJobId,
+    ImportJobStatus,
+)
 
 router = APIRouter()
 
@@ -25,6 +33,57 @@ def get_all_torrents(service: torrent_service_dep):
     return service.get_all_torrents()
 
 
+@router.get(
+    "/imports",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    response_model=list[ImportJob],
+)
+def get_import_jobs(
+    service: read_torrent_service_dep, state: ImportJobStatus | None = None
+):
+    """
+    Lists the jobs of the import queue, optionally filtered by their status.
+    """
+    return service.get_import_jobs(status=state)
+
+
+@router.get(
+    "/imports/{job_id}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    response_model=ImportJob,
+)
+def get_import_job(service: torrent_service_dep, job_id: ImportJobId):
+    try:
+        return service.get_import_job(job_id=job_id)
+    except NotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Import job with ID {job_id} not found"
+        )
+
+
+@router.post(
+    "/imports/{job_id}/retry",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(current_superuser)],
+    response_model=ImportJob,
+)
+def retry_import_job(service: torrent_service_dep, job_id: ImportJobId):
+    """
+    Resets a failed or finished import job, so that it is picked up again by the import workers.
+    Pending and running jobs can't be retried.
+    """
+    try:
+        return service.retry_import_job(job_id=job_id)
+    except NotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Import job with ID {job_id} not found"
+        )
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=e.message)
+
+
 @router.get("/{torrent_id}", status_code=status.HTTP_200_OK, response_model=Torrent)
 def get_torrent(service: torrent_service_dep, torrent: torrent_dep):
     return service.get_torrent_by_id(torrent_id=torrent.id)
@@ -1,10 +1,12 @@
 import typing
 import uuid
+from datetime import datetime
 from enum import Enum
 
 from pydantic import ConfigDict, BaseModel, Field
 
 TorrentId = typing.NewType("TorrentId", uuid.UUID)
+ImportJobId = typing.NewType("ImportJobId", uuid.UUID)
 
 
 class Quality(Enum):
@@ -30,6 +32,13 @@ class TorrentStatus(Enum):
     unknown = 4
 
 
+class ImportJobStatus(Enum):
+    pending = "pending"
+    running = "running"
+    finished = "finished"
+    failed = "failed"
+
+
 class Torrent(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -40,3 +49,17 @@ class Torrent(BaseModel):
     imported: bool
     hash: str
     usenet: bool = False
+
+
+class ImportJob(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: ImportJobId = Field(default_factory=uuid.uuid4)
+    torrent_id: TorrentId
+    status: ImportJobStatus = ImportJobStatus.pending
+    attempts: int = 0
+    run_at: datetime = Field(default_factory=datetime.now)
+    locked_until: datetime | None = None
+    last_error: str | None = None
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
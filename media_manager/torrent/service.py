@@ -1,9 +1,18 @@
 import logging
 
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.manager import DownloadManager
 from media_manager.torrent.repository import TorrentRepository
-from media_manager.torrent.schemas import Torrent, TorrentId
+from media_manager.torrent.schemas import (
+    Torrent,
+    TorrentId,
+    ImportJob,
+    ImportJobId,
+    ImportJobStatus,
+    TorrentStatus,
+)
 from media_manager.tv.schemas import SeasonFile, Show
 from media_manager.movies.schemas import Movie
 
@@ -55,9 +64,14 @@ class TorrentService:
     def get_torrent_status(self, torrent: Torrent) -> Torrent:
         log.info(f"Fetching status for torrent: {torrent.title}")
 
+        previous_status = torrent.status
         torrent.status = self.download_manager.get_torrent_status(torrent)
 
         self.torrent_repository.save_torrent(torrent=torrent)
+        if torrent.status != previous_status:
+            event_bus.publish_after_commit(
+                self.torrent_repository.db, EventType.torrent_status, torrent
+            )
         return torrent
 
     def cancel_download(self, torrent: Torrent, delete_files: bool = False) -> Torrent:
@@ -111,3 +125,23 @@ class TorrentService:
 
     def get_movie_files_of_torrent(self, torrent: Torrent):
         return self.torrent_repository.get_movie_files_of_torrent(torrent_id=torrent.id)
+
+    def enqueue_import(self, torrent: Torrent) -> None:
+        """
+        Queues a torrent for import by the import workers, if it is finished and not imported yet.
+
+        :param torrent: the torrent to import
+        """
+        if torrent.imported or torrent.status != TorrentStatus.finished:
+            return
+        log.debug(f"Queueing import of torrent {torrent.title}")
+        self.torrent_repository.enqueue_import_job(torrent_id=torrent.id)
+
+    def get_import_jobs(self, status: ImportJobStatus | None = None) -> list[ImportJob]:
+        return self.torrent_repository.get_import_jobs(status=status)
+
+    def get_import_job(self, job_id: ImportJobId) -> ImportJob:
+        return self.torrent_repository.get_import_job(job_id=job_id)
+
+    def retry_import_job(self, job_id: ImportJobId) -> ImportJob:
+        return self.torrent_repository.retry_import_job(job_id=job_id)
@@ -2,6 +2,7 @@ import hashlib
 import logging
 import mimetypes
 import re
+import time
 from pathlib import Path, UnsupportedOperation
 import shutil
 
@@ -9,12 +10,25 @@ import bencoder
 import patoolib
 import requests
 import libtorrent
-from media_manager.config import AllEncompassingConfig
+from prometheus_client import Counter, Histogram
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.schemas import Torrent
 
 log = logging.getLogger(__name__)
 
+imported_bytes = Counter(
+    "mediamanager_imported_bytes_total",
+    "Bytes of imported files, by whether they were hardlinked or copied",
+    ["method"],
+)
+import_file_duration_seconds = Histogram(
+    "mediamanager_import_file_duration_seconds",
+    "Duration of importing a single file",
+    ["method"],
+    buckets=(0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600),
+)
+
 
 def list_files_recursively(path: Path = Path(".")) -> list[Path]:
     files = list(path.glob("**/*"))
@@ -59,22 +73,28 @@ def extract_archives(files):
 
 
 def get_torrent_filepath(torrent: Torrent):
-    return AllEncompassingConfig().misc.torrent_directory / torrent.title
+    return get_config().misc.torrent_directory / torrent.title
 
 
 def import_file(target_file: Path, source_file: Path):
     if target_file.exists():
         target_file.unlink()
 
+    start = time.perf_counter()
+    method = "hardlink"
     try:
         target_file.hardlink_to(source_file)
     except FileExistsError:
         log.error(f"File already exists at {target_file}.")
+        return
     except (OSError, UnsupportedOperation, NotImplementedError) as e:
         log.error(
             f"Failed to create hardlink from {source_file} to {target_file}: {e}. Falling back to copying the file."
         )
+        method = "copy"
         shutil.copy(src=source_file, dst=target_file)
+    import_file_duration_seconds.labels(method).observe(time.perf_counter() - start)
+    imported_bytes.labels(method).inc(source_file.stat().st_size)
 
 
 def get_files_for_import(
@@ -124,9 +144,7 @@ def get_torrent_hash(torrent: IndexerQueryResult) -> str:
     :param torrent: The torrent object.
     :return: The hash of the torrent.
     """
-    torrent_filepath = (
-        AllEncompassingConfig().misc.torrent_directory / f"{torrent.title}.torrent"
-    )
+    torrent_filepath = get_config().misc.torrent_directory / f"{torrent.title}.torrent"
     if torrent_filepath.exists():
         log.warning(f"Torrent file already exists at: {torrent_filepath}")
 
@@ -187,8 +205,8 @@ def strip_trailing_year(title: str) -> str:
 
 def detect_unknown_media(path: Path) -> list[Path]:
     libraries = []
-    libraries.extend(AllEncompassingConfig().misc.movie_libraries)
-    libraries.extend(AllEncompassingConfig().misc.tv_libraries)
+    libraries.extend(get_config().misc.movie_libraries)
+    libraries.extend(get_config().misc.tv_libraries)
 
     show_dirs = path.glob("*")
     log.debug(f"Using Directory {path}")
@@ -3,13 +3,17 @@ from typing import Annotated
 from fastapi import Depends, Path
 
 from media_manager.database import DbSessionDependency
+from media_manager.database.replicas import ReadDbSessionDependency
 from media_manager.tv.repository import TvRepository
 from media_manager.tv.schemas import Show, ShowId, SeasonId, Season
 from media_manager.tv.service import TvService
 from media_manager.exceptions import NotFoundError
 from fastapi import HTTPException
 from media_manager.indexer.dependencies import indexer_service_dep
-from media_manager.torrent.dependencies import torrent_service_dep
+from media_manager.torrent.dependencies import (
+    read_torrent_service_dep,
+    torrent_service_dep,
+)
 from media_manager.notification.dependencies import notification_service_dep
 
 
@@ -37,6 +41,33 @@ def get_tv_service(
 tv_service_dep = Annotated[TvService, Depends(get_tv_service)]
 
 
+def get_read_tv_repository(db_session: ReadDbSessionDependency) -> TvRepository:
+    return TvRepository(db_session)
+
+
+read_tv_repository_dep = Annotated[TvRepository, Depends(get_read_tv_repository)]
+
+
+def get_read_tv_service(
+    tv_repository: read_tv_repository_dep,
+    torrent_service: read_torrent_service_dep,
+    indexer_service: indexer_service_dep,
+    notification_service: notification_service_dep,
+) -> TvService:
+    """
+    A TvService on a read replica, for routes that only read from the database.
+    """
+    return TvService(
+        tv_repository=tv_repository,
+        torrent_service=torrent_service,
+        indexer_service=indexer_service,
+        notification_service=notification_service,
+    )
+
+
+read_tv_service_dep = Annotated[TvService, Depends(get_read_tv_service)]
+
+
 def get_show_by_id(
     tv_service: tv_service_dep,
     show_id: ShowId = Path(..., description="The ID of the show"),
@@ -54,6 +85,16 @@ def get_show_by_id(
 show_dep = Annotated[Show, Depends(get_show_by_id)]
 
 
+def get_read_show_by_id(
+    tv_service: read_tv_service_dep,
+    show_id: ShowId = Path(..., description="The ID of the show"),
+) -> Show:
+    return get_show_by_id(tv_service=tv_service, show_id=show_id)
+
+
+read_show_dep = Annotated[Show, Depends(get_read_show_by_id)]
+
+
 def get_season_by_id(
     tv_service: tv_service_dep,
     season_id: SeasonId = Path(..., description="The ID of the season"),
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, PrimaryKeyConstraint, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from media_manager.auth.db import User
@@ -10,7 +10,11 @@ from media_manager.torrent.models import Quality
 
 class Show(Base):
     __tablename__ = "show"
-    __table_args__ = (UniqueConstraint("external_id", "metadata_provider"),)
+    __table_args__ = (
+        UniqueConstraint("external_id", "metadata_provider"),
+        # most shows have ended, only the running ones are looked up by this column
+        Index("ix_show_not_ended", "ended", postgresql_where=text("NOT ended")),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True)
     external_id: Mapped[int]
@@ -74,7 +78,7 @@ class SeasonFile(Base):
         ForeignKey(column="season.id", ondelete="CASCADE"),
     )
     torrent_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey(column="torrent.id", ondelete="SET NULL"),
+        ForeignKey(column="torrent.id", ondelete="SET NULL"), index=True
     )
     file_path_suffix: Mapped[str]
     quality: Mapped[Quality]
@@ -1,10 +1,12 @@
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, update
 from sqlalchemy.exc import (
     IntegrityError,
     SQLAlchemyError,
 )  # Keep SQLAlchemyError for broader exception handling
 from sqlalchemy.orm import Session, joinedload
 
+from media_manager.database import pipeline
+from media_manager.database.async_repository import AsyncRepository
 from media_manager.torrent.models import Torrent
 from media_manager.torrent.schemas import TorrentId, Torrent as TorrentSchema
 from media_manager.tv import log
@@ -88,10 +90,11 @@ class TvRepository:
             )
             raise
 
-    def get_shows(self) -> list[ShowSchema]:
+    def get_shows(self, ended: bool | None = None) -> list[ShowSchema]:
         """
         Retrieve all shows from the database.
 
+        :param ended: Only return shows that have (not) ended, all shows if None.
         :return: A list of Show objects.
         :raises SQLAlchemyError: If a database error occurs.
         """
@@ -99,6 +102,9 @@ class TvRepository:
             stmt = select(Show).options(
                 joinedload(Show.seasons).joinedload(Season.episodes)
             )  # Eager load seasons and episodes
+            if ended is not None:
+                # without a bound parameter, so the planner can use the partial index on running shows
+                stmt = stmt.where(Show.ended if ended else ~Show.ended)
             results = self.db.execute(stmt).scalars().unique().all()
             return [ShowSchema.model_validate(show) for show in results]
         except SQLAlchemyError as e:
@@ -124,11 +130,26 @@ class TvRepository:
 
         :param show: The Show object to save.
         :return: The saved Show object.
-        :raises ValueError: If a show with the same primary key already exists (on insert).
+        :raises MediaAlreadyExists: If a show with the same primary key already exists (on insert).
         :raises SQLAlchemyError: If a database error occurs.
         """
         db_show = self.db.get(Show, show.id) if show.id else None
 
+        try:
+            # a savepoint, so a conflict leaves the surrounding transaction usable
+            with self.db.begin_nested():
+                db_show = self._save_show(db_show=db_show, show=show)
+            self.db.refresh(db_show)
+            return ShowSchema.model_validate(db_show)
+        except IntegrityError as e:
+            raise MediaAlreadyExists(
+                f"Show with this primary key or unique constraint violation: {e.orig}"
+            ) from e
+        except SQLAlchemyError as e:
+            log.error(f"Database error while saving show {show.name}: {e}")
+            raise
+
+    def _save_show(self, db_show: Show | None, show: ShowSchema) -> Show:
         if db_show:  # Update existing show
             db_show.external_id = show.external_id
             db_show.metadata_provider = show.metadata_provider
@@ -167,20 +188,7 @@ class TvRepository:
                 ],
             )
             self.db.add(db_show)
-
-        try:
-            self.db.commit()
-            self.db.refresh(db_show)
-            return ShowSchema.model_validate(db_show)
-        except IntegrityError as e:
-            self.db.rollback()
-            raise MediaAlreadyExists(
-                f"Show with this primary key or unique constraint violation: {e.orig}"
-            ) from e
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            log.error(f"Database error while saving show {show.name}: {e}")
-            raise
+        return db_show
 
     def delete_show(self, show_id: ShowId) -> None:
         """
@@ -195,9 +203,8 @@ class TvRepository:
             if not show:
                 raise NotFoundError(f"Show with id {show_id} not found.")
             self.db.delete(show)
-            self.db.commit()
+            self.db.flush()
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while deleting show {show_id}: {e}")
             raise
 
@@ -244,16 +251,14 @@ class TvRepository:
             else None,
         )
         try:
-            self.db.add(db_model)
-            self.db.commit()
+            with self.db.begin_nested():
+                self.db.add(db_model)
             self.db.refresh(db_model)
             return SeasonRequestSchema.model_validate(db_model)
         except IntegrityError as e:
-            self.db.rollback()
             log.error(f"Integrity error while adding season request: {e}")
             raise
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while adding season request: {e}")
             raise
 
@@ -269,13 +274,10 @@ class TvRepository:
             stmt = delete(SeasonRequest).where(SeasonRequest.id == season_request_id)
             result = self.db.execute(stmt)
             if result.rowcount == 0:
-                self.db.rollback()
                 raise NotFoundError(
                     f"SeasonRequest with id {season_request_id} not found."
                 )
-            self.db.commit()
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(
                 f"Database error while deleting season request {season_request_id}: {e}"
             )
@@ -353,16 +355,14 @@ class TvRepository:
         """
         db_model = SeasonFile(**season_file.model_dump())
         try:
-            self.db.add(db_model)
-            self.db.commit()
+            with self.db.begin_nested():
+                self.db.add(db_model)
             self.db.refresh(db_model)
             return SeasonFileSchema.model_validate(db_model)
         except IntegrityError as e:
-            self.db.rollback()
             log.error(f"Integrity error while adding season file: {e}")
             raise
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error while adding season file: {e}")
             raise
 
@@ -377,11 +377,9 @@ class TvRepository:
         try:
             stmt = delete(SeasonFile).where(SeasonFile.torrent_id == torrent_id)
             result = self.db.execute(stmt)
-            self.db.commit()
             deleted_count = result.rowcount  # rowcount is an int, not a callable
             return deleted_count
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(
                 f"Database error removing season files for torrent_id {torrent_id}: {e}"
             )
@@ -401,9 +399,8 @@ class TvRepository:
             if not show:
                 raise NotFoundError(f"Show with id {show_id} not found.")
             show.library = library
-            self.db.commit()
+            self.db.flush()
         except SQLAlchemyError as e:
-            self.db.rollback()
             log.error(f"Database error setting library for show {show_id}: {e}")
             raise
 
@@ -590,7 +587,7 @@ class TvRepository:
         )
 
         self.db.add(db_season)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(db_season)
         return SeasonSchema.model_validate(db_season)
 
@@ -629,7 +626,7 @@ class TvRepository:
         )
 
         self.db.add(db_episode)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(db_episode)
         return EpisodeSchema.model_validate(db_episode)
 
@@ -676,7 +673,7 @@ class TvRepository:
             db_show.continuous_download = continuous_download
             updated = True
         if updated:
-            self.db.commit()
+            self.db.flush()
             self.db.refresh(db_show)
         return ShowSchema.model_validate(db_show)
 
@@ -707,7 +704,7 @@ class TvRepository:
             updated = True
 
         if updated:
-            self.db.commit()
+            self.db.flush()
             self.db.refresh(db_season)
         return SeasonSchema.model_validate(db_season)
 
@@ -734,6 +731,26 @@ class TvRepository:
             updated = True
 
         if updated:
-            self.db.commit()
+            self.db.flush()
             self.db.refresh(db_episode)
         return EpisodeSchema.model_validate(db_episode)
+
+    def update_episode_titles(self, titles: dict[EpisodeId, str]) -> None:
+        """
+        Updates the titles of many episodes at once, the updates are sent in pipeline mode.
+
+        :param titles: The new title of each episode.
+        """
+        with pipeline(self.db):
+            for episode_id, title in titles.items():
+                self.db.execute(
+                    update(Episode).where(Episode.id == episode_id).values(title=title)
+                )
+
+
+class AsyncTvRepository(AsyncRepository[TvRepository]):
+    """
+    The methods of TvRepository, awaitable on an AsyncSession.
+    """
+
+    repository_class = TvRepository
@@ -6,12 +6,14 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from media_manager.auth.db import User
 from media_manager.auth.schemas import UserRead
 from media_manager.auth.users import current_active_user, current_superuser
-from media_manager.config import AllEncompassingConfig, LibraryItem
+from media_manager.config import get_config, LibraryItem
 from media_manager.indexer.schemas import (
     IndexerQueryResultId,
     IndexerQueryResult,
 )
+from media_manager.indexer.utils import stream_search_events
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
+from media_manager.sse import EventStreamResponse
 from media_manager.torrent.utils import detect_unknown_media
 from media_manager.torrent.schemas import Torrent
 from media_manager.tv import log
@@ -32,6 +34,8 @@ from media_manager.tv.schemas import (
 from media_manager.schemas import MediaImportSuggestion
 
 from media_manager.tv.dependencies import (
+    read_show_dep,
+    read_tv_service_dep,
     season_dep,
     show_dep,
     tv_repository_dep,
@@ -101,7 +105,7 @@ def delete_a_show(tv_repository: tv_repository_dep, show: show_dep):
 @router.get(
     "/shows", dependencies=[Depends(current_active_user)], response_model=list[Show]
 )
-def get_all_shows(tv_service: tv_service_dep):
+def get_all_shows(tv_service: read_tv_service_dep):
     return tv_service.get_all_shows()
 
 
@@ -117,7 +121,7 @@ def get_all_importable_shows(
     """
     get a list of unknown shows that were detected in the tv directory and are importable
     """
-    directories = detect_unknown_media(AllEncompassingConfig().misc.tv_directory)
+    directories = detect_unknown_media(get_config().misc.tv_directory)
     shows = []
     for directory in directories:
         shows.append(
@@ -138,9 +142,7 @@ def import_detected_show(tv_service: tv_service_dep, tv_show: show_dep, director
     Import a detected show from the specified directory into the library.
     """
     source_directory = Path(directory)
-    if source_directory not in detect_unknown_media(
-        AllEncompassingConfig().misc.tv_directory
-    ):
+    if source_directory not in detect_unknown_media(get_config().misc.tv_directory):
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "No such directory")
     tv_service.import_existing_tv_show(
         tv_show=tv_show, source_directory=source_directory
@@ -152,7 +154,7 @@ def import_detected_show(tv_service: tv_service_dep, tv_show: show_dep, director
     dependencies=[Depends(current_active_user)],
     response_model=list[RichShowTorrent],
 )
-def get_shows_with_torrents(tv_service: tv_service_dep):
+def get_shows_with_torrents(tv_service: read_tv_service_dep):
     """
     get all shows that are associated with torrents
     :return: A list of shows with all their torrents
@@ -167,7 +169,7 @@ def get_shows_with_torrents(tv_service: tv_service_dep):
     response_model=list[LibraryItem],
 )
 def get_available_libraries():
-    return AllEncompassingConfig().misc.tv_libraries
+    return get_config().misc.tv_libraries
 
 
 @router.get(
@@ -175,7 +177,7 @@ def get_available_libraries():
     dependencies=[Depends(current_active_user)],
     response_model=PublicShow,
 )
-def get_a_show(show: show_dep, tv_service: tv_service_dep) -> PublicShow:
+def get_a_show(show: read_show_dep, tv_service: read_tv_service_dep) -> PublicShow:
     return tv_service.get_public_show_by_id(show_id=show.id)
 
 
@@ -216,7 +218,7 @@ def set_continuous_download(
     dependencies=[Depends(current_active_user)],
     response_model=RichShowTorrent,
 )
-def get_a_shows_torrents(show: show_dep, tv_service: tv_service_dep):
+def get_a_shows_torrents(show: read_show_dep, tv_service: read_tv_service_dep):
     return tv_service.get_torrents_for_show(show=show)
 
 
@@ -272,7 +274,9 @@ def request_a_season(
     dependencies=[Depends(current_active_user)],
     response_model=list[RichSeasonRequest],
 )
-def get_season_requests(tv_service: tv_service_dep) -> list[RichSeasonRequest]:
+def get_season_requests(
+    tv_service: read_tv_service_dep,
+) -> list[RichSeasonRequest]:
     return tv_service.get_all_season_requests()
 
 
@@ -385,6 +389,28 @@ def get_torrents_for_a_season(
     )
 
 
+@router.get(
+    "/torrents/stream",
+    dependencies=[Depends(current_superuser)],
+    response_class=EventStreamResponse,
+)
+def stream_torrents_for_a_season(
+    tv_service: tv_service_dep,
+    show_id: ShowId,
+    season_number: int = 1,
+    search_query_override: str = None,
+):
+    """
+    Like GET /torrents, but streams the results of every indexer as server-sent events as soon as it responds.
+    """
+    progress = tv_service.stream_available_torrents_for_a_season(
+        season_number=season_number,
+        show_id=show_id,
+        search_query_override=search_query_override,
+    )
+    return EventStreamResponse(stream_search_events(progress))
+
+
 # download a torrent
 @router.post(
     "/torrents",
@@ -1,14 +1,20 @@
-import re
-
 from sqlalchemy.exc import IntegrityError
 
-from media_manager.config import AllEncompassingConfig
-from media_manager.database import get_session
+from media_manager.config import get_config
+from media_manager.database import get_session, unit_of_work
+from media_manager.database.replicas import get_read_session
 from media_manager.exceptions import InvalidConfigError
 from media_manager.indexer.repository import IndexerRepository
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.indexer.schemas import IndexerQueryResultId
+from media_manager.indexer.schemas import IndexerSearchParameters
+from media_manager.indexer.schemas import IndexerSearchProgress
+from media_manager.indexer.release_parser import (
+    parse_release,
+    parse_subtitle_language,
+)
 from media_manager.indexer.utils import evaluate_indexer_query_results
+from media_manager.indexer.wanted import wanted_index
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
 from media_manager.notification.service import NotificationService
 from media_manager.torrent.schemas import Torrent, TorrentStatus, Quality
@@ -32,9 +38,11 @@ from media_manager.tv.schemas import (
     Episode as EpisodeSchema,
 )
 from media_manager.torrent.schemas import QualityStrings
+from media_manager.scheduler.schemas import JobResult
 from media_manager.tv.repository import TvRepository
 from media_manager.exceptions import NotFoundError
 import pprint
+from typing import Iterator
 from pathlib import Path
 from media_manager.torrent.repository import TorrentRepository
 from media_manager.torrent.utils import (
@@ -86,7 +94,11 @@ class TvService:
         :param season_request: The season request to add.
         :return: The added season request.
         """
-        return self.tv_repository.add_season_request(season_request=season_request)
+        season_request = self.tv_repository.add_season_request(
+            season_request=season_request
+        )
+        self._update_wanted_index(season_request=season_request)
+        return season_request
 
     def get_season_request_by_id(
         self, season_request_id: SeasonRequestId
@@ -116,7 +128,32 @@ class TvService:
         :return: The updated season request.
         """
         self.tv_repository.delete_season_request(season_request_id=season_request.id)
-        return self.tv_repository.add_season_request(season_request=season_request)
+        season_request = self.tv_repository.add_season_request(
+            season_request=season_request
+        )
+        self._update_wanted_index(season_request=season_request)
+        return season_request
+
+    def _update_wanted_index(self, season_request: SeasonRequest) -> None:
+        """
+        Updates the season request in the index of wanted requests that is matched against the RSS feeds.
+        """
+        if not get_config().indexers.rss.enabled:
+            return
+        if not season_request.authorized:
+            wanted_index.remove(request_id=season_request.id)
+            return
+        wanted_index.add_season_request(
+            season_request=RichSeasonRequest(
+                **season_request.model_dump(),
+                show=self.tv_repository.get_show_by_season_id(
+                    season_id=season_request.season_id
+                ),
+                season=self.tv_repository.get_season(
+                    season_id=season_request.season_id
+                ),
+            )
+        )
 
     def set_show_library(self, show_id: ShowId, library: str) -> None:
         self.tv_repository.set_show_library(show_id=show_id, library=library)
@@ -128,6 +165,7 @@ class TvService:
         :param season_request_id: The ID of the season request to delete.
         """
         self.tv_repository.delete_season_request(season_request_id=season_request_id)
+        wanted_index.remove(request_id=season_request_id)
 
     def get_public_season_files_by_season_id(
         self, season_id: SeasonId
@@ -195,16 +233,80 @@ class TvService:
         :return: A list of indexer query results.
         """
         show = self.tv_repository.get_show_by_id(show_id=show_id)
-        if search_query_override:
-            search_query = search_query_override
-        else:
-            # TODO: add more Search query strings and combine all the results, like "season 3", "s03", "s3"
-            search_query = show.name + " s" + str(season_number).zfill(2)
+        search_queries, search_parameters = self._get_season_search(
+            show=show,
+            season_number=season_number,
+            search_query_override=search_query_override,
+        )
+        torrents: list[IndexerQueryResult] = self.indexer_service.search_variants(
+            queries=search_queries, is_tv=True, parameters=search_parameters
+        )
+        return self._evaluate_season_torrents(
+            show=show,
+            season_number=season_number,
+            torrents=torrents,
+            search_query_override=search_query_override,
+        )
+
+    def stream_available_torrents_for_a_season(
+        self, season_number: int, show_id: ShowId, search_query_override: str = None
+    ) -> Iterator[IndexerSearchProgress]:
+        """
+        Like get_all_available_torrents_for_a_season, but yields the evaluated results of every indexer
+        as soon as it responds.
+        The show is looked up right away, the indexers are only searched once the iterator is consumed.
+
+        :param season_number: The number of the season.
+        :param show_id: The ID of the show.
+        :param search_query_override: Optional override for the search query.
+        :return: The progress of the search, in the order the indexers respond.
+        """
+        show = self.tv_repository.get_show_by_id(show_id=show_id)
+        search_queries, search_parameters = self._get_season_search(
+            show=show,
+            season_number=season_number,
+            search_query_override=search_query_override,
+        )
 
-        torrents: list[IndexerQueryResult] = self.indexer_service.search(
-            query=search_query, is_tv=True
+        def search() -> Iterator[IndexerSearchProgress]:
+            for progress in self.indexer_service.search_variants_iter(
+                queries=search_queries, is_tv=True, parameters=search_parameters
+            ):
+                progress.results = self._evaluate_season_torrents(
+                    show=show,
+                    season_number=season_number,
+                    torrents=progress.results,
+                    search_query_override=search_query_override,
+                )
+                yield progress
+
+        return search()
+
+    @staticmethod
+    def _get_season_search(
+        show: Show, season_number: int, search_query_override: str | None
+    ) -> tuple[list[str], IndexerSearchParameters | None]:
+        if search_query_override:
+            return [search_query_override], None
+        search_queries = [
+            f"{show.name} s{season_number:02d}",
+            f"{show.name} season {season_number}",
+        ]
+        search_parameters = IndexerSearchParameters(
+            is_tv=True,
+            season=season_number,
+            tvdb_id=show.external_id if show.metadata_provider == "tvdb" else None,
+            tmdb_id=show.external_id if show.metadata_provider == "tmdb" else None,
         )
+        return search_queries, search_parameters
 
+    @staticmethod
+    def _evaluate_season_torrents(
+        show: Show,
+        season_number: int,
+        torrents: list[IndexerQueryResult],
+        search_query_override: str | None,
+    ) -> list[IndexerQueryResult]:
         if search_query_override:
             return torrents
 
@@ -313,8 +415,12 @@ class TvService:
             return True
         else:
             try:
-                torrent_file = self.torrent_service.get_torrent_by_id(
-                    torrent_id=season_file.torrent_id
+                # the stored torrent is enough to know whether it was imported, refreshing its status would write to
+                # the database, which read-only sessions don't allow
+                torrent_file = (
+                    self.torrent_service.torrent_repository.get_torrent_by_id(
+                        torrent_id=season_file.torrent_id
+                    )
                 )
 
                 if torrent_file.imported:
@@ -470,6 +576,40 @@ class TvService:
         torrents = self.get_all_available_torrents_for_a_season(
             season_number=season.number, show_id=show.id
         )
+        available_torrents = self.get_torrents_matching_season_request(
+            season_request=season_request, season=season, torrents=torrents
+        )
+
+        if len(available_torrents) == 0:
+            log.warning(
+                f"No torrents matching criteria were found (wanted quality: {season_request.wanted_quality}, min_quality: {season_request.min_quality} for season {season.id})"
+            )
+            return False
+
+        available_torrents.sort(key=IndexerQueryResult.sort_key, reverse=True)
+
+        self.download_season_request_torrent(
+            season_request=season_request,
+            season=season,
+            indexer_result=available_torrents[0],
+        )
+        return True
+
+    def get_torrents_matching_season_request(
+        self,
+        season_request: SeasonRequest,
+        season: Season,
+        torrents: list[IndexerQueryResult],
+    ) -> list[IndexerQueryResult]:
+        """
+        Filters torrents by the quality wanted by a season request, torrents with too few seeders
+        and torrents that contain other seasons too are left out.
+
+        :param season_request: The season request.
+        :param season: The requested season.
+        :param torrents: The torrents to filter.
+        :return: The torrents that can be downloaded for the season request.
+        """
         available_torrents: list[IndexerQueryResult] = []
 
         for torrent in torrents:
@@ -491,15 +631,23 @@ class TvService:
                     f"Taking torrent {torrent.title} with quality {torrent.quality} for season {season.id} into consideration"
                 )
 
-        if len(available_torrents) == 0:
-            log.warning(
-                f"No torrents matching criteria were found (wanted quality: {season_request.wanted_quality}, min_quality: {season_request.min_quality} for season {season.id})"
-            )
-            return False
+        return available_torrents
 
-        available_torrents.sort()
+    def download_season_request_torrent(
+        self,
+        season_request: SeasonRequest,
+        season: Season,
+        indexer_result: IndexerQueryResult,
+    ) -> Torrent:
+        """
+        Downloads a torrent for a season request and deletes the request afterwards.
 
-        torrent = self.torrent_service.download(indexer_result=available_torrents[0])
+        :param season_request: The season request.
+        :param season: The requested season.
+        :param indexer_result: The torrent to download.
+        :return: The downloaded torrent.
+        """
+        torrent = self.torrent_service.download(indexer_result=indexer_result)
         season_file = SeasonFile(
             season_id=season.id,
             quality=torrent.quality,
@@ -513,10 +661,10 @@ class TvService:
                 f"Season file for season {season.id} and quality {torrent.quality} already exists, skipping."
             )
         self.delete_season_request(season_request.id)
-        return True
+        return torrent
 
     def get_root_show_directory(self, show: Show):
-        misc_config = AllEncompassingConfig().misc
+        misc_config = get_config().misc
         show_directory_name = f"{remove_special_characters(show.name)} ({show.year})  [{show.metadata_provider}id-{show.external_id}]"
         log.debug(
             f"Show {show.name} without special characters: {remove_special_characters(show.name)}"
@@ -550,34 +698,35 @@ class TvService:
         episode_file_name = f"{remove_special_characters(show.name)} S{season.number:02d}E{episode_number:02d}"
         if file_path_suffix != "":
             episode_file_name += f" - {file_path_suffix}"
-        pattern = (
-            r".*[. ]S0?" + str(season.number) + r"E0?" + str(episode_number) + r"[. ].*"
-        )
-        subtitle_pattern = pattern + r"[. ]([A-Za-z]{2})[. ]srt"
         target_file_name = (
             self.get_root_season_directory(show=show, season_number=season.number)
             / episode_file_name
         )
 
+        def is_episode_file(file: Path) -> bool:
+            release = parse_release(file.name)
+            return (
+                season.number in release.seasons and episode_number in release.episodes
+            )
+
         # import subtitles
         for subtitle_file in subtitle_files:
-            regex_result = re.search(
-                subtitle_pattern, subtitle_file.name, re.IGNORECASE
-            )
-            if regex_result:
-                language_code = regex_result.group(1)
+            if not is_episode_file(subtitle_file):
+                continue
+            language_code = parse_subtitle_language(subtitle_file.name)
+            if language_code:
                 target_subtitle_file = target_file_name.with_suffix(
                     f".{language_code}.srt"
                 )
                 import_file(target_file=target_subtitle_file, source_file=subtitle_file)
             else:
                 log.debug(
-                    f"Didn't find any pattern {subtitle_pattern} in subtitle file: {subtitle_file.name}"
+                    f"Didn't find a language code in subtitle file: {subtitle_file.name}"
                 )
 
         # import episode videos
         for file in video_files:
-            if re.search(pattern, file.name, re.IGNORECASE):
+            if is_episode_file(file):
                 target_video_file = target_file_name.with_suffix(file.suffix)
                 import_file(target_file=target_video_file, source_file=file)
                 return True
@@ -593,12 +742,16 @@ class TvService:
         video_files: list[Path],
         subtitle_files: list[Path],
         file_path_suffix: str = "",
-    ) -> tuple[bool, int]:
+    ) -> list[int]:
+        """
+        Imports the episodes of a season, this only touches the filesystem.
+
+        :return: The numbers of the episodes no video file was found for.
+        """
         season_path = self.get_root_season_directory(
             show=show, season_number=season.number
         )
-        success = True
-        imported_episodes_count = 0
+        missing_episodes: list[int] = []
         try:
             season_path.mkdir(parents=True, exist_ok=True)
         except Exception as e:
@@ -607,7 +760,7 @@ class TvService:
 
         for episode in season.episodes:
             try:
-                imported = self.import_episode(
+                self.import_episode(
                     show=show,
                     subtitle_files=subtitle_files,
                     video_files=video_files,
@@ -615,60 +768,104 @@ class TvService:
                     episode_number=episode.number,
                     file_path_suffix=file_path_suffix,
                 )
-                if imported:
-                    imported_episodes_count += 1
-
             except Exception:
-                # Send notification about missing episode file
-                if self.notification_service:
-                    self.notification_service.send_notification_to_all_providers(
-                        title="Missing Episode File",
-                        message=f"No video file found for S{season.number:02d}E{episode.number:02d} for show {show.name}. Manual intervention may be required.",
-                    )
-                success = False
+                missing_episodes.append(episode.number)
                 log.warning(
                     f"S{season.number}E{episode.number} not found when trying to import episode for show {show.name}."
                 )
-        return success, imported_episodes_count
+        return missing_episodes
+
+    def notify_missing_episodes(
+        self, show: Show, season: Season, missing_episodes: list[int]
+    ) -> None:
+        if not self.notification_service:
+            return
+        for episode_number in missing_episodes:
+            self.notification_service.send_notification_to_all_providers(
+                title="Missing Episode File",
+                message=f"No video file found for S{season.number:02d}E{episode_number:02d} for show {show.name}. Manual intervention may be required.",
+                group=f"missing-episodes-{show.id}-{season.number}",
+                group_message=f"No video files found for {{count}} episodes of {show.name} S{season.number:02d}. Manual intervention may be required.",
+            )
+
+    def get_seasons_of_torrent(
+        self, torrent: Torrent
+    ) -> list[tuple[Season, SeasonFile]]:
+        """
+        Loads everything the import of a torrent needs from the database, so the files can be imported without a
+        database session.
 
-    def import_torrent_files(self, torrent: Torrent, show: Show) -> None:
+        :param torrent: The Torrent object
+        :return: The seasons of the torrent together with their season files.
+        """
+        season_files = self.torrent_service.get_season_files_of_torrent(torrent=torrent)
+        log.info(
+            f"Found {len(season_files)} season files associated with torrent {torrent.title}"
+        )
+        return [
+            (self.get_season(season_id=season_file.season_id), season_file)
+            for season_file in season_files
+        ]
+
+    def import_torrent_files(
+        self, torrent: Torrent, show: Show, seasons: list[tuple[Season, SeasonFile]]
+    ) -> list[tuple[Season, list[int]]]:
         """
         Organizes files from a torrent into the TV directory structure, mapping them to seasons and episodes.
+        This only touches the filesystem, the result is recorded by finish_torrent_import.
+
         :param torrent: The Torrent object
         :param show: The Show object
+        :param seasons: The seasons of the torrent, see get_seasons_of_torrent
+        :return: The numbers of the episodes that could not be imported, per season.
         """
 
         video_files, subtitle_files, all_files = get_files_for_import(torrent=torrent)
 
-        success: bool = True  # determines if the import was successful, if true, the Imported flag will be set to True after the import
-
         log.debug(
             f"Importing these {len(video_files)} files:\n" + pprint.pformat(video_files)
         )
 
-        season_files = self.torrent_service.get_season_files_of_torrent(torrent=torrent)
-        log.info(
-            f"Found {len(season_files)} season files associated with torrent {torrent.title}"
-        )
-
-        for season_file in season_files:
-            season = self.get_season(season_id=season_file.season_id)
-            season_import_success, imported_episodes_count = self.import_season(
+        missing_episodes: list[tuple[Season, list[int]]] = []
+        for season, season_file in seasons:
+            missing = self.import_season(
                 show=show,
                 season=season,
                 video_files=video_files,
                 subtitle_files=subtitle_files,
                 file_path_suffix=season_file.file_path_suffix,
             )
-            if season_import_success:
-                log.info(
-                    f"Season {season.number} successfully imported from torrent {torrent.title}"
-                )
-            else:
+            if missing:
                 log.warning(
                     f"Season {season.number} failed to import from torrent {torrent.title}"
                 )
-                success = False
+            else:
+                log.info(
+                    f"Season {season.number} successfully imported from torrent {torrent.title}"
+                )
+            missing_episodes.append((season, missing))
+        return missing_episodes
+
+    def finish_torrent_import(
+        self,
+        torrent: Torrent,
+        show: Show,
+        missing_episodes: list[tuple[Season, list[int]]],
+    ) -> None:
+        """
+        Records the result of import_torrent_files, the torrent is marked as imported if no episode is missing.
+
+        :param torrent: The Torrent object
+        :param show: The Show object
+        :param missing_episodes: The result of import_torrent_files
+        """
+        # determines if the import was successful, if true, the Imported flag will be set to True
+        success = True
+        for season, missing in missing_episodes:
+            self.notify_missing_episodes(
+                show=show, season=season, missing_episodes=missing
+            )
+            success = success and not missing
 
         log.info(
             f"Finished importing files for torrent {torrent.title} {'without' if success else 'with'} errors"
@@ -723,6 +920,8 @@ class TvService:
 
         # Process seasons and episodes
         existing_season_external_ids = {s.external_id: s for s in db_show.seasons}
+        # the titles of existing episodes are updated together once all seasons are processed
+        episode_titles: dict[EpisodeId, str] = {}
 
         for fresh_season_data in fresh_show_data.seasons:
             if fresh_season_data.external_id in existing_season_external_ids:
@@ -749,13 +948,13 @@ class TvService:
                         existing_episode = existing_episode_external_ids[
                             fresh_episode_data.external_id
                         ]
-                        log.debug(
-                            f"Updating existing episode {existing_episode.number} for season {existing_season.number}"
-                        )
-                        self.tv_repository.update_episode_attributes(
-                            episode_id=existing_episode.id,
-                            title=fresh_episode_data.title,
-                        )
+                        if existing_episode.title != fresh_episode_data.title:
+                            log.debug(
+                                f"Updating existing episode {existing_episode.number} for season {existing_season.number}"
+                            )
+                            episode_titles[existing_episode.id] = (
+                                fresh_episode_data.title
+                            )
                     else:
                         # Add new episode
                         log.debug(
@@ -798,6 +997,9 @@ class TvService:
                     show_id=db_show.id, season_data=season_schema
                 )
 
+        if episode_titles:
+            self.tv_repository.update_episode_titles(titles=episode_titles)
+
         updated_show = self.tv_repository.get_show_by_id(show_id=db_show.id)
 
         log.info(f"Successfully updated metadata for show ID: {db_show.id}")
@@ -837,20 +1039,23 @@ class TvService:
             directory=source_directory
         )
         for season in tv_show.seasons:
-            success, imported_episode_count = self.import_season(
+            missing_episodes = self.import_season(
                 show=tv_show,
                 season=season,
                 video_files=video_files,
                 subtitle_files=subtitle_files,
                 file_path_suffix="IMPORTED",
             )
+            self.notify_missing_episodes(
+                show=tv_show, season=season, missing_episodes=missing_episodes
+            )
             season_file = SeasonFile(
                 season_id=season.id,
                 quality=Quality.unknown,
                 file_path_suffix="IMPORTED",
                 torrent_id=None,
             )
-            if success or imported_episode_count > (len(season.episodes) / 2):
+            if not missing_episodes or len(missing_episodes) < len(season.episodes) / 2:
                 self.tv_repository.add_season_file(season_file=season_file)
 
         new_source_path = source_directory.parent / ("." + source_directory.name)
@@ -860,7 +1065,7 @@ class TvService:
             log.error(f"Failed to rename {source_directory} to {new_source_path}: {e}")
 
 
-def auto_download_all_approved_season_requests() -> None:
+def auto_download_all_approved_season_requests() -> JobResult:
     """
     Auto download all approved season requests.
     This is a standalone function as it creates its own DB session.
@@ -879,6 +1084,7 @@ def auto_download_all_approved_season_requests() -> None:
         season_requests = tv_repository.get_season_requests()
         log.info(f"Found {len(season_requests)} season requests to process")
         count = 0
+        failures = 0
 
         for season_request in season_requests:
             if season_request.authorized:
@@ -886,51 +1092,44 @@ def auto_download_all_approved_season_requests() -> None:
                 show = tv_repository.get_show_by_season_id(
                     season_id=season_request.season_id
                 )
-                if tv_service.download_approved_season_request(
-                    season_request=season_request, show=show
-                ):
+                with unit_of_work(db):
+                    downloaded = tv_service.download_approved_season_request(
+                        season_request=season_request, show=show
+                    )
+                if downloaded:
                     count += 1
                 else:
+                    failures += 1
                     log.warning(
                         f"Failed to download season request {season_request.id} for show {show.name}"
                     )
 
         log.info(f"Auto downloaded {count} approved season requests")
-        db.commit()
+        return JobResult(items_processed=count, failures=failures)
 
 
-def import_all_show_torrents() -> None:
-    with next(get_session()) as db:
-        tv_repository = TvRepository(db=db)
+def import_all_show_torrents() -> JobResult:
+    """
+    Queues all finished, not yet imported tv torrents for import.
+    The actual import is done by the import workers, see media_manager.torrent.import_queue.
+    """
+    with next(get_session()) as db, unit_of_work(db):
         torrent_service = TorrentService(torrent_repository=TorrentRepository(db=db))
-        indexer_service = IndexerService(indexer_repository=IndexerRepository(db=db))
-        tv_service = TvService(
-            tv_repository=tv_repository,
-            torrent_service=torrent_service,
-            indexer_service=indexer_service,
-        )
-        log.info("Importing all torrents")
+        log.info("Queueing imports of all finished torrents")
         torrents = torrent_service.get_all_torrents()
-        log.info("Found %d torrents to import", len(torrents))
+        count = 0
         for t in torrents:
-            try:
-                if not t.imported and t.status == TorrentStatus.finished:
-                    show = torrent_service.get_show_of_torrent(torrent=t)
-                    if show is None:
-                        log.warning(
-                            f"torrent {t.title} is not a tv torrent, skipping import."
-                        )
-                        continue
-                    tv_service.import_torrent_files(torrent=t, show=show)
-            except RuntimeError as e:
-                log.error(
-                    f"Error importing torrent {t.title} for show {show.name}: {e}"
-                )
-        log.info("Finished importing all torrents")
-        db.commit()
+            if t.imported or t.status != TorrentStatus.finished:
+                continue
+            if torrent_service.get_show_of_torrent(torrent=t) is None:
+                continue
+            torrent_service.enqueue_import(torrent=t)
+            count += 1
+        log.info(f"Queued {count} tv torrents for import")
+        return JobResult(items_processed=count)
 
 
-def update_all_non_ended_shows_metadata() -> None:
+def update_all_non_ended_shows_metadata() -> JobResult:
     """
     Updates the metadata of all non-ended shows.
     """
@@ -944,9 +1143,12 @@ def update_all_non_ended_shows_metadata() -> None:
 
         log.info("Updating metadata for all non-ended shows")
 
-        shows = [show for show in tv_repository.get_shows() if not show.ended]
+        with next(get_read_session()) as read_db:
+            shows = TvRepository(db=read_db).get_shows(ended=False)
 
         log.info(f"Found {len(shows)} non-ended shows to update")
+        count = 0
+        failures = 0
 
         for show in shows:
             try:
@@ -958,40 +1160,45 @@ def update_all_non_ended_shows_metadata() -> None:
                     log.error(
                         f"Unsupported metadata provider {show.metadata_provider} for show {show.name}, skipping update."
                     )
+                    failures += 1
                     continue
             except InvalidConfigError as e:
                 log.error(
                     f"Error initializing metadata provider {show.metadata_provider} for show {show.name}: {str(e)}"
                 )
+                failures += 1
                 continue
-            updated_show = tv_service.update_show_metadata(
-                db_show=show, metadata_provider=metadata_provider
-            )
+            with unit_of_work(db):
+                updated_show = tv_service.update_show_metadata(
+                    db_show=show, metadata_provider=metadata_provider
+                )
 
-            # Automatically add season requests for new seasons
-            existing_seasons = [x.id for x in show.seasons]
-            new_seasons = [
-                x for x in updated_show.seasons if x.id not in existing_seasons
-            ]
+                # Automatically add season requests for new seasons
+                existing_seasons = [x.id for x in show.seasons]
+                new_seasons = [
+                    x for x in updated_show.seasons if x.id not in existing_seasons
+                ]
 
-            if show.continuous_download:
-                for new_season in new_seasons:
-                    log.info(
-                        f"Automatically adding season request for new season {new_season.number} of show {updated_show.name}"
-                    )
-                    tv_service.add_season_request(
-                        SeasonRequest(
-                            min_quality=Quality.sd,
-                            wanted_quality=Quality.uhd,
-                            season_id=new_season.id,
-                            authorized=True,
+                if show.continuous_download:
+                    for new_season in new_seasons:
+                        log.info(
+                            f"Automatically adding season request for new season {new_season.number} of show {updated_show.name}"
+                        )
+                        tv_service.add_season_request(
+                            SeasonRequest(
+                                min_quality=Quality.sd,
+                                wanted_quality=Quality.uhd,
+                                season_id=new_season.id,
+                                authorized=True,
+                            )
                         )
-                    )
 
             if updated_show:
+                count += 1
                 log.debug(
                     f"Added new seasons: {len(new_seasons)} to show: {updated_show.name}"
                 )
             else:
+                failures += 1
                 log.warning(f"Failed to update metadata for show: {show.name}")
-        db.commit()
+        return JobResult(items_processed=count, failures=failures)
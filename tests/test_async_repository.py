@@ -0,0 +1,32 @@
+import asyncio
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from media_manager import database
+from media_manager.database import Base
+from media_manager.tv.repository import AsyncTvRepository
+
+
+def test_pipeline_methods_run_on_the_async_engine(engine: Engine, monkeypatch):
+    monkeypatch.setattr(database, "pipeline_mode", True)
+
+    async def run():
+        async_engine = create_async_engine(engine.url)
+        try:
+            async with async_engine.connect() as connection:
+                transaction = await connection.begin()
+                await connection.run_sync(Base.metadata.create_all)
+                db = AsyncSession(bind=connection)
+                repository = AsyncTvRepository(db)
+                # the statements are sent one by one, the async connection only has an async pipeline
+                await repository.update_episode_titles(titles={uuid.uuid4(): "Pilot"})
+                # the connection is still usable afterwards
+                assert await db.scalar(select(1)) == 1
+                await transaction.rollback()
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(run())
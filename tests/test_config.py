@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from media_manager import config
+from media_manager.config import AllEncompassingConfig, get_config, reload_config
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, monkeypatch) -> Path:
+    """
+    A config file for the test, the config snapshot of the process is restored afterwards.
+    """
+    path = tmp_path / "config.toml"
+    monkeypatch.setattr(config, "config_path", path)
+    monkeypatch.setitem(AllEncompassingConfig.model_config, "toml_file", path)
+    monkeypatch.setattr(config, "_config", None)
+    monkeypatch.setattr(config, "_config_file_mtime", None)
+    monkeypatch.setattr(config, "_config_file_checked_at", 0.0)
+    monkeypatch.setattr(config, "CONFIG_FILE_CHECK_INTERVAL_SECONDS", 0)
+    return path
+
+
+def write_config(path: Path, content: str, mtime: int) -> None:
+    path.write_text(content)
+    # the mtime of quickly rewritten files can be the same
+    os.utime(path, (mtime, mtime))
+
+
+def test_reloads_the_config_when_the_file_changes(config_file: Path):
+    write_config(config_file, "[database]\npool_size = 7\n", mtime=1)
+    first = get_config()
+    assert first.database.pool_size == 7
+    assert get_config() is first
+
+    write_config(config_file, "[database]\npool_size = 9\n", mtime=2)
+
+    assert get_config().database.pool_size == 9
+    # the previous snapshot is immutable and unchanged
+    assert first.database.pool_size == 7
+
+
+def test_keeps_the_previous_config_if_the_new_one_is_invalid(config_file: Path):
+    write_config(config_file, "[database]\npool_size = 7\n", mtime=1)
+    previous = reload_config()
+
+    write_config(config_file, '[database]\npool_size = "many"\n', mtime=2)
+
+    assert reload_config() is previous
+    assert get_config() is previous
+
+
+def test_raises_if_the_first_config_is_invalid(config_file: Path):
+    write_config(config_file, '[database]\npool_size = "many"\n', mtime=1)
+
+    with pytest.raises(ValidationError):
+        reload_config()
+
+
+def test_config_is_immutable(config_file: Path):
+    write_config(config_file, "", mtime=1)
+
+    with pytest.raises(ValidationError):
+        get_config().database.pool_size = 1
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy.orm import Session
+
+from media_manager.events.bus import EventBus
+from media_manager.events.schemas import EventType
+
+
+def test_delivers_events_published_on_other_threads():
+    async def run():
+        bus = EventBus()
+        first, second = bus.subscribe(), bus.subscribe()
+        thread = threading.Thread(
+            target=bus.publish, args=(EventType.notification, {"message": "hello"})
+        )
+        thread.start()
+        thread.join()
+        return [await subscription.get(timeout=1) for subscription in (first, second)]
+
+    events = asyncio.run(run())
+
+    assert [event.type for event in events] == [EventType.notification] * 2
+    assert [event.data for event in events] == [{"message": "hello"}] * 2
+
+
+def test_unsubscribed_subscribers_get_no_events():
+    async def run():
+        bus = EventBus()
+        subscription = bus.subscribe()
+        bus.unsubscribe(subscription)
+        bus.publish(EventType.notification, {"message": "hello"})
+        await subscription.get(timeout=0.1)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(run())
+
+
+def test_ends_the_stream_of_a_subscriber_that_falls_behind():
+    async def run():
+        bus = EventBus(max_queued_events=2)
+        slow, fast = bus.subscribe(), bus.subscribe()
+        for i in range(3):
+            bus.publish(EventType.torrent_status, {"i": i})
+            if i < 2:
+                # let the fast subscriber keep up
+                await asyncio.sleep(0)
+                await fast.get(timeout=1)
+        await asyncio.sleep(0)
+        fast_event = await fast.get(timeout=1)
+
+        # the queued events are dropped, the subscriber has to fetch the current state
+        with pytest.raises(OverflowError):
+            await slow.get(timeout=1)
+        bus.publish(EventType.torrent_status, {"i": 3})
+        await asyncio.sleep(0)
+        assert slow.overflowed
+        return fast_event
+
+    assert asyncio.run(run()).data == {"i": 2}
+
+
+def test_publishes_after_the_commit(db: Session):
+    async def run():
+        bus = EventBus()
+        subscription = bus.subscribe()
+
+        async def received() -> list[dict]:
+            await asyncio.sleep(0)
+            events = []
+            while not subscription._queue.empty():
+                events.append(subscription._queue.get_nowait().data)
+            return events
+
+        db.connection()
+        bus.publish_after_commit(db, EventType.notification, {"message": "committed"})
+        assert await received() == []
+        db.commit()
+        assert await received() == [{"message": "committed"}]
+
+        db.connection()
+        bus.publish_after_commit(db, EventType.notification, {"message": "dropped"})
+        db.rollback()
+        assert await received() == []
+
+    asyncio.run(run())
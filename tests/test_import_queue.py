@@ -0,0 +1,130 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from media_manager.exceptions import ConflictError
+from media_manager.torrent.models import ImportJob
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.schemas import (
+    ImportJobStatus,
+    Quality,
+    Torrent,
+    TorrentStatus,
+)
+
+LEASE_SECONDS = 60
+
+
+@pytest.fixture
+def repository(db: Session) -> TorrentRepository:
+    db.execute(delete(ImportJob))
+    return TorrentRepository(db=db)
+
+
+def enqueue(repository: TorrentRepository) -> Torrent:
+    torrent = repository.save_torrent(
+        Torrent(
+            status=TorrentStatus.finished,
+            title="Show.S01.1080p",
+            quality=Quality.fullhd,
+            imported=False,
+            hash=uuid.uuid4().hex,
+        )
+    )
+    repository.enqueue_import_job(torrent_id=torrent.id)
+    return torrent
+
+
+def expire_lease(db: Session, job_id) -> None:
+    db.execute(
+        update(ImportJob)
+        .where(ImportJob.id == job_id)
+        .values(locked_until=datetime.now() - timedelta(seconds=1))
+    )
+
+
+def test_claims_each_job_once(repository: TorrentRepository):
+    torrent = enqueue(repository)
+    # enqueuing a torrent with an open job does nothing
+    repository.enqueue_import_job(torrent_id=torrent.id)
+
+    job = repository.claim_next_import_job(lease_seconds=LEASE_SECONDS)
+
+    assert job.torrent_id == torrent.id
+    assert job.status == ImportJobStatus.running
+    assert job.attempts == 1
+    assert repository.claim_next_import_job(lease_seconds=LEASE_SECONDS) is None
+
+
+def test_takes_over_a_job_whose_lease_expired(
+    db: Session, repository: TorrentRepository
+):
+    enqueue(repository)
+    job = repository.claim_next_import_job(lease_seconds=LEASE_SECONDS)
+    expire_lease(db, job.id)
+
+    taken_over = repository.claim_next_import_job(lease_seconds=LEASE_SECONDS)
+
+    assert taken_over.id == job.id
+    assert taken_over.attempts == job.attempts + 1
+    # the results of the previous claim are dropped
+    assert not repository.renew_import_job_lease(
+        job_id=job.id, attempts=job.attempts, lease_seconds=LEASE_SECONDS
+    )
+    assert repository.finish_import_job(job_id=job.id, attempts=job.attempts) is None
+    assert (
+        repository.fail_import_job(
+            job_id=job.id, attempts=job.attempts, error="error", retry_at=None
+        )
+        is None
+    )
+    finished = repository.finish_import_job(job_id=job.id, attempts=taken_over.attempts)
+    assert finished.status == ImportJobStatus.finished
+
+
+def test_renewed_lease_is_not_taken_over(db: Session, repository: TorrentRepository):
+    enqueue(repository)
+    job = repository.claim_next_import_job(lease_seconds=LEASE_SECONDS)
+    expire_lease(db, job.id)
+
+    assert repository.renew_import_job_lease(
+        job_id=job.id, attempts=job.attempts, lease_seconds=LEASE_SECONDS
+    )
+    assert repository.claim_next_import_job(lease_seconds=LEASE_SECONDS) is None
+
+
+def test_failed_job_is_retried_at_retry_at(repository: TorrentRepository):
+    enqueue(repository)
+    job = repository.claim_next_import_job(lease_seconds=LEASE_SECONDS)
+
+    failed = repository.fail_import_job(
+        job_id=job.id,
+        attempts=job.attempts,
+        error="error",
+        retry_at=datetime.now() + timedelta(hours=1),
+    )
+
+    assert failed.status == ImportJobStatus.pending
+    assert failed.last_error == "error"
+    assert repository.claim_next_import_job(lease_seconds=LEASE_SECONDS) is None
+
+
+def test_only_failed_or_finished_jobs_can_be_retried(repository: TorrentRepository):
+    enqueue(repository)
+    pending = repository.get_import_jobs()[0]
+    with pytest.raises(ConflictError):
+        repository.retry_import_job(job_id=pending.id)
+
+    job = repository.claim_next_import_job(lease_seconds=LEASE_SECONDS)
+    with pytest.raises(ConflictError):
+        repository.retry_import_job(job_id=job.id)
+
+    repository.fail_import_job(
+        job_id=job.id, attempts=job.attempts, error="error", retry_at=None
+    )
+    retried = repository.retry_import_job(job_id=job.id)
+    assert retried.status == ImportJobStatus.pending
+    assert retried.attempts == 0
@@ -0,0 +1,104 @@
+import pytest
+
+from media_manager.config import get_config
+from media_manager.indexer import health
+from media_manager.indexer.health import CircuitBreaker, CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(health, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def config():
+    return get_config().indexers.circuit_breaker
+
+
+def open_circuit(circuit_breaker: CircuitBreaker, failures: int) -> None:
+    for _ in range(failures):
+        assert circuit_breaker.allow_request()
+        circuit_breaker.record_failure("timeout")
+
+
+def test_opens_after_consecutive_failures(clock, config):
+    circuit_breaker = CircuitBreaker("test")
+
+    open_circuit(circuit_breaker, config.failure_threshold - 1)
+    assert circuit_breaker.state == CircuitState.closed
+    assert circuit_breaker.allow_request()
+    assert circuit_breaker.record_failure("timeout") == CircuitState.open
+
+    assert circuit_breaker.is_open()
+    assert not circuit_breaker.allow_request()
+    assert circuit_breaker.get_health().consecutive_failures == (
+        config.failure_threshold
+    )
+
+
+def test_success_resets_the_failures(clock, config):
+    circuit_breaker = CircuitBreaker("test")
+
+    open_circuit(circuit_breaker, config.failure_threshold - 1)
+    assert circuit_breaker.record_success() is None
+    open_circuit(circuit_breaker, config.failure_threshold - 1)
+
+    assert circuit_breaker.state == CircuitState.closed
+
+
+def test_lets_a_single_probe_through_after_the_cooldown(clock, config):
+    circuit_breaker = CircuitBreaker("test")
+    open_circuit(circuit_breaker, config.failure_threshold)
+
+    clock.now += config.cooldown_seconds
+    assert not circuit_breaker.is_open()
+    assert circuit_breaker.allow_request()
+    assert circuit_breaker.state == CircuitState.half_open
+    assert not circuit_breaker.allow_request()
+
+    assert circuit_breaker.record_success() == CircuitState.closed
+    assert circuit_breaker.allow_request()
+    assert circuit_breaker.allow_request()
+
+
+def test_failed_probe_doubles_the_cooldown_up_to_the_maximum(clock, config):
+    circuit_breaker = CircuitBreaker("test")
+    open_circuit(circuit_breaker, config.failure_threshold)
+
+    cooldown = config.cooldown_seconds
+    while cooldown < config.max_cooldown_seconds:
+        clock.now += cooldown - 1
+        assert not circuit_breaker.allow_request()
+        clock.now += 1
+        assert circuit_breaker.allow_request()
+        # the indexer was already reported as down when the circuit opened
+        assert circuit_breaker.record_failure("timeout") is None
+        assert circuit_breaker.state == CircuitState.open
+        cooldown = min(cooldown * 2, config.max_cooldown_seconds)
+        assert circuit_breaker.cooldown_seconds == cooldown
+
+    assert circuit_breaker.cooldown_seconds == config.max_cooldown_seconds
+
+
+def test_hides_the_api_key_in_the_last_error(clock):
+    circuit_breaker = CircuitBreaker("test")
+
+    circuit_breaker.record_failure(
+        "500 Server Error for url: https://indexer.example/api?t=search&apikey=secret&q=show"
+    )
+
+    assert "secret" not in circuit_breaker.get_health().last_error
+    assert "apikey=***&q=show" in circuit_breaker.get_health().last_error
@@ -0,0 +1,85 @@
+import pytest
+
+from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.indexer.utils import (
+    IndexerQueryResultDeduplicator,
+    deduplicate_indexer_query_results,
+    get_info_hash,
+)
+
+INFO_HASH = "C12FE1C06BBA254A9DC9F519B335AA7C1367A88A"
+
+
+def make_result(
+    title: str = "Show.S01E01.1080p.WEB-DL-GROUP",
+    download_url: str = "https://indexer.example/download/1",
+    seeders: int = 10,
+    size: int = 1000,
+    usenet: bool = False,
+) -> IndexerQueryResult:
+    return IndexerQueryResult(
+        title=title,
+        download_url=download_url,
+        seeders=seeders,
+        flags=[],
+        size=size,
+        usenet=usenet,
+        age=0,
+        indexer="test",
+    )
+
+
+@pytest.mark.parametrize(
+    ("download_url", "info_hash"),
+    [
+        (f"magnet:?xt=urn:btih:{INFO_HASH.lower()}&dn=Show", INFO_HASH),
+        ("magnet:?xt=urn:btih:YEX6DQDLXISUVHOJ6UM3GNNKPQJWPKEK&dn=Show", INFO_HASH),
+        ("magnet:?dn=Show", None),
+        (f"https://indexer.example/download?xt=urn:btih:{INFO_HASH}", None),
+    ],
+)
+def test_get_info_hash(download_url: str, info_hash: str | None):
+    assert get_info_hash(download_url) == info_hash
+
+
+def test_deduplicate_keeps_the_copy_with_the_most_seeders():
+    first = make_result(seeders=5)
+    best = make_result(title="show s01e01 1080p web dl group", seeders=50)
+    other = make_result(title="Other.Show.S01E01.1080p.WEB-DL-GROUP")
+
+    assert deduplicate_indexer_query_results([first, other, best]) == [best, other]
+
+
+def test_deduplicate_matches_the_info_hash_of_magnet_links():
+    magnet = f"magnet:?xt=urn:btih:{INFO_HASH}"
+    first = make_result(title="Show.S01E01", download_url=magnet, size=1000)
+    second = make_result(
+        title="Renamed.By.Another.Tracker", download_url=magnet.lower(), size=1001
+    )
+
+    assert deduplicate_indexer_query_results([first, second]) == [first]
+
+
+def test_deduplicate_keeps_different_sizes_and_usenet_apart():
+    results = [
+        make_result(),
+        make_result(size=2000),
+        make_result(usenet=True),
+    ]
+
+    assert deduplicate_indexer_query_results(results) == results
+
+
+def test_deduplicator_reports_new_releases_as_they_arrive():
+    deduplicator = IndexerQueryResultDeduplicator()
+    first = make_result(seeders=5)
+    other = make_result(title="Other.Show.S01E01.1080p.WEB-DL-GROUP")
+    best = make_result(seeders=50)
+
+    assert deduplicator.add(first)
+    assert deduplicator.add(other)
+    assert not deduplicator.add(best)
+    assert not deduplicator.add(make_result(seeders=1))
+
+    # the best copy takes the position of the first one
+    assert deduplicator.results == [best, other]
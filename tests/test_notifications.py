@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from media_manager.notification.models import Notification as NotificationModel
+from media_manager.notification.repository import NotificationRepository
+from media_manager.notification.schemas import Notification, NotificationCursor
+from media_manager.notification.service import NotificationService
+
+
+def test_cursor_round_trip():
+    cursor = NotificationCursor(
+        timestamp=datetime(2025, 1, 2, 3, 4, 5), id=uuid.uuid4()
+    )
+
+    encoded = cursor.encode()
+
+    # the cursor is passed as a query parameter
+    assert encoded.rstrip("=").replace("-", "").replace("_", "").isalnum()
+    assert NotificationCursor.decode(encoded) == cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        # "not json"
+        "bm90IGpzb24=",
+        # {"id": 1}
+        "eyJpZCI6IDF9",
+    ],
+)
+def test_invalid_cursor(cursor: str):
+    with pytest.raises(ValueError):
+        NotificationCursor.decode(cursor)
+
+
+def test_pages_contain_every_notification_once(db: Session):
+    db.execute(delete(NotificationModel))
+    repository = NotificationRepository(db=db)
+    now = datetime.now()
+    # notifications sharing a timestamp are ordered by their ID
+    notifications = [
+        Notification(message=f"Notification {i}", timestamp=now - timedelta(i // 2))
+        for i in range(7)
+    ]
+    for notification in notifications:
+        repository.save_notification(notification)
+    service = NotificationService(notification_repository=repository)
+
+    pages = [service.get_notifications(limit=3)]
+    while pages[-1].next_cursor is not None:
+        pages.append(
+            service.get_notifications(
+                limit=3, cursor=NotificationCursor.decode(pages[-1].next_cursor)
+            )
+        )
+
+    assert [len(page.notifications) for page in pages] == [3, 3, 1]
+    assert [n.id for page in pages for n in page.notifications] == [
+        n.id
+        for n in sorted(notifications, key=lambda n: (n.timestamp, n.id), reverse=True)
+    ]
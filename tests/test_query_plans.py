@@ -0,0 +1,339 @@
+"""
+Checks the query plans of the hot repository lookups against a large synthetic library, so a missing index
+shows up before a release instead of on a user's database. Needs PostgreSQL, see the engine fixture.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterator
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from media_manager.movies.models import Movie, MovieFile
+from media_manager.movies.repository import MovieRepository
+from media_manager.notification.models import Notification
+from media_manager.notification.repository import NotificationRepository
+from media_manager.torrent.models import Torrent
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.schemas import Quality, TorrentStatus
+from media_manager.tv.models import Episode, Season, SeasonFile, SeasonRequest, Show
+from media_manager.tv.repository import TvRepository
+
+SHOWS = 2000
+
+SEASONS_PER_SHOW = 5
+EPISODES_PER_SEASON = 10
+# every n-th show is still running
+RUNNING_SHOWS_EVERY = 20
+MOVIES_PER_SHOW = 1
+NOTIFICATIONS_PER_SHOW = 10
+
+# tables this small are scanned sequentially even with an index
+MIN_ROWS = 1000
+# lookups that load a share of a table large enough for a hash join over a sequential scan to be the better plan
+ALLOWED_SEQ_SCANS = {
+    "TvRepository.get_shows(ended=False)": {"season", "episode"},
+}
+
+
+def seed(db: Session, shows: int) -> dict[str, Any]:
+    """
+    Inserts the synthetic library.
+
+    :return: Some IDs to look up and the number of rows per table.
+    """
+    show_rows, season_rows, episode_rows, torrent_rows = [], [], [], []
+    season_file_rows, season_request_rows = [], []
+    for i in range(shows):
+        show_id = uuid.uuid4()
+        show_rows.append(
+            {
+                "id": show_id,
+                "external_id": i,
+                "metadata_provider": "query-plans",
+                "name": f"Show {i}",
+                "overview": "",
+                "year": 2000 + i % 25,
+                "ended": i % RUNNING_SHOWS_EVERY != 0,
+            }
+        )
+        for number in range(1, SEASONS_PER_SHOW + 1):
+            season_id, torrent_id = uuid.uuid4(), uuid.uuid4()
+            season_rows.append(
+                {
+                    "id": season_id,
+                    "show_id": show_id,
+                    "number": number,
+                    "external_id": number,
+                    "name": f"Season {number}",
+                    "overview": "",
+                }
+            )
+            episode_rows.extend(
+                {
+                    "id": uuid.uuid4(),
+                    "season_id": season_id,
+                    "number": episode,
+                    "external_id": episode,
+                    "title": f"Episode {episode}",
+                }
+                for episode in range(1, EPISODES_PER_SEASON + 1)
+            )
+            torrent_rows.append(make_torrent(torrent_id, f"Show {i} S{number:02}"))
+            season_file_rows.append(
+                {
+                    "season_id": season_id,
+                    "torrent_id": torrent_id,
+                    "file_path_suffix": "",
+                    "quality": Quality.fullhd,
+                }
+            )
+            if number == SEASONS_PER_SHOW:
+                season_request_rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "season_id": season_id,
+                        "wanted_quality": Quality.uhd,
+                        "min_quality": Quality.sd,
+                        "authorized": False,
+                    }
+                )
+
+    movie_rows, movie_file_rows = [], []
+    for i in range(shows * MOVIES_PER_SHOW):
+        movie_id, torrent_id = uuid.uuid4(), uuid.uuid4()
+        movie_rows.append(
+            {
+                "id": movie_id,
+                "external_id": i,
+                "metadata_provider": "query-plans",
+                "name": f"Movie {i}",
+                "overview": "",
+                "year": 2000 + i % 25,
+            }
+        )
+        torrent_rows.append(make_torrent(torrent_id, f"Movie {i}"))
+        movie_file_rows.append(
+            {
+                "movie_id": movie_id,
+                "torrent_id": torrent_id,
+                "file_path_suffix": "",
+                "quality": Quality.fullhd,
+            }
+        )
+
+    now = datetime.now()
+    notification_rows = [
+        {
+            "id": uuid.uuid4(),
+            "message": f"Notification {i}",
+            # only the most recent notifications are still unread
+            "read": i > 50,
+            "timestamp": now - timedelta(minutes=i),
+        }
+        for i in range(shows * NOTIFICATIONS_PER_SHOW)
+    ]
+
+    tables = [
+        (Show, show_rows),
+        (Season, season_rows),
+        (Episode, episode_rows),
+        (Torrent, torrent_rows),
+        (SeasonFile, season_file_rows),
+        (SeasonRequest, season_request_rows),
+        (Movie, movie_rows),
+        (MovieFile, movie_file_rows),
+        (Notification, notification_rows),
+    ]
+    for model, rows in tables:
+        db.execute(insert(model), rows)
+    for model, _ in tables:
+        db.execute(text(f'ANALYZE "{model.__tablename__}"'))
+    return {
+        "show_id": show_rows[-1]["id"],
+        "season_id": season_rows[-1]["id"],
+        "show_torrent_id": season_file_rows[-1]["torrent_id"],
+        "movie_id": movie_rows[-1]["id"],
+        "movie_torrent_id": movie_file_rows[-1]["torrent_id"],
+        "rows": {model.__tablename__: len(rows) for model, rows in tables},
+    }
+
+
+def make_torrent(torrent_id: uuid.UUID, title: str) -> dict[str, Any]:
+    return {
+        "id": torrent_id,
+        "status": TorrentStatus.finished,
+        "title": title,
+        "quality": Quality.fullhd,
+        "imported": True,
+        "hash": uuid.uuid4().hex,
+        "usenet": False,
+    }
+
+
+def get_lookups(db: Session, ids: dict[str, Any]) -> dict[str, Callable[[], Any]]:
+    tv_repository = TvRepository(db=db)
+    movie_repository = MovieRepository(db=db)
+    torrent_repository = TorrentRepository(db=db)
+    notification_repository = NotificationRepository(db=db)
+    return {
+        "TvRepository.get_show_by_id": lambda: tv_repository.get_show_by_id(
+            show_id=ids["show_id"]
+        ),
+        "TvRepository.get_shows(ended=False)": lambda: tv_repository.get_shows(
+            ended=False
+        ),
+        "TvRepository.get_show_by_season_id": lambda: (
+            tv_repository.get_show_by_season_id(season_id=ids["season_id"])
+        ),
+        "TvRepository.get_torrents_by_show_id": lambda: (
+            tv_repository.get_torrents_by_show_id(show_id=ids["show_id"])
+        ),
+        "TvRepository.get_seasons_by_torrent_id": lambda: (
+            tv_repository.get_seasons_by_torrent_id(torrent_id=ids["show_torrent_id"])
+        ),
+        "TvRepository.get_season_files_by_season_id": lambda: (
+            tv_repository.get_season_files_by_season_id(season_id=ids["season_id"])
+        ),
+        "TorrentRepository.get_seasons_files_of_torrent": lambda: (
+            torrent_repository.get_seasons_files_of_torrent(
+                torrent_id=ids["show_torrent_id"]
+            )
+        ),
+        "TorrentRepository.get_show_of_torrent": lambda: (
+            torrent_repository.get_show_of_torrent(torrent_id=ids["show_torrent_id"])
+        ),
+        "TorrentRepository.get_movie_of_torrent": lambda: (
+            torrent_repository.get_movie_of_torrent(torrent_id=ids["movie_torrent_id"])
+        ),
+        "TorrentRepository.get_movie_files_of_torrent": lambda: (
+            torrent_repository.get_movie_files_of_torrent(
+                torrent_id=ids["movie_torrent_id"]
+            )
+        ),
+        "MovieRepository.get_movie_by_id": lambda: movie_repository.get_movie_by_id(
+            movie_id=ids["movie_id"]
+        ),
+        "MovieRepository.get_movie_files_by_movie_id": lambda: (
+            movie_repository.get_movie_files_by_movie_id(movie_id=ids["movie_id"])
+        ),
+        "MovieRepository.get_torrents_by_movie_id": lambda: (
+            movie_repository.get_torrents_by_movie_id(movie_id=ids["movie_id"])
+        ),
+        "MovieRepository.get_movie_by_torrent_id": lambda: (
+            movie_repository.get_movie_by_torrent_id(torrent_id=ids["movie_torrent_id"])
+        ),
+        "NotificationRepository.get_notifications(read=False)": lambda: (
+            notification_repository.get_notifications(read=False, limit=50)
+        ),
+        "NotificationRepository.count_unread_notifications": notification_repository.count_unread_notifications,
+    }
+
+
+def find_seq_scans(plan: dict[str, Any]) -> list[str]:
+    """
+    :return: The tables the plan scans sequentially.
+    """
+    tables = []
+    if plan["Node Type"] == "Seq Scan":
+        tables.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        tables.extend(find_seq_scans(child))
+    return tables
+
+
+def find_index_scans(plan: dict[str, Any]) -> list[str]:
+    """
+    :return: The indexes the plan scans.
+    """
+    indexes = [plan["Index Name"]] if "Index Name" in plan else []
+    for child in plan.get("Plans", []):
+        indexes.extend(find_index_scans(child))
+    return indexes
+
+
+@pytest.fixture(scope="module")
+def library(connection: Connection) -> Iterator[tuple[Session, dict[str, Any]]]:
+    db = Session(
+        bind=connection, autoflush=False, join_transaction_mode="create_savepoint"
+    )
+    ids = seed(db=db, shows=SHOWS)
+    yield db, ids
+    db.close()
+
+
+def explain(connection: Connection, lookup: Callable[[], Any]) -> list[dict[str, Any]]:
+    """
+    :return: The plans of the SELECTs the lookup sends.
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        lookup()
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    plans = []
+    for statement, parameters in statements:
+        result = connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        ).scalar_one()
+        plans.append(
+            (json.loads(result) if isinstance(result, str) else result)[0]["Plan"]
+        )
+    return plans
+
+
+LOOKUPS = [
+    "TvRepository.get_show_by_id",
+    "TvRepository.get_shows(ended=False)",
+    "TvRepository.get_show_by_season_id",
+    "TvRepository.get_torrents_by_show_id",
+    "TvRepository.get_seasons_by_torrent_id",
+    "TvRepository.get_season_files_by_season_id",
+    "TorrentRepository.get_seasons_files_of_torrent",
+    "TorrentRepository.get_show_of_torrent",
+    "TorrentRepository.get_movie_of_torrent",
+    "TorrentRepository.get_movie_files_of_torrent",
+    "MovieRepository.get_movie_by_id",
+    "MovieRepository.get_movie_files_by_movie_id",
+    "MovieRepository.get_torrents_by_movie_id",
+    "MovieRepository.get_movie_by_torrent_id",
+    "NotificationRepository.get_notifications(read=False)",
+    "NotificationRepository.count_unread_notifications",
+]
+
+
+@pytest.mark.parametrize("name", LOOKUPS)
+def test_lookup_avoids_sequential_scans(library, connection: Connection, name: str):
+    db, ids = library
+    large_tables = {table for table, rows in ids["rows"].items() if rows >= MIN_ROWS}
+    plans = explain(connection, get_lookups(db=db, ids=ids)[name])
+    assert plans
+    seq_scans = {table for plan in plans for table in find_seq_scans(plan)}
+    assert not seq_scans & large_tables - ALLOWED_SEQ_SCANS.get(name, set())
+
+
+@pytest.mark.parametrize(
+    ("name", "index"),
+    [
+        ("TvRepository.get_shows(ended=False)", "ix_show_not_ended"),
+        ("TorrentRepository.get_seasons_files_of_torrent", "ix_season_file_torrent_id"),
+        ("TvRepository.get_seasons_by_torrent_id", "ix_season_file_torrent_id"),
+        ("TorrentRepository.get_movie_files_of_torrent", "ix_movie_file_torrent_id"),
+        ("MovieRepository.get_movie_by_torrent_id", "ix_movie_file_torrent_id"),
+    ],
+)
+def test_lookup_uses_index(library, connection: Connection, name: str, index: str):
+    db, ids = library
+    plans = explain(connection, get_lookups(db=db, ids=ids)[name])
+    assert index in {index for plan in plans for index in find_index_scans(plan)}
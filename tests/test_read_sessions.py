@@ -0,0 +1,74 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from media_manager.movies.schemas import MovieFile
+from media_manager.movies.service import MovieService
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.schemas import Quality, Torrent, TorrentStatus
+from media_manager.torrent.service import TorrentService
+from media_manager.tv.schemas import SeasonFile
+from media_manager.tv.service import TvService
+
+
+class DownloadingManager:
+    def get_torrent_status(self, torrent: Torrent) -> TorrentStatus:
+        return TorrentStatus.downloading
+
+
+@pytest.fixture
+def torrent_service(db: Session) -> TorrentService:
+    return TorrentService(
+        torrent_repository=TorrentRepository(db=db),
+        download_manager=DownloadingManager(),
+    )
+
+
+@pytest.fixture
+def torrent(db: Session, torrent_service: TorrentService) -> Torrent:
+    torrent = torrent_service.torrent_repository.save_torrent(
+        Torrent(
+            status=TorrentStatus.finished,
+            title="Show.S01.1080p",
+            quality=Quality.fullhd,
+            imported=True,
+            hash=uuid.uuid4().hex,
+        )
+    )
+    # like the transactions of read sessions
+    db.execute(text("SET TRANSACTION READ ONLY"))
+    return torrent
+
+
+def test_checks_season_files_without_writing(
+    torrent_service: TorrentService, torrent: Torrent
+):
+    tv_service = TvService(
+        tv_repository=None, torrent_service=torrent_service, indexer_service=None
+    )
+    season_file = SeasonFile(
+        season_id=uuid.uuid4(),
+        quality=Quality.fullhd,
+        torrent_id=torrent.id,
+        file_path_suffix="",
+    )
+
+    assert tv_service.season_file_exists_on_file(season_file=season_file)
+
+
+def test_checks_movie_files_without_writing(
+    torrent_service: TorrentService, torrent: Torrent
+):
+    movie_service = MovieService(
+        movie_repository=None, torrent_service=torrent_service, indexer_service=None
+    )
+    movie_file = MovieFile(
+        movie_id=uuid.uuid4(),
+        quality=Quality.fullhd,
+        torrent_id=torrent.id,
+        file_path_suffix="",
+    )
+
+    assert movie_service.movie_file_exists_on_file(movie_file=movie_file)
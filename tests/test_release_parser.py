@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from media_manager.indexer.release_parser import (
+    parse_many,
+    parse_release,
+    parse_subtitle_language,
+)
+
+# every entry contains a title and the fields that are expected to be parsed from it, fields that are left out
+# aren't checked
+CORPUS = json.loads(
+    (Path(__file__).parent / "data" / "release_titles.json").read_text()
+)
+
+
+@pytest.mark.parametrize("entry", CORPUS, ids=[entry["title"] for entry in CORPUS])
+def test_parse_release(entry: dict):
+    release = parse_release(entry["title"])
+    actual = {field: getattr(release, field) for field in entry.keys() - {"title"}}
+    if "quality" in actual:
+        actual["quality"] = actual["quality"].name
+    expected = {field: value for field, value in entry.items() if field != "title"}
+    assert actual == expected
+
+
+def test_parse_release_strips_the_file_extension():
+    release = parse_release("Show.Name.S01E02.720p.HDTV.x264-GROUP.mkv")
+    assert release.group == "GROUP"
+    assert release.episodes == [2]
+
+
+def test_parse_many_keeps_the_order():
+    titles = [entry["title"] for entry in CORPUS]
+    assert parse_many(titles + titles[:1]) == [
+        parse_release(title) for title in titles + titles[:1]
+    ]
+
+
+@pytest.mark.parametrize(
+    ("file_name", "language"),
+    [
+        ("Show.S01E01.en.srt", "en"),
+        ("Show.S01E01.DE.srt", "de"),
+        ("Show.S01E01.srt", None),
+    ],
+)
+def test_parse_subtitle_language(file_name: str, language: str | None):
+    assert parse_subtitle_language(file_name) == language
@@ -0,0 +1,181 @@
+import itertools
+
+import pytest
+
+from media_manager.indexer.config import (
+    IndexerConfig,
+    IndexerFlagScoringRule,
+    ScoringRuleSet,
+    TitleScoringRule,
+)
+from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.indexer.scoring import ScoringEngine
+
+CONFIG = IndexerConfig(
+    title_scoring_rules=[
+        # overlapping keywords: "x264" contains "x26" and "264", "hdr10" contains "hdr"
+        TitleScoringRule(name="x26", keywords=["x26"], score_modifier=1),
+        TitleScoringRule(name="264", keywords=["264"], score_modifier=2),
+        TitleScoringRule(name="x264", keywords=["X264"], score_modifier=4),
+        TitleScoringRule(name="hdr", keywords=["HDR"], score_modifier=8),
+        TitleScoringRule(
+            name="hdr10", keywords=["hdr10", "Dolby Vision"], score_modifier=16
+        ),
+        # "ab" and "bc" overlap in "abc", "bcd" starts inside "abc" and ends after it
+        TitleScoringRule(name="abc", keywords=["abc"], score_modifier=32),
+        TitleScoringRule(name="bcd", keywords=["bcd"], score_modifier=64),
+        TitleScoringRule(name="ab", keywords=["AB", "bc"], score_modifier=128),
+        TitleScoringRule(
+            name="require_group",
+            keywords=["NTB", "flux"],
+            score_modifier=-256,
+            negate=True,
+        ),
+        # rules can share a name
+        TitleScoringRule(name="cam", keywords=["cam"], score_modifier=-512),
+        TitleScoringRule(name="cam", keywords=["ts"], score_modifier=-1024),
+        TitleScoringRule(name="anything", keywords=[""], score_modifier=2048),
+        TitleScoringRule(
+            name="nothing", keywords=[""], score_modifier=4096, negate=True
+        ),
+    ],
+    indexer_flag_scoring_rules=[
+        IndexerFlagScoringRule(
+            name="freeleech",
+            flags=["freeleech", "freeleech75"],
+            score_modifier=-8192,
+            negate=True,
+        ),
+        IndexerFlagScoringRule(name="nuked", flags=["nuked"], score_modifier=-16384),
+    ],
+    scoring_rule_sets=[
+        ScoringRuleSet(
+            name="tv",
+            libraries=["ALL_TV"],
+            rule_names=["x26", "264", "x264", "hdr", "hdr10", "cam", "freeleech"],
+        ),
+        ScoringRuleSet(
+            name="movies",
+            libraries=["ALL_MOVIES", "Anime"],
+            rule_names=["abc", "bcd", "ab", "require_group", "nuked", "unknown"],
+        ),
+        ScoringRuleSet(
+            name="anime",
+            libraries=["Anime"],
+            rule_names=["anything", "nothing", "x264", "x264"],
+        ),
+    ],
+)
+
+TITLES = [
+    "Show.S01E01.1080p.x264-NTB",
+    "show.s01e01.2160p.X265.HDR10-flux",
+    "Show.S01E01.HDR.Dolby.Vision-GROUP",
+    "Show.S01E01.DOLBY VISION.x26.264",
+    "Movie.2024.ABCD.CAM",
+    "Movie.2024.abc.TS-Flux",
+    "Movie.2024.BCD",
+    "",
+]
+FLAGS = [[], ["freeleech"], ["freeleech75", "nuked"], ["internal"]]
+
+
+def make_result(title: str, flags: list[str]) -> IndexerQueryResult:
+    return IndexerQueryResult(
+        title=title,
+        download_url="https://indexer.example/download/1",
+        seeders=10,
+        flags=flags,
+        size=1000,
+        usenet=False,
+        age=0,
+        indexer="test",
+    )
+
+
+def score_per_rule(result: IndexerQueryResult, library: str, is_tv: bool) -> int:
+    """
+    The previous scoring, which evaluated every rule of every matching ruleset on its own.
+    """
+    score = 0
+    for ruleset in CONFIG.scoring_rule_sets:
+        if not (
+            library in ruleset.libraries
+            or ("ALL_TV" in ruleset.libraries and is_tv)
+            or ("ALL_MOVIES" in ruleset.libraries and not is_tv)
+        ):
+            continue
+        for rule_name in ruleset.rule_names:
+            for rule in CONFIG.title_scoring_rules:
+                if rule.name == rule_name:
+                    matched = any(
+                        keyword.lower() in result.title.lower()
+                        for keyword in rule.keywords
+                    )
+                    if matched != rule.negate:
+                        score += rule.score_modifier
+            for rule in CONFIG.indexer_flag_scoring_rules:
+                if rule.name == rule_name:
+                    matched = any(flag in result.flags for flag in rule.flags)
+                    if matched != rule.negate:
+                        score += rule.score_modifier
+    return score
+
+
+@pytest.mark.parametrize(
+    ("library", "is_tv"), [("", True), ("", False), ("Anime", True), ("Anime", False)]
+)
+def test_scores_like_the_per_rule_evaluation(library: str, is_tv: bool):
+    engine = ScoringEngine(config=CONFIG)
+    results = [
+        make_result(title=title, flags=flags)
+        for title, flags in itertools.product(TITLES, FLAGS)
+    ]
+
+    engine.score(query_results=results, library=library, is_tv=is_tv)
+
+    assert [result.score for result in results] == [
+        score_per_rule(make_result(result.title, result.flags), library, is_tv)
+        for result in results
+    ]
+
+
+@pytest.mark.parametrize(
+    ("title", "keywords"),
+    [
+        ("x264", {"x26", "264", "x264"}),
+        ("X26.4", {"x26"}),
+        ("hdr10", {"hdr", "hdr10"}),
+        ("ABCD", {"abc", "bcd", "ab", "bc"}),
+        ("a.bcd", {"bcd", "bc"}),
+        ("dolby vision", {"dolby vision"}),
+        ("Dolby.Vision", set()),
+    ],
+)
+def test_matching_keywords(title: str, keywords: set[str]):
+    engine = ScoringEngine(config=CONFIG)
+    keyword_ids = {
+        keyword: keyword_id
+        for keyword_id, keyword in enumerate(
+            dict.fromkeys(
+                keyword.lower()
+                for rule in CONFIG.title_scoring_rules
+                for keyword in rule.keywords
+                if keyword
+            )
+        )
+    }
+
+    assert engine.matching_keyword_ids(title) == {
+        keyword_ids[keyword] for keyword in keywords
+    }
+
+
+def test_adds_to_the_existing_score():
+    engine = ScoringEngine(config=CONFIG)
+    result = make_result(title="Show.S01E01.x264", flags=["freeleech"])
+    result.score = 5
+
+    engine.score(query_results=[result], library="", is_tv=True)
+
+    assert result.score == 5 + 1 + 2 + 4
@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from media_manager.indexer.config import TorznabConfig
+from media_manager.indexer.indexers import torznab
+from media_manager.indexer.indexers.torznab import Torznab
+
+CAPS = (
+    b'<caps><searching><search available="yes" supportedParams="q"/>'
+    b'<tv-search available="yes" supportedParams="q,season,ep"/></searching></caps>'
+)
+
+
+class Response:
+    content = CAPS
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def capabilities(monkeypatch) -> None:
+    monkeypatch.setattr(torznab, "_capabilities", {})
+    monkeypatch.setattr(torznab, "_capabilities_locks", {})
+
+
+def test_caches_the_capabilities(monkeypatch):
+    requests = []
+    monkeypatch.setattr(
+        torznab.requests,
+        "get",
+        lambda url, **kwargs: requests.append(url) or Response(),
+    )
+    indexer = Torznab(TorznabConfig(name="fast", url="https://fast.example"))
+
+    assert indexer.get_capabilities().supports("tv-search", "season")
+    assert indexer.get_capabilities() is indexer.get_capabilities()
+    assert requests == ["https://fast.example/api"]
+
+
+def test_a_slow_endpoint_does_not_hold_up_the_others(monkeypatch):
+    slow_requested, fast_done = threading.Event(), threading.Event()
+    fast_done_during_slow_request = []
+
+    def get(url, **kwargs):
+        if url == "https://slow.example/api":
+            slow_requested.set()
+            fast_done_during_slow_request.append(fast_done.wait(timeout=5))
+        return Response()
+
+    monkeypatch.setattr(torznab.requests, "get", get)
+    slow = Torznab(TorznabConfig(name="slow", url="https://slow.example"))
+    fast = Torznab(TorznabConfig(name="fast", url="https://fast.example"))
+    thread = threading.Thread(target=slow.get_capabilities)
+    thread.start()
+    assert slow_requested.wait(timeout=5)
+
+    assert fast.get_capabilities() is not None
+    fast_done.set()
+    thread.join()
+
+    assert fast_done_during_slow_request == [True]
@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from media_manager.database import unit_of_work
+from media_manager.notification.models import Notification
+
+
+def add(db: Session, message: str) -> None:
+    db.add(
+        Notification(
+            id=uuid.uuid4(), message=message, read=False, timestamp=datetime.now()
+        )
+    )
+    db.flush()
+
+
+def messages(db: Session) -> set[str]:
+    return set(
+        db.scalars(
+            select(Notification.message).where(Notification.message.like("uow %"))
+        )
+    )
+
+
+def test_commits_at_the_end_of_the_block(db: Session):
+    with unit_of_work(db):
+        add(db, "uow committed")
+        assert db.in_transaction()
+
+    assert not db.in_transaction()
+    assert messages(db) == {"uow committed"}
+
+
+def test_rolls_back_if_the_block_raises(db: Session):
+    with pytest.raises(ValueError), unit_of_work(db):
+        add(db, "uow rolled back")
+        raise ValueError
+
+    assert messages(db) == set()
+
+
+def test_nested_block_only_undoes_its_own_changes(db: Session):
+    with unit_of_work(db):
+        add(db, "uow outer")
+        with pytest.raises(ValueError), unit_of_work(db):
+            add(db, "uow inner")
+            raise ValueError
+        with unit_of_work(db):
+            add(db, "uow second inner")
+        # savepoints don't commit the outer unit of work
+        assert db.in_transaction()
+
+    assert messages(db) == {"uow outer", "uow second inner"}
+    assert db.info["unit_of_work_depth"] == 0